@@ -1,5 +1,11 @@
+from typing import Optional
+
 from fastapi import Depends
 from app.core.config import get_settings
+from app.services.container import ServiceContainer, get_service_container
+from app.services.job_service import JobService
+from app.services.job_store import JobStore, get_job_store
+from app.services.search_tasks import SearchTaskQueue
 
 def get_api_key(settings: dict = Depends(get_settings)):
     return settings.API_KEY
@@ -7,6 +13,16 @@ def get_api_key(settings: dict = Depends(get_settings)):
 def get_user_agent(settings: dict = Depends(get_settings)):
     return settings.USER_AGENT
 
-def get_db():
-    # Placeholder for database dependency
-    pass
\ No newline at end of file
+def get_db() -> Optional[JobStore]:
+    # Shared job store, or None when JOB_STORE_ENABLED is off
+    return get_job_store()
+
+def get_services() -> ServiceContainer:
+    # App-lifetime services, built once and warmed up at startup
+    return get_service_container()
+
+def get_job_service(services: ServiceContainer = Depends(get_services)) -> JobService:
+    return services.job_service
+
+def get_search_tasks(services: ServiceContainer = Depends(get_services)) -> SearchTaskQueue:
+    return services.search_tasks
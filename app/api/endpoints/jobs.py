@@ -1,8 +1,20 @@
+import json
+import logging
+
 from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Dict
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Dict
 
-from app.schemas.job import JobSearchRequest, JobSearchResponse
+from app.api.dependencies import get_job_service, get_search_tasks
+from app.core.config import settings
+from app.schemas.job import (
+    JobBatchSearchRequest, JobBatchSearchResponse, JobSearchRequest, JobSearchResponse, JobResponse,
+    SearchTaskStatus, SearchTaskSubmitted
+)
 from app.services.job_service import JobService
+from app.services.precrawl import get_precrawl_scheduler
+from app.services.metrics import time_stage
+from app.services.search_tasks import SearchQueueFull, SearchTaskQueue
 
 router = APIRouter(
     prefix="/jobs",
@@ -10,13 +22,16 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+logger = logging.getLogger(__name__)
+
 @router.post("/search", response_model=JobSearchResponse, summary="Search for jobs")
-async def search_jobs(request: JobSearchRequest):
+async def search_jobs(request: JobSearchRequest, job_service: JobService = Depends(get_job_service)):
     """
     Search for jobs across multiple platforms based on the provided criteria.
     
-    This endpoint scrapes job listings from LinkedIn, Indeed, and Glassdoor,
-    then uses LLM to filter the results for relevance to the search criteria.
+    This endpoint gathers job listings from LinkedIn, Indeed, and Glassdoor
+    (from the local job store when it is fresh for the query, otherwise by
+    scraping), then uses LLM to filter the results for relevance to the search criteria.
     
     ## Parameters:
     - **position**: Job title or position
@@ -25,19 +40,119 @@ async def search_jobs(request: JobSearchRequest):
     - **jobNature** (optional): Type of job (onsite, remote, hybrid)
     - **location** (optional): Job location
     - **skills**: Required skills separated by commas
+    - **time_budget** (optional): Seconds the search may take (defaults to SEARCH_TIME_BUDGET)
+    
+    ## Returns:
+    A list of relevant job listings with details, and the status of each source;
+    sources that timed out or were skipped contribute only stored results
+    """
+    try:
+        get_precrawl_scheduler().record(request)
+        relevant_jobs, source_status = await job_service.search(request)
+        with time_stage("serialize"):
+            return JobSearchResponse(relevant_jobs=relevant_jobs, source_status=source_status)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching for jobs: {str(e)}")
+
+@router.post("/search/batch", response_model=JobBatchSearchResponse, summary="Run several job searches at once")
+async def search_jobs_batch(batch: JobBatchSearchRequest, job_service: JobService = Depends(get_job_service)):
+    """
+    Run several searches (e.g. a user's saved searches) in one request.
+    
+    Searches with the same position and location share their scrapes, so each
+    distinct query is fetched once per source; the candidates are then filtered
+    against every search's own criteria in one pass.
+    
+    ## Parameters:
+    - **searches**: List of search criteria, as for POST /search (at most BATCH_SEARCH_MAX_REQUESTS)
+    - **time_budget** (optional): Seconds the whole batch may take
     
     ## Returns:
-    A list of relevant job listings with details
+    One result (relevant jobs and source status) per search, in request order
     """
     try:
-        job_service = JobService()
-        relevant_jobs = await job_service.find_jobs(request)
-        return JobSearchResponse(relevant_jobs=relevant_jobs)
+        for request in batch.searches:
+            get_precrawl_scheduler().record(request)
+        results = await job_service.search_many(batch.searches, time_budget=batch.time_budget)
+        with time_stage("serialize"):
+            return JobBatchSearchResponse(results=[
+                JobSearchResponse(relevant_jobs=relevant_jobs, source_status=source_status)
+                for relevant_jobs, source_status in results
+            ])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching for jobs: {str(e)}")
 
+@router.post(
+    "/search/async", response_model=SearchTaskSubmitted, status_code=202, summary="Queue a job search"
+)
+async def submit_search(request: JobSearchRequest, search_tasks: SearchTaskQueue = Depends(get_search_tasks)):
+    """
+    Queue a search and return its task ID immediately.
+    
+    The search runs on a background worker; poll GET /search/{task_id} for
+    per-source progress and, once done, the results. Responds 503 when
+    SEARCH_TASK_QUEUE_SIZE searches are already waiting.
+    
+    ## Parameters:
+    Same search criteria as POST /search
+    """
+    try:
+        task = search_tasks.submit(request)
+    except SearchQueueFull as e:
+        raise HTTPException(status_code=503, detail=f"Search queue is full: {str(e)}")
+    get_precrawl_scheduler().record(request)
+    return SearchTaskSubmitted(
+        task_id=task.id, status=task.status, status_url=f"{settings.API_V1_STR}{router.prefix}/search/{task.id}"
+    )
+
+@router.get("/search/{task_id}", response_model=SearchTaskStatus, summary="Check on a queued job search")
+async def get_search(task_id: str, search_tasks: SearchTaskQueue = Depends(get_search_tasks)):
+    """
+    Status of a search queued with POST /search/async.
+    
+    ## Returns:
+    - **status**: queued, running, done or failed
+    - **sources**: each source's progress (pending, then ok, cached, timeout, error or skipped)
+    - **result**: relevant jobs and source status once the search is done
+    
+    Results are kept for SEARCH_TASK_TTL seconds after the search finishes;
+    unknown or expired task IDs get a 404.
+    """
+    task = search_tasks.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Search task {task_id} not found or expired")
+    return SearchTaskStatus(**task.to_dict())
+
+@router.post("/search/stream", summary="Search for jobs, streaming results per source")
+async def search_jobs_stream(request: JobSearchRequest, job_service: JobService = Depends(get_job_service)):
+    """
+    Streaming variant of POST /search.
+    
+    Returns newline-delimited JSON (application/x-ndjson). Each source's relevant
+    jobs are sent as soon as that source has been scraped and filtered, so the
+    first results arrive after the fastest source instead of the slowest.
+    
+    ## Events (one JSON object per line):
+    - **jobs**: `{"event": "jobs", "source": ..., "status": ..., "jobs": [...], "elapsed_ms": ...}`
+    - **summary**: `{"event": "summary", "total_jobs": ..., "relevant_jobs": ..., "sources": {...}, "elapsed_ms": ...}`
+    - **error**: `{"event": "error", "detail": ...}` if the search fails part way
+    """
+    get_precrawl_scheduler().record(request)
+    
+    async def ndjson_events() -> AsyncIterator[str]:
+        try:
+            async for event in job_service.stream_jobs(request):
+                if event["event"] == "jobs":
+                    event["jobs"] = [JobResponse(**job).dict() for job in event["jobs"]]
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            logger.error(f"Error streaming job search: {str(e)}")
+            yield json.dumps({"event": "error", "detail": f"Error searching for jobs: {str(e)}"}) + "\n"
+    
+    return StreamingResponse(ndjson_events(), media_type="application/x-ndjson")
+
 @router.get("/", response_model=JobSearchResponse)
-async def get_jobs(query: str, location: str = None):
+async def get_jobs(query: str, location: str = None, job_service: JobService = Depends(get_job_service)):
     """
     Legacy endpoint for fetching jobs based on query and location.
     Use POST /search for more advanced filtering.
@@ -50,9 +165,8 @@ async def get_jobs(query: str, location: str = None):
             location=location,
             skills=query
         )
-        # Create a service instance here instead of using global variable
-        job_service = JobService()
-        relevant_jobs = await job_service.find_jobs(request)
-        return JobSearchResponse(relevant_jobs=relevant_jobs)
+        relevant_jobs, source_status = await job_service.search(request)
+        with time_stage("serialize"):
+            return JobSearchResponse(relevant_jobs=relevant_jobs, source_status=source_status)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -21,7 +21,125 @@ class Settings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY", "secret_key")
     DEBUG: bool = os.getenv("DEBUG", "True").lower() == "true"
 
+    # Browser pool settings
+    DRIVER_POOL_SIZE: int = int(os.getenv("DRIVER_POOL_SIZE", "2"))
+    DRIVER_POOL_WARM_SIZE: int = int(os.getenv("DRIVER_POOL_WARM_SIZE", "1"))
+    BROWSER_WARM_UP_ENABLED: bool = os.getenv("BROWSER_WARM_UP_ENABLED", "True").lower() == "true"
+    DRIVER_POOL_ACQUIRE_TIMEOUT: float = float(os.getenv("DRIVER_POOL_ACQUIRE_TIMEOUT", "30"))
+    DRIVER_MAX_PAGES: int = int(os.getenv("DRIVER_MAX_PAGES", "50"))
+    DRIVER_MAX_AGE: int = int(os.getenv("DRIVER_MAX_AGE", "900"))
+    SCRAPER_MAX_WORKERS: int = int(os.getenv("SCRAPER_MAX_WORKERS", "4"))
+
+    # Result depth settings
+    SCRAPER_MAX_RESULTS: int = int(os.getenv("SCRAPER_MAX_RESULTS", "25"))
+    SCRAPER_PAGE_LIMIT: int = int(os.getenv("SCRAPER_PAGE_LIMIT", "10"))
+    SCRAPER_PAGE_CONCURRENCY: int = int(os.getenv("SCRAPER_PAGE_CONCURRENCY", "3"))
+
+    # HTML parsing settings
+    PARSE_PROCESS_WORKERS: int = int(os.getenv("PARSE_PROCESS_WORKERS", "2"))
+    PARSE_PROCESS_MIN_BYTES: int = int(os.getenv("PARSE_PROCESS_MIN_BYTES", "262144"))
+
+    # HTTP fast path settings
+    HTTP_FETCH_ENABLED: bool = os.getenv("HTTP_FETCH_ENABLED", "True").lower() == "true"
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "True").lower() == "true"
+    HTTP_TIMEOUT: float = float(os.getenv("HTTP_TIMEOUT", "10"))
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "6"))
+
+    # LLM relevance filtering settings
+    LLM_MODEL: str = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
+    LLM_BATCH_ENABLED: bool = os.getenv("LLM_BATCH_ENABLED", "True").lower() == "true"
+    LLM_BATCH_TOKEN_BUDGET: int = int(os.getenv("LLM_BATCH_TOKEN_BUDGET", "1500"))
+    LLM_BATCH_MAX_JOBS: int = int(os.getenv("LLM_BATCH_MAX_JOBS", "25"))
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    LLM_REQUESTS_PER_MINUTE: int = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "3500"))
+    LLM_TOKENS_PER_MINUTE: int = int(os.getenv("LLM_TOKENS_PER_MINUTE", "90000"))
+    LLM_TIMEOUT: float = float(os.getenv("LLM_TIMEOUT", "20"))
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", "3"))
+    LLM_BACKOFF_BASE: float = float(os.getenv("LLM_BACKOFF_BASE", "0.5"))
+
+    # LLM verdict cache settings
+    VERDICT_CACHE_ENABLED: bool = os.getenv("VERDICT_CACHE_ENABLED", "True").lower() == "true"
+    VERDICT_CACHE_PATH: str = os.getenv("VERDICT_CACHE_PATH", "data/verdict_cache.sqlite3")
+    VERDICT_CACHE_MEMORY_SIZE: int = int(os.getenv("VERDICT_CACHE_MEMORY_SIZE", "10000"))
+    VERDICT_CACHE_TTL: int = int(os.getenv("VERDICT_CACHE_TTL", "604800"))
+    VERDICT_CACHE_MAX_ROWS: int = int(os.getenv("VERDICT_CACHE_MAX_ROWS", "200000"))
+    VERDICT_CACHE_EVICTION: str = os.getenv("VERDICT_CACHE_EVICTION", "lru")
+
+    # Search result cache settings
+    SEARCH_CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "True").lower() == "true"
+    SEARCH_CACHE_FRESH_SECONDS: int = int(os.getenv("SEARCH_CACHE_FRESH_SECONDS", "300"))
+    SEARCH_CACHE_STALE_SECONDS: int = int(os.getenv("SEARCH_CACHE_STALE_SECONDS", "3600"))
+    SEARCH_CACHE_PARTIAL_FRESH_SECONDS: int = int(os.getenv("SEARCH_CACHE_PARTIAL_FRESH_SECONDS", "60"))
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+
+    # Metrics settings
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"
+
+    # Tracing settings
+    TRACE_ENABLED: bool = os.getenv("TRACE_ENABLED", "True").lower() == "true"
+    TRACE_DEBUG_ENABLED: bool = os.getenv("TRACE_DEBUG_ENABLED", "False").lower() == "true"
+    TRACE_SAMPLE_RATE: float = float(os.getenv("TRACE_SAMPLE_RATE", "0.01"))
+    TRACE_FILE_PATH: str = os.getenv("TRACE_FILE_PATH", "data/traces.json")
+    TRACE_FILE_MAX_BYTES: int = int(os.getenv("TRACE_FILE_MAX_BYTES", "10485760"))
+    TRACE_FILE_BACKUPS: int = int(os.getenv("TRACE_FILE_BACKUPS", "3"))
+
+    # Deadline and circuit breaker settings
+    SEARCH_TIME_BUDGET: float = float(os.getenv("SEARCH_TIME_BUDGET", "20"))
+    SEARCH_SOURCE_TIMEOUT_FRACTION: float = float(os.getenv("SEARCH_SOURCE_TIMEOUT_FRACTION", "0.75"))
+    CIRCUIT_BREAKER_FAILURES: int = int(os.getenv("CIRCUIT_BREAKER_FAILURES", "3"))
+    CIRCUIT_BREAKER_COOLDOWN: float = float(os.getenv("CIRCUIT_BREAKER_COOLDOWN", "120"))
+
+    # Lexical ranking settings
+    RANKING_MIN_SCORE: float = float(os.getenv("RANKING_MIN_SCORE", "0"))
+    RANKING_SKILL_WEIGHT: float = float(os.getenv("RANKING_SKILL_WEIGHT", "0.5"))
+    RANKING_BM25_K1: float = float(os.getenv("RANKING_BM25_K1", "1.2"))
+    RANKING_BM25_B: float = float(os.getenv("RANKING_BM25_B", "0.75"))
+
+    # Filtering cascade settings
+    CASCADE_ENABLED: bool = os.getenv("CASCADE_ENABLED", "True").lower() == "true"
+    CASCADE_ACCEPT_THRESHOLD: float = float(os.getenv("CASCADE_ACCEPT_THRESHOLD", "0.7"))
+    CASCADE_REJECT_THRESHOLD: float = float(os.getenv("CASCADE_REJECT_THRESHOLD", "0.1"))
+    CASCADE_POSITION_WEIGHT: float = float(os.getenv("CASCADE_POSITION_WEIGHT", "0.7"))
+    CASCADE_MISMATCH_PENALTY: float = float(os.getenv("CASCADE_MISMATCH_PENALTY", "0.5"))
+
+    # Batch search settings
+    BATCH_SEARCH_MAX_REQUESTS: int = int(os.getenv("BATCH_SEARCH_MAX_REQUESTS", "20"))
+
+    # Async search task settings
+    SEARCH_TASK_QUEUE_SIZE: int = int(os.getenv("SEARCH_TASK_QUEUE_SIZE", "100"))
+    SEARCH_TASK_WORKERS: int = int(os.getenv("SEARCH_TASK_WORKERS", "4"))
+    SEARCH_TASK_TTL: int = int(os.getenv("SEARCH_TASK_TTL", "900"))
+
+    # Deduplication settings
+    DEDUP_ENABLED: bool = os.getenv("DEDUP_ENABLED", "True").lower() == "true"
+    DEDUP_SIMILARITY: float = float(os.getenv("DEDUP_SIMILARITY", "0.7"))
+
+    # Job store settings
+    JOB_STORE_ENABLED: bool = os.getenv("JOB_STORE_ENABLED", "True").lower() == "true"
+    JOB_STORE_PATH: str = os.getenv("JOB_STORE_PATH", "data/jobs.sqlite3")
+    JOB_STORE_FRESH_SECONDS: float = float(os.getenv("JOB_STORE_FRESH_SECONDS", "1800"))
+    JOB_STORE_SEARCH_LIMIT: int = int(os.getenv("JOB_STORE_SEARCH_LIMIT", "200"))
+
+    # Pre-crawl scheduler settings
+    PRECRAWL_ENABLED: bool = os.getenv("PRECRAWL_ENABLED", "True").lower() == "true"
+    PRECRAWL_INTERVAL: float = float(os.getenv("PRECRAWL_INTERVAL", "600"))
+    PRECRAWL_TOP_N: int = int(os.getenv("PRECRAWL_TOP_N", "10"))
+    PRECRAWL_DECAY: float = float(os.getenv("PRECRAWL_DECAY", "0.5"))
+    PRECRAWL_MAX_TRACKED: int = int(os.getenv("PRECRAWL_MAX_TRACKED", "1000"))
+    PRECRAWL_SOURCE_CONCURRENCY: int = int(os.getenv("PRECRAWL_SOURCE_CONCURRENCY", "1"))
+    PRECRAWL_POLITENESS_SECONDS: float = float(os.getenv("PRECRAWL_POLITENESS_SECONDS", "5"))
+
     class Config:
         env_file = ".env"
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
+
+
+def get_settings() -> Settings:
+    """
+    Return the app settings (FastAPI dependency)
+    """
+    return settings
@@ -1,8 +1,17 @@
+import asyncio
+import json
 import logging
-from fastapi import FastAPI
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import router as api_router
 from app.core.config import settings
+from app.services.container import get_service_container, shutdown_service_container
+from app.services.precrawl import get_precrawl_scheduler, shutdown_precrawl_scheduler
+from app.services.metrics import HTTP_LATENCY, HTTP_REQUESTS, render_metrics
+from app.services.tracing import get_trace_writer, should_sample, traced
 
 # Configure logging
 logging.basicConfig(
@@ -10,12 +19,37 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build the service container, warm it up in the background and start the
+    pre-crawl scheduler once it is warm; on shutdown, close everything it holds
+    """
+    container = get_service_container()
+
+    async def warm_up():
+        await container.warm_up()
+        if settings.PRECRAWL_ENABLED:
+            get_precrawl_scheduler().start()
+
+    # Serve /ready (503 until warm) while warming up instead of delaying startup
+    warm_up_task = asyncio.create_task(warm_up())
+    try:
+        yield
+    finally:
+        warm_up_task.cancel()
+        await shutdown_precrawl_scheduler()
+        await shutdown_service_container()
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="API for finding relevant job listings from multiple online sources",
     version="1.0.0",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -30,6 +64,54 @@ app.add_middleware(
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """
+    Count requests and observe their latency, labelled by route template rather than raw path
+    """
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        path = route.path if route is not None else "unmatched"
+        HTTP_REQUESTS.labels(request.method, path, str(status)).inc()
+        HTTP_LATENCY.labels(request.method, path).observe(time.perf_counter() - started)
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    """
+    Trace each request's stages (scrapes, parsing, LLM batches) and report them in a Server-Timing header
+
+    With TRACE_DEBUG_ENABLED, sending an X-Debug-Trace header also adds the span
+    tree to JSON responses as "debug_trace". A TRACE_SAMPLE_RATE fraction of
+    traces is appended to TRACE_FILE_PATH in Chrome trace-event format. For
+    streamed responses the trace ends when the response headers are sent.
+    """
+    if not settings.TRACE_ENABLED:
+        return await call_next(request)
+
+    with traced(f"{request.method} {request.url.path}") as trace:
+        response = await call_next(request)
+    response.headers["Server-Timing"] = trace.server_timing()
+
+    if settings.TRACE_DEBUG_ENABLED and request.headers.get("x-debug-trace") and \
+            response.headers.get("content-type", "").startswith("application/json"):
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        payload = json.loads(body)
+        if isinstance(payload, dict):
+            payload["debug_trace"] = trace.to_dict()
+            body = json.dumps(payload).encode()
+        headers = {k: v for k, v in response.headers.items() if k.lower() != "content-length"}
+        response = Response(content=body, status_code=response.status_code, headers=headers, media_type="application/json")
+
+    if should_sample():
+        await asyncio.get_running_loop().run_in_executor(None, get_trace_writer().write, trace)
+    return response
+
 @app.get("/", tags=["Root"])
 async def root():
     """
@@ -41,6 +123,26 @@ async def root():
         "documentation": "/docs",
     }
 
+@app.get("/ready", tags=["Root"])
+async def ready():
+    """
+    Readiness probe: 200 once startup warm-up has finished, 503 until then
+    """
+    container = get_service_container()
+    return JSONResponse(
+        status_code=200 if container.ready else 503,
+        content={"ready": container.ready, "warm_up": container.warm_up_status},
+    )
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """
+        Prometheus metrics: request counts, per-stage and LLM latencies, cache lookups, in-flight searches
+        """
+        body, content_type = render_metrics()
+        return Response(content=body, media_type=content_type)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
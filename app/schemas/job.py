@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+from app.core.config import settings
 
 class Job(BaseModel):
     title: str
@@ -19,6 +21,12 @@ class JobSearchRequest(BaseModel):
     jobNature: Optional[str] = None
     location: Optional[str] = None
     skills: str
+    max_results: Optional[int] = Field(
+        None, ge=1, le=250, description="Jobs to collect per source, rounded up to whole results pages"
+    )
+    time_budget: Optional[float] = Field(
+        None, gt=0, le=120, description="Seconds the search may take; sources still running after that are skipped"
+    )
 
     class Config:
         schema_extra = {
@@ -41,9 +49,22 @@ class JobResponse(BaseModel):
     salary: str
     apply_link: str
     source: str = Field(description="Source platform (LinkedIn, Indeed, etc.)")
+    decided_by: Optional[str] = Field(None, description="Filtering stage that kept the job (lexical_accept, llm, llm_cache, ...)")
+    relevance_score: Optional[float] = Field(None, description="Local relevance score between 0 and 1")
+    sources: Optional[List[str]] = Field(None, description="Every source the posting was found on")
+    apply_links: Optional[List[str]] = Field(None, description="Apply link on each of those sources")
+    salary_min: Optional[float] = Field(None, description="Lowest salary parsed from the salary text")
+    salary_max: Optional[float] = Field(None, description="Highest salary; empty when open-ended or unparsed")
+    salary_currency: Optional[str] = Field(None, description="ISO currency code, when the salary names one")
+    salary_period: Optional[str] = Field(None, description="hour, day, week, month or year, when stated")
+    experience_min: Optional[float] = Field(None, description="Minimum years of experience asked for")
+    experience_max: Optional[float] = Field(None, description="Maximum years; empty when open-ended or unparsed")
 
 class JobSearchResponse(BaseModel):
     relevant_jobs: List[JobResponse]
+    source_status: Dict[str, str] = Field(
+        default_factory=dict, description="Per source: ok, cached, timeout, error or skipped (circuit breaker open)"
+    )
     
     class Config:
         schema_extra = {
@@ -69,6 +90,35 @@ class JobSearchResponse(BaseModel):
                         "apply_link": "https://indeed.com/job456",
                         "source": "Indeed"
                     }
-                ]
+                ],
+                "source_status": {"LinkedIn": "ok", "Indeed": "ok", "Glassdoor": "timeout"}
             }
-        }
\ No newline at end of file
+        }
+
+class JobBatchSearchRequest(BaseModel):
+    searches: List[JobSearchRequest] = Field(
+        ..., min_items=1, max_items=settings.BATCH_SEARCH_MAX_REQUESTS,
+        description="Searches to run together; those sharing a position and location are scraped once"
+    )
+    time_budget: Optional[float] = Field(
+        None, gt=0, le=120, description="Seconds the whole batch may take (defaults to the largest per-search budget)"
+    )
+
+class JobBatchSearchResponse(BaseModel):
+    results: List[JobSearchResponse] = Field(description="One result per search, in request order")
+
+class SearchTaskSubmitted(BaseModel):
+    task_id: str
+    status: str = Field(description="queued until a worker picks the search up")
+    status_url: str = Field(description="Poll this for progress and results")
+
+class SearchTaskStatus(BaseModel):
+    task_id: str
+    status: str = Field(description="queued, running, done or failed")
+    sources: Dict[str, str] = Field(
+        description="Per source: pending until it reports, then ok, cached, timeout, error or skipped"
+    )
+    queued_ms: float = Field(description="Time spent waiting for a worker")
+    elapsed_ms: Optional[float] = Field(None, description="Time spent searching so far")
+    result: Optional[JobSearchResponse] = Field(None, description="Search results, once status is done")
+    error: Optional[str] = None
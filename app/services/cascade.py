@@ -0,0 +1,135 @@
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.services.ranges import experience_overlap, parse_experience, parse_salary, salary_overlap
+from app.services.ranking import BM25Ranker, job_texts, tokenize
+from app.services.search_cache import canonical_location, normalize_text
+from app.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+# Stage that decided a job, recorded on every returned job as "decided_by"
+STAGE_LEXICAL_ACCEPT = "lexical_accept"
+STAGE_LEXICAL_REJECT = "lexical_reject"
+STAGE_LEXICAL = "lexical"
+STAGE_LLM = "llm"
+STAGE_LLM_CACHE = "llm_cache"
+STAGE_LLM_ERROR = "llm_error"
+STAGE_LLM_TIMEOUT = "llm_timeout"
+
+
+class LocalScorer:
+    """
+    Cheap relevance score in [0, 1] used before any LLM call
+
+    The lexical part blends how much of the position the title covers with
+    how many skills it mentions. Location, job nature, salary and experience
+    mismatches then scale the score down by CASCADE_MISMATCH_PENALTY each;
+    salary and experience are compared as parsed numeric ranges.
+    """
+
+    def __init__(self, ranker: Optional[BM25Ranker] = None):
+        self.ranker = ranker or BM25Ranker()
+
+    def score(self, jobs: List[Dict], request: JobSearchRequest) -> "np.ndarray":
+        """
+        Score jobs against a search request
+
+        Args:
+            jobs: List of job dictionaries
+            request: Job search request
+
+        Returns:
+            Array of scores in [0, 1], one per job
+        """
+        if not jobs:
+            return np.zeros(0, dtype=np.float32)
+
+        return self.lexical_scores(jobs, request) * self.rule_factors(jobs, request)
+
+    def lexical_scores(self, jobs: List[Dict], request: JobSearchRequest) -> "np.ndarray":
+        position_terms = list(dict.fromkeys(tokenize(request.position)))
+        skill_terms = [
+            term for term in dict.fromkeys(tokenize(request.skills.replace(",", " ")))
+            if term not in position_terms
+        ]
+
+        present = self.ranker.term_frequencies(job_texts(jobs), position_terms + skill_terms) > 0
+
+        position_coverage = (
+            present[:, :len(position_terms)].mean(axis=1) if position_terms else np.zeros(len(jobs))
+        )
+        # Each matched skill halves the remaining distance to 1
+        skill_score = 1 - 0.5 ** present[:, len(position_terms):].sum(axis=1)
+
+        weight = settings.CASCADE_POSITION_WEIGHT
+        return (weight * position_coverage + (1 - weight) * skill_score).astype(np.float32)
+
+    def rule_factors(self, jobs: List[Dict], request: JobSearchRequest) -> "np.ndarray":
+        penalty = settings.CASCADE_MISMATCH_PENALTY
+        wanted_city = canonical_location(request.location).split(",")[0]
+        wanted_nature = normalize_text(request.jobNature)
+
+        factors = np.ones(len(jobs), dtype=np.float32)
+        for i, job in enumerate(jobs):
+            job_location = canonical_location(job.get("location"))
+            job_nature = normalize_text(job.get("jobNature"))
+            is_remote = "remote" in job_location or job_nature == "remote"
+
+            if (
+                wanted_city
+                and wanted_city != "remote"
+                and job_location
+                and "unknown" not in job_location
+                and wanted_city not in job_location
+                and not is_remote
+            ):
+                factors[i] *= penalty
+
+            if wanted_nature in ("remote", "onsite", "hybrid") and job_nature in ("remote", "onsite", "hybrid"):
+                if wanted_nature != job_nature:
+                    factors[i] *= penalty
+
+        factors[~salary_overlap(jobs, parse_salary(request.salary))] *= penalty
+        factors[~experience_overlap(jobs, parse_experience(request.experience))] *= penalty
+        return factors
+
+
+class CascadeStats:
+    """
+    Running counts of which cascade stage decided each job
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+
+    def record(self, stages: List[str]):
+        with self._lock:
+            for stage in stages:
+                self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def llm_fraction(self) -> float:
+        """
+        Fraction of filtered jobs that needed a live LLM call
+        """
+        total = self.total
+        reached = sum(self.counts.get(stage, 0) for stage in (STAGE_LLM, STAGE_LLM_ERROR, STAGE_LLM_TIMEOUT))
+        return reached / total if total else 0.0
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            counts = dict(self.counts)
+        return {"counts": counts, "llm_fraction": self.llm_fraction()}
+
+
+cascade_stats = CascadeStats()
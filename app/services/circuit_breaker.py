@@ -0,0 +1,91 @@
+import logging
+import time
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Stops calling a source for a while after it keeps failing
+
+    After CIRCUIT_BREAKER_FAILURES consecutive failures or timeouts the
+    breaker opens and allow() returns False for CIRCUIT_BREAKER_COOLDOWN
+    seconds. Then it is half-open: one trial call is let through (another one
+    per cooldown if the trial never reports back), which closes the breaker on
+    success or re-opens it on failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: Optional[int] = None, cooldown: Optional[float] = None):
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_BREAKER_FAILURES
+        self.cooldown = settings.CIRCUIT_BREAKER_COOLDOWN if cooldown is None else cooldown
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+        self.stats: Dict[str, int] = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.cooldown:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow(self) -> bool:
+        """
+        Whether a call may go ahead; a half-open breaker admits one trial call at a time
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        if state == self.HALF_OPEN and (self._trial_started_at is None or now - self._trial_started_at >= self.cooldown):
+            self._trial_started_at = now
+            return True
+        self.stats["rejected"] += 1
+        return False
+
+    def record_success(self):
+        self.stats["successes"] += 1
+        if self._opened_at is not None:
+            logger.info(f"Circuit breaker for {self.name} closed")
+        self.failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self):
+        self.stats["failures"] += 1
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.stats["opened"] += 1
+                logger.warning(f"Circuit breaker for {self.name} opened after {self.failures} failures")
+            self._opened_at = time.monotonic()
+        self._trial_started_at = None
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Return the app-wide circuit breaker for a source, creating it on first use
+    """
+    if name not in _breakers:
+        _breakers[name] = CircuitBreaker(name)
+    return _breakers[name]
+
+
+def reset_circuit_breakers():
+    """
+    Forget every source's failure history
+    """
+    _breakers.clear()
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.job_service import JobService
+from app.services.job_store import close_job_store, get_job_store
+from app.services.llm_client import close_llm_client, get_llm_client
+from app.services.scrapers.driver_pool import get_driver_pool, shutdown_driver_pool
+from app.services.scrapers.executor import shutdown_scrape_executor
+from app.services.scrapers.http_client import close_http_client, get_http_client
+from app.services.scrapers.parsing import get_parse_pool, shutdown_parse_pool
+from app.services.search_tasks import SearchTaskQueue
+from app.services.verdict_cache import close_verdict_cache, get_verdict_cache
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainer:
+    """
+    Services that live as long as the app, shared by every request
+
+    The container is built once per process and injected into the endpoints
+    with Depends, so scrapers, the relevance filter and their pools, clients
+    and caches survive between requests. warm_up() pays for the expensive
+    first uses (chromedriver resolution, browser launches, TLS setup, XPath
+    compilation, opening the SQLite indexes) before traffic arrives; ready
+    reports when it has finished.
+    """
+
+    def __init__(self, job_service: Optional[JobService] = None):
+        self.job_service = job_service or JobService()
+        self.search_tasks = SearchTaskQueue(self.job_service)
+        self.ready = False
+        self.warm_up_status: Dict[str, Dict] = {}
+
+    def _xpaths(self) -> List[str]:
+        xpaths = []
+        for scraper in self.job_service.scrapers.values():
+            if scraper.card_xpath:
+                xpaths.append(scraper.card_xpath)
+                xpaths.extend(scraper.field_xpaths.values())
+        return xpaths
+
+    def _open_indexes(self):
+        get_job_store()
+        get_verdict_cache()
+
+    def _warm_browser_pool(self):
+        pool = get_driver_pool()
+        pool.resolve_driver_path()
+        pool.warm_up()
+
+    def warm_up_steps(self) -> List[Tuple[str, Callable[[], object], bool]]:
+        """
+        Warm-up steps in the order they run
+
+        Returns:
+            (name, step, blocking) tuples; blocking steps run on a worker thread,
+            the others (async clients) on the event loop that will use them
+        """
+        steps = []
+        if settings.OPENAI_API_KEY:
+            steps.append(("llm_client", get_llm_client, False))
+        steps.append(("http_client", get_http_client().warm_up, False))
+        steps.append(("parsers", lambda: get_parse_pool().warm_up(self._xpaths()), True))
+        steps.append(("indexes", self._open_indexes, True))
+        if settings.BROWSER_WARM_UP_ENABLED:
+            steps.append(("browser_pool", self._warm_browser_pool, True))
+        return steps
+
+    async def warm_up(self):
+        """
+        Run every warm-up step, then mark the container ready
+
+        A failing step is logged and reported in warm_up_status; the service
+        still becomes ready, since every resource is also created on first use.
+        """
+        loop = asyncio.get_running_loop()
+        for name, step, blocking in self.warm_up_steps():
+            started = time.perf_counter()
+            try:
+                if blocking:
+                    await loop.run_in_executor(None, step)
+                else:
+                    step()
+                status = "ok"
+            except Exception as e:
+                logger.error(f"Error warming up {name}: {str(e)}")
+                status = "error"
+            self.warm_up_status[name] = {"status": status, "ms": round((time.perf_counter() - started) * 1000, 1)}
+
+        self.ready = True
+        logger.info(f"Services warmed up: {self.warm_up_status}")
+
+    async def aclose(self):
+        """
+        Close shared clients and quit pooled browsers so no Chrome processes outlive the app
+        """
+        self.ready = False
+        await self.search_tasks.shutdown()
+        shutdown_scrape_executor()
+        shutdown_parse_pool()
+        await close_http_client()
+        await close_llm_client()
+        close_verdict_cache()
+        close_job_store()
+        await asyncio.get_running_loop().run_in_executor(None, shutdown_driver_pool)
+
+
+_container: Optional[ServiceContainer] = None
+
+
+def get_service_container() -> ServiceContainer:
+    """
+    Return the app-wide service container, creating it on first use
+    """
+    global _container
+    if _container is None:
+        _container = ServiceContainer()
+    return _container
+
+
+async def shutdown_service_container():
+    """
+    Close the app-wide service container's resources if it was created
+    """
+    global _container
+    if _container is not None:
+        await _container.aclose()
+        _container = None
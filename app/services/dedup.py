@@ -0,0 +1,309 @@
+import functools
+import hashlib
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from app.core.config import settings
+from app.services.ranges import DERIVED_FIELDS, normalize_job
+from app.services.ranking import tokenize
+from app.services.search_cache import canonical_location
+from app.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+# Legal-form words that vary between listings of the same employer
+COMPANY_SUFFIXES = {
+    "pvt", "private", "ltd", "limited", "inc", "llc", "co", "corp", "corporation",
+    "company", "plc", "gmbh",
+}
+
+# Abbreviations expanded before comparing titles
+TITLE_ABBREVIATIONS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "jnr": "junior", "engg": "engineer",
+    "eng": "engineer", "dev": "developer", "mgr": "manager", "assoc": "associate", "fullstack": "full stack",
+    "frontend": "front end", "backend": "back end",
+}
+
+# Placeholders scrapers use for fields they couldn't read
+PLACEHOLDERS = {"", "not specified", "unknown company", "unknown location", "unknown title", "#"}
+
+# Words that distinguish otherwise identical postings at different levels
+SENIORITY_WORDS = {"intern", "trainee", "junior", "associate", "senior", "lead", "principal", "staff", "head", "chief"}
+
+# MinHash signature layout: BANDS x ROWS_PER_BAND permutations
+BANDS = 8
+ROWS_PER_BAND = 4
+# Postings kept per LSH bucket; an overfull bucket means the band is too common to be informative
+MAX_BUCKET_SIZE = 16
+
+
+@functools.lru_cache(maxsize=None)
+def _permutations() -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Seeded (multiplier, offset) pairs of the MinHash permutations, built on first use
+    """
+    rng = np.random.default_rng(20240501)
+    multipliers = rng.integers(1, 2 ** 63, size=BANDS * ROWS_PER_BAND, dtype=np.uint64) | np.uint64(1)
+    offsets = rng.integers(0, 2 ** 63, size=BANDS * ROWS_PER_BAND, dtype=np.uint64)
+    return multipliers, offsets
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """
+    Expand abbreviations and sort the words, so "Sr. Python Dev" matches "Python Developer (Senior)"
+    """
+    words = " ".join(TITLE_ABBREVIATIONS.get(token.rstrip("."), token.rstrip(".")) for token in tokenize(title))
+    return " ".join(sorted(words.split()))
+
+
+def normalize_company(company: Optional[str]) -> str:
+    """
+    Drop spacing, a leading "the" and trailing legal-form words, so "Tech Corp Pvt Ltd" matches "TechCorp"
+    """
+    tokens = tokenize(company)
+    if tokens[:1] == ["the"]:
+        tokens = tokens[1:]
+    name = "".join(tokens)
+
+    # Suffixes are stripped from the joined name, so "TechCorp" and "Tech Corp" agree
+    stripped = True
+    while stripped:
+        stripped = False
+        for suffix in COMPANY_SUFFIXES:
+            if name.endswith(suffix) and len(name) > len(suffix):
+                name = name[:-len(suffix)]
+                stripped = True
+    return name
+
+
+def normalize_city(location: Optional[str]) -> str:
+    return canonical_location(location).split(",")[0]
+
+
+def dedup_key(job: Dict) -> Tuple[str, str, str]:
+    """
+    Exact-duplicate key: normalized (title, company, city)
+    """
+    return normalize_title(job.get("job_title")), normalize_company(job.get("company")), normalize_city(job.get("location"))
+
+
+def normalize_link(link: Optional[str]) -> str:
+    """
+    Scheme, host and path of an apply link; tracking and ref query parameters are dropped
+    """
+    parts = urlsplit(link or "")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+def source_key(key: Tuple[str, str, str], job: Dict) -> Tuple[str, ...]:
+    """
+    Exact-duplicate key within one source: the (title, company, city) key plus source and normalized apply_link
+    """
+    return (*key, job.get("source"), normalize_link(job.get("apply_link")))
+
+
+def is_other_posting(representative: Dict, job: Dict) -> bool:
+    """
+    Whether job is a different posting from a source the representative already came from
+
+    A source lists each posting under its own apply link, so two of its
+    listings whose links still differ once normalized are two postings,
+    however alike they read.
+    """
+    link = job.get("apply_link")
+    return (
+        job.get("source") in representative["sources"]
+        and link not in PLACEHOLDERS
+        and bool(representative["apply_links"])
+        and normalize_link(link) not in {normalize_link(known) for known in representative["apply_links"]}
+    )
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _Posting:
+    """
+    A distinct posting seen so far, with what near-duplicate checks compare against
+    """
+
+    __slots__ = ("job", "features", "seniority")
+
+    def __init__(self, job: Dict, features: Set[str], seniority: frozenset):
+        self.job = job
+        self.features = features
+        self.seniority = seniority
+
+
+class JobDeduplicator:
+    """
+    Merges copies of the same posting found on different sources
+
+    Jobs with the same normalized (title, company, city) are duplicates,
+    except that listings from one source whose apply links differ in scheme,
+    host or path are distinct postings and are never merged with each other.
+    Within a city, jobs at the same seniority whose "title | company"
+    character trigrams have a Jaccard similarity of at least DEDUP_SIMILARITY
+    are near duplicates. Candidates are found with MinHash LSH (8 bands of 4
+    rows), so only jobs sharing a band are compared, and buckets are capped at
+    MAX_BUCKET_SIZE so the whole pass stays roughly linear.
+
+    add() can be called repeatedly (e.g. once per source); each call returns
+    only the jobs that were not duplicates of anything added before.
+    """
+
+    def __init__(self, similarity: Optional[float] = None):
+        self.similarity = settings.DEDUP_SIMILARITY if similarity is None else similarity
+        self._feature_hashes: Dict[str, int] = {}
+        self._exact: Dict[Tuple[str, ...], Dict] = {}
+        self._buckets: Dict[Tuple[int, bytes, str], List[_Posting]] = {}
+        self.stats: Dict[str, int] = {"seen": 0, "exact_duplicates": 0, "near_duplicates": 0}
+
+    def _hash_features(self, features: Set[str]) -> "np.ndarray":
+        hashes = []
+        for feature in features:
+            value = self._feature_hashes.get(feature)
+            if value is None:
+                value = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+                self._feature_hashes[feature] = value
+            hashes.append(value)
+        return np.array(hashes, dtype=np.uint64)
+
+    def signatures(self, feature_sets: List[Set[str]]) -> "np.ndarray":
+        """
+        MinHash signatures for a batch of feature sets
+
+        Returns:
+            Array of shape (len(feature_sets), BANDS * ROWS_PER_BAND)
+        """
+        signatures = np.zeros((len(feature_sets), BANDS * ROWS_PER_BAND), dtype=np.uint64)
+        hashed = [self._hash_features(features) for features in feature_sets]
+        rows = [i for i, hashes in enumerate(hashed) if len(hashes)]
+        if not rows:
+            return signatures
+
+        # Hash every feature of the batch with every permutation at once, then
+        # take the per-job minimum over each job's slice
+        flat = np.concatenate([hashed[i] for i in rows])
+        offsets = np.cumsum([0] + [len(hashed[i]) for i in rows[:-1]])
+        multipliers, permutation_offsets = _permutations()
+        permuted = flat[:, None] * multipliers[None, :] + permutation_offsets[None, :]
+        signatures[rows] = np.minimum.reduceat(permuted, offsets, axis=0)
+        return signatures
+
+    def add(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Add jobs, merging duplicates into the first copy seen
+
+        The first copy becomes the representative: it gains "sources" and
+        "apply_links" lists covering every copy, and placeholder fields (e.g. a
+        "Not specified" salary) are filled in from later copies.
+
+        Args:
+            jobs: Job dictionaries
+
+        Returns:
+            Representatives for jobs that were not duplicates of earlier ones
+        """
+        keys = [dedup_key(job) for job in jobs]
+        feature_sets = [trigrams(f"{title} | {company}") for title, company, _ in keys]
+        signatures = self.signatures(feature_sets)
+        unique = []
+
+        for job, key, features, signature in zip(jobs, keys, feature_sets, signatures):
+            self.stats["seen"] += 1
+            same_source_key = source_key(key, job)
+            representative = self._exact.get(same_source_key) or self._exact.get(key)
+
+            if representative is not None and not is_other_posting(representative, job):
+                self.stats["exact_duplicates"] += 1
+                self._merge(representative, job)
+                continue
+
+            seniority = frozenset(SENIORITY_WORDS.intersection(key[0].split()))
+            band_keys = [
+                (band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes(), key[2])
+                for band in range(BANDS)
+            ]
+
+            posting = self._near_duplicate(job, features, seniority, band_keys)
+            if posting is not None:
+                self.stats["near_duplicates"] += 1
+                self._exact.setdefault(key, posting.job)
+                self._exact[same_source_key] = posting.job
+                self._merge(posting.job, job)
+                continue
+
+            link = job.get("apply_link")
+            representative = dict(
+                job, sources=[job.get("source")], apply_links=[link] if link not in PLACEHOLDERS else []
+            )
+            self._exact.setdefault(key, representative)
+            self._exact[same_source_key] = representative
+            posting = _Posting(representative, features, seniority)
+            for band_key in band_keys:
+                bucket = self._buckets.setdefault(band_key, [])
+                if len(bucket) < MAX_BUCKET_SIZE:
+                    bucket.append(posting)
+            unique.append(representative)
+
+        return unique
+
+    def _near_duplicate(
+        self, job: Dict, features: Set[str], seniority: frozenset, band_keys: List[Tuple[int, bytes, str]]
+    ) -> Optional[_Posting]:
+        compared = set()
+        for band_key in band_keys:
+            for posting in self._buckets.get(band_key, ()):
+                if posting.seniority != seniority or id(posting) in compared or is_other_posting(posting.job, job):
+                    continue
+                compared.add(id(posting))
+                overlap = len(features & posting.features)
+                if overlap >= self.similarity * (len(features) + len(posting.features) - overlap):
+                    return posting
+        return None
+
+    @staticmethod
+    def _merge(representative: Dict, duplicate: Dict):
+        source = duplicate.get("source")
+        if source not in representative["sources"]:
+            representative["sources"].append(source)
+
+        link = duplicate.get("apply_link")
+        if link and link not in PLACEHOLDERS and normalize_link(link) not in {
+            normalize_link(known) for known in representative["apply_links"]
+        }:
+            representative["apply_links"].append(link)
+
+        filled = False
+        for field in ("salary", "experience", "jobNature", "description"):
+            current = representative.get(field)
+            if (current is None or str(current).strip().lower() in PLACEHOLDERS) and duplicate.get(field):
+                representative[field] = duplicate[field]
+                filled = filled or field in DERIVED_FIELDS
+        if filled:
+            # Keep the numeric ranges in step with the salary or experience text just filled in
+            normalize_job(representative)
+
+
+def deduplicate_jobs(jobs: List[Dict], similarity: Optional[float] = None) -> List[Dict]:
+    """
+    Merge duplicate and near-duplicate postings in one batch
+
+    Args:
+        jobs: Job dictionaries, possibly from several sources
+        similarity: Trigram Jaccard similarity for near duplicates (defaults to DEDUP_SIMILARITY)
+
+    Returns:
+        One job per distinct posting, in first-seen order
+    """
+    deduplicator = JobDeduplicator(similarity)
+    unique = deduplicator.add(jobs)
+    if len(unique) < len(jobs):
+        logger.info(f"Merged {len(jobs) - len(unique)} duplicate jobs, {len(unique)} distinct postings remain")
+    return unique
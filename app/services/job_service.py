@@ -1,25 +1,71 @@
 import asyncio
+import functools
 import logging
-from typing import List, Dict
+import time
+from typing import AsyncIterator, Callable, List, Dict, Optional, Tuple
 
+from app.core.config import settings
 from app.schemas.job import JobSearchRequest, JobResponse
 from app.services.scrapers.linkedin_scraper import LinkedInScraper
 from app.services.scrapers.indeed_scraper import IndeedScraper
 from app.services.scrapers.glassdoor_scraper import GlassdoorScraper
 from app.services.relevance_filter import RelevanceFilter
+from app.services.dedup import JobDeduplicator, deduplicate_jobs
+from app.services.ranking import tokenize
+from app.services.search_cache import (
+    SearchCache, canonical_location, canonical_search_key, get_search_cache, normalize_text
+)
+from app.services.scrapers.base_scraper import BaseScraper
+from app.services.single_flight import SingleFlight, get_single_flight
+from app.services.job_store import JobStore, get_job_store
+from app.services.precrawl import get_precrawl_scheduler
+from app.services.circuit_breaker import get_circuit_breaker
+from app.services.metrics import (
+    SCRAPES_IN_PROGRESS, SEARCHES_IN_PROGRESS, SOURCE_RESULTS, record_cache, time_stage
+)
 
 logger = logging.getLogger(__name__)
 
+# Outcome of each source in a search, reported as source_status
+SOURCE_OK = "ok"
+SOURCE_CACHED = "cached"
+SOURCE_TIMEOUT = "timeout"
+SOURCE_ERROR = "error"
+SOURCE_SKIPPED = "skipped"
+
 class JobService:
     """
     Service for finding jobs across multiple platforms
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        search_cache: Optional[SearchCache] = None,
+        search_flight: Optional[SingleFlight] = None,
+        source_flight: Optional[SingleFlight] = None,
+        job_store: Optional[JobStore] = None,
+    ):
         self.linkedin_scraper = LinkedInScraper()
         self.indeed_scraper = IndeedScraper()
         self.glassdoor_scraper = GlassdoorScraper()
         self.relevance_filter = RelevanceFilter()
+        self.search_cache = search_cache or get_search_cache()
+        # Identical concurrent searches, and identical per-source scrapes, share one run
+        self.search_flight = search_flight or get_single_flight("search")
+        self.source_flight = source_flight or get_single_flight("source")
+        self.job_store = job_store or get_job_store()
+    
+    @property
+    def scrapers(self) -> Dict[str, BaseScraper]:
+        """
+        Enabled scrapers keyed by source name
+        """
+        scrapers = {
+            "LinkedIn": self.linkedin_scraper,
+            "Indeed": self.indeed_scraper,
+            "Glassdoor": self.glassdoor_scraper,
+        }
+        return {source: scraper for source, scraper in scrapers.items() if scraper.enabled}
     
     async def find_jobs(self, request: JobSearchRequest) -> List[Dict]:
         """
@@ -31,67 +77,465 @@ class JobService:
         Returns:
             List of relevant jobs
         """
+        relevant_jobs, _ = await self.search(request)
+        return relevant_jobs
+    
+    async def search(self, request: JobSearchRequest) -> Tuple[List[Dict], Dict[str, str]]:
+        """
+        Find jobs matching search criteria, reporting how each source fared
+        
+        Fresh cached results are returned immediately. Stale results are
+        returned too, while a background task refreshes them. Otherwise the
+        search runs within the request's time budget and returns whatever
+        finished in time.
+        
+        Args:
+            request: Job search criteria
+            
+        Returns:
+            (relevant jobs, status per source): status is "ok", "cached",
+            "timeout", "error" or "skipped" (circuit breaker open)
+        """
+        key = canonical_search_key(request)
+        
+        if not settings.SEARCH_CACHE_ENABLED:
+            relevant_jobs, source_status = await self.search_flight.do(key, lambda: self._search(request))
+            return list(relevant_jobs), dict(source_status)
+        
+        cached = self._from_cache(key, request)
+        if cached is not None:
+            return cached
+        
+        relevant_jobs, source_status = await self.search_flight.do(
+            key, lambda: self._search_and_cache(key, request)
+        )
+        return list(relevant_jobs), dict(source_status)
+    
+    def _from_cache(self, key: str, request: JobSearchRequest) -> Optional[Tuple[List[Dict], Dict[str, str]]]:
+        """
+        Cached results for a search, or None on a miss; stale results are refreshed in the background
+        """
+        cached_jobs, state = self.search_cache.get(key)
+        cached_status = {source: SOURCE_CACHED for source in self.scrapers}
+        record_cache(
+            "search", hits=state == SearchCache.FRESH, stale=state == SearchCache.STALE, misses=state is None
+        )
+        
+        if state == SearchCache.FRESH:
+            logger.info(f"Serving cached results for: {request.position}")
+            return list(cached_jobs), cached_status
+        
+        if state == SearchCache.STALE:
+            logger.info(f"Serving stale results and refreshing in background for: {request.position}")
+            self.search_cache.refresh_in_background(key, lambda: self._refresh(key, request))
+            return list(cached_jobs), cached_status
+        
+        return None
+    
+    async def search_many(
+        self, requests: List[JobSearchRequest], time_budget: Optional[float] = None
+    ) -> List[Tuple[List[Dict], Dict[str, str]]]:
+        """
+        Run several searches at once, scraping each distinct query only once
+        
+        Requests with cached results are answered from the cache as in
+        search(). The rest are grouped by normalized (position, location): each
+        group's sources are fetched once, deep enough for the largest
+        max_results in the group, and deduplicated. Then the candidates of every
+        request are filtered against its own criteria in a single pass (see
+        RelevanceFilter.filter_jobs_many), so the cost grows with the number of
+        distinct queries rather than the number of requests.
+        
+        Args:
+            requests: Job search criteria
+            time_budget: Seconds for the whole batch (defaults to the largest
+                time_budget among the requests, or SEARCH_TIME_BUDGET)
+            
+        Returns:
+            (relevant jobs, status per source) for each request, in request order
+        """
+        results: List[Optional[Tuple[List[Dict], Dict[str, str]]]] = [None] * len(requests)
+        keys = [canonical_search_key(request) for request in requests]
+        if settings.SEARCH_CACHE_ENABLED:
+            results = [self._from_cache(key, request) for key, request in zip(keys, requests)]
+        
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        for i, request in enumerate(requests):
+            if results[i] is None:
+                groups.setdefault(
+                    (normalize_text(request.position), canonical_location(request.location)), []
+                ).append(i)
+        if not groups:
+            return results
+        
+        budget = time_budget or max(request.time_budget or settings.SEARCH_TIME_BUDGET for request in requests)
+        deadline = time.monotonic() + budget
+        source_timeout = budget * settings.SEARCH_SOURCE_TIMEOUT_FRACTION
+        pending = sum(len(members) for members in groups.values())
+        logger.info(f"Batch search: {pending} requests, {len(groups)} distinct queries")
+        
+        SEARCHES_IN_PROGRESS.inc(pending)
+        try:
+            fetches = []
+            for members in groups.values():
+                first = requests[members[0]]
+                max_results = max(requests[i].max_results or settings.SCRAPER_MAX_RESULTS for i in members)
+                for source, scraper in self.scrapers.items():
+                    fetches.append(self._fetch_source_jobs(
+                        source, scraper, first.position, first.location or "", max_results=max_results,
+                        timeout=source_timeout,
+                    ))
+            
+            with get_precrawl_scheduler().foreground():
+                fetched = iter(await asyncio.gather(*fetches, return_exceptions=True))
+            
+            searches = []
+            statuses = {}
+            for group, members in groups.items():
+                group_jobs = []
+                statuses[group] = {}
+                for source in self.scrapers:
+                    result = next(fetched)
+                    if isinstance(result, Exception):
+                        logger.error(f"Error fetching jobs: {result}")
+                        statuses[group][source] = SOURCE_ERROR
+                    else:
+                        jobs, statuses[group][source] = result
+                        group_jobs.extend(jobs)
+                    SOURCE_RESULTS.labels(source, statuses[group][source]).inc()
+                
+                if settings.DEDUP_ENABLED:
+                    with time_stage("dedup"):
+                        group_jobs = deduplicate_jobs(group_jobs)
+                # Requests of one group share the jobs list, so it is tokenized once
+                searches.extend((group_jobs, requests[i]) for i in members)
+            
+            with time_stage("filter"):
+                filtered = iter(await self.relevance_filter.filter_jobs_many(
+                    searches, timeout=max(deadline - time.monotonic(), 0.0)
+                ))
+            
+            for group, members in groups.items():
+                for i in members:
+                    relevant_jobs, source_status = next(filtered), dict(statuses[group])
+                    if settings.SEARCH_CACHE_ENABLED:
+                        self._cache_result(keys[i], relevant_jobs, source_status)
+                    results[i] = (list(relevant_jobs), source_status)
+            return results
+        
+        finally:
+            SEARCHES_IN_PROGRESS.dec(pending)
+    
+    async def stream_jobs(self, request: JobSearchRequest) -> AsyncIterator[Dict]:
+        """
+        Find jobs matching search criteria, yielding each source's results as it finishes
+        
+        Sources are awaited with asyncio.as_completed, and each one's jobs are
+        filtered for relevance on their own, so the first event arrives after the
+        fastest source rather than the slowest. Postings already sent for an
+        earlier source are dropped from later ones. A fresh cached result is
+        sent as a single event; otherwise the merged results of a finished
+        stream are cached for later searches and streams, like search's.
+        
+        Args:
+            request: Job search criteria
+            
+        Yields:
+            {"event": "jobs", "source", "status", "jobs", "elapsed_ms"} per source, then
+            {"event": "summary", "total_jobs", "relevant_jobs", "sources", "elapsed_ms"}
+        """
+        budget = request.time_budget or settings.SEARCH_TIME_BUDGET
+        deadline = time.monotonic() + budget
+        started = time.perf_counter()
+        elapsed_ms = lambda: round((time.perf_counter() - started) * 1000, 1)
+        sources: Dict[str, Dict] = {}
+        total_jobs = relevant_jobs = 0
+        
+        key = canonical_search_key(request)
+        cached_jobs, state = (None, None)
+        if settings.SEARCH_CACHE_ENABLED:
+            cached_jobs, state = self.search_cache.get(key)
+        
+        if state == SearchCache.FRESH:
+            logger.info(f"Streaming cached results for: {request.position}")
+            total_jobs = relevant_jobs = len(cached_jobs)
+            sources["cache"] = {"total": total_jobs, "relevant": relevant_jobs, "status": SOURCE_CACHED}
+            yield {
+                "event": "jobs", "source": "cache", "status": SOURCE_CACHED,
+                "jobs": list(cached_jobs), "elapsed_ms": elapsed_ms(),
+            }
+        else:
+            query = request.position
+            location = request.location if request.location else ""
+            
+            async def fetch(source: str, scraper: BaseScraper) -> Tuple[str, List[Dict], str]:
+                jobs, status = await self._fetch_source_jobs(
+                    source, scraper, query, location, max_results=request.max_results,
+                    timeout=budget * settings.SEARCH_SOURCE_TIMEOUT_FRACTION,
+                )
+                return source, jobs, status
+            
+            deduplicator = JobDeduplicator()
+            merged: List[Dict] = []
+            
+            with get_precrawl_scheduler().foreground(), SEARCHES_IN_PROGRESS.track_inprogress():
+                for next_source in asyncio.as_completed(
+                    [fetch(source, scraper) for source, scraper in self.scrapers.items()]
+                ):
+                    source, jobs, status = await next_source
+                    SOURCE_RESULTS.labels(source, status).inc()
+                    if settings.DEDUP_ENABLED:
+                        with time_stage("dedup", source):
+                            jobs = deduplicator.add(jobs)
+                    with time_stage("filter", source):
+                        relevant = await self.relevance_filter.filter_jobs_async(
+                            jobs, request, timeout=max(deadline - time.monotonic(), 0.0)
+                        )
+                    
+                    merged.extend(relevant)
+                    total_jobs += len(jobs)
+                    relevant_jobs += len(relevant)
+                    sources[source] = {
+                        "total": len(jobs), "relevant": len(relevant), "status": status, "elapsed_ms": elapsed_ms()
+                    }
+                    yield {
+                        "event": "jobs", "source": source, "status": status,
+                        "jobs": relevant, "elapsed_ms": elapsed_ms(),
+                    }
+            
+            if settings.SEARCH_CACHE_ENABLED:
+                self._cache_result(key, merged, {source: info["status"] for source, info in sources.items()})
+        
+        yield {
+            "event": "summary",
+            "total_jobs": total_jobs,
+            "relevant_jobs": relevant_jobs,
+            "sources": sources,
+            "elapsed_ms": elapsed_ms(),
+        }
+    
+    def _cache_result(self, key: str, relevant_jobs: List[Dict], source_status: Dict[str, str]):
+        """
+        Cache a search result; a partial one (a source timed out, failed or was
+        skipped) stays fresh for only SEARCH_CACHE_PARTIAL_FRESH_SECONDS, so the
+        missing sources are retried soon without every search going live meanwhile
+        """
+        complete = all(status == SOURCE_OK for status in source_status.values())
+        self.search_cache.set(
+            key, relevant_jobs, fresh_seconds=None if complete else settings.SEARCH_CACHE_PARTIAL_FRESH_SECONDS
+        )
+    
+    async def _search_and_cache(self, key: str, request: JobSearchRequest) -> Tuple[List[Dict], Dict[str, str]]:
+        relevant_jobs, source_status = await self._search(request)
+        self._cache_result(key, relevant_jobs, source_status)
+        return relevant_jobs, source_status
+    
+    async def _refresh(self, key: str, request: JobSearchRequest) -> None:
+        relevant_jobs, source_status = await self._search(request, live=True)
+        # Stored here rather than returned, so a partial refresh gets its shorter fresh window
+        self._cache_result(key, relevant_jobs, source_status)
+    
+    async def _search(
+        self, request: JobSearchRequest, live: bool = False
+    ) -> Tuple[List[Dict], Dict[str, str]]:
+        """
+        Gather jobs from all sources and filter them, bypassing the result cache
+        
+        The request's time budget (time_budget, or SEARCH_TIME_BUDGET) covers
+        the whole search: each source gets SEARCH_SOURCE_TIMEOUT_FRACTION of it,
+        and the LLM stage of filtering gets whatever is left.
+        
+        Args:
+            request: Job search criteria
+            live: Scrape every source even if the job store is fresh for the query
+            
+        Returns:
+            (relevant jobs, status per source)
+        """
         logger.info(f"Searching for jobs: {request.position}")
         
+        budget = request.time_budget or settings.SEARCH_TIME_BUDGET
+        deadline = time.monotonic() + budget
+        
+        SEARCHES_IN_PROGRESS.inc()
         try:
             # Extract search parameters
             query = request.position
             location = request.location if request.location else ""
             
-            # Fetch jobs from all sources concurrently
+            # Fetch jobs from all sources concurrently, each within its share of the budget
+            source_timeout = budget * settings.SEARCH_SOURCE_TIMEOUT_FRACTION
             tasks = [
-                self._fetch_linkedin_jobs(query, location),
-                self._fetch_indeed_jobs(query, location),
-                self._fetch_glassdoor_jobs(query, location)
+                self._fetch_source_jobs(source, scraper, query, location, live, request.max_results, source_timeout)
+                for source, scraper in self.scrapers.items()
             ]
             
-            # Gather results
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Gather results; background pre-crawls hold off meanwhile
+            with get_precrawl_scheduler().foreground():
+                results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # Process results and handle exceptions
             all_jobs = []
-            for result in results:
+            source_status = {}
+            for source, result in zip(self.scrapers, results):
                 if isinstance(result, Exception):
                     logger.error(f"Error fetching jobs: {result}")
+                    source_status[source] = SOURCE_ERROR
                 else:
-                    all_jobs.extend(result)
+                    jobs, source_status[source] = result
+                    all_jobs.extend(jobs)
+                SOURCE_RESULTS.labels(source, source_status[source]).inc()
+            
+            # Merge postings listed on several sources so each is filtered once
+            if settings.DEDUP_ENABLED:
+                with time_stage("dedup"):
+                    all_jobs = deduplicate_jobs(all_jobs)
             
-            # Filter jobs for relevance
-            relevant_jobs = self.relevance_filter.filter_jobs(all_jobs, request)
+            # Filter jobs for relevance with the rest of the budget
+            with time_stage("filter"):
+                relevant_jobs = await self.relevance_filter.filter_jobs_async(
+                    all_jobs, request, timeout=max(deadline - time.monotonic(), 0.0)
+                )
             
             logger.info(f"Found {len(relevant_jobs)} relevant jobs out of {len(all_jobs)} total jobs")
-            return relevant_jobs
+            if any(status != SOURCE_OK for status in source_status.values()):
+                logger.warning(f"Returning partial results for {request.position}: {source_status}")
+            return relevant_jobs, source_status
             
         except Exception as e:
             logger.error(f"Error in find_jobs: {str(e)}")
             raise
+        
+        finally:
+            SEARCHES_IN_PROGRESS.dec()
     
-    async def _fetch_linkedin_jobs(self, query: str, location: str) -> List[Dict]:
+    async def _fetch_source_jobs(
+        self,
+        source: str,
+        scraper: BaseScraper,
+        query: str,
+        location: str,
+        live: bool = False,
+        max_results: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[List[Dict], str]:
         """
-        Fetch jobs from LinkedIn
+        Fetch jobs from one source
+        
+        Answered from the job store when it holds a fresh crawl of this
+        (source, query, location) at least max_results deep; otherwise scraped
+        live and upserted into the store. Concurrent searches (and pre-crawls)
+        with the same (source, query, location, max_results) share a single
+        scrape, even when the rest of their criteria differ.
+        
+        A live scrape is skipped while the source's circuit breaker is open,
+        and abandoned after timeout seconds (it carries on in the background
+        and still lands in the store). Either way, and on errors, whatever the
+        store holds for the query is returned instead.
+        
+        Returns:
+            (jobs, status)
         """
-        try:
-            return self.linkedin_scraper.fetch_jobs(query, location)
-        except Exception as e:
-            logger.error(f"Error fetching LinkedIn jobs: {str(e)}")
-            return []
+        with time_stage("fetch", source):
+            max_results = max_results or settings.SCRAPER_MAX_RESULTS
+            
+            if self.job_store and not live:
+                fresh = await self._in_thread(self.job_store.is_fresh, source, query, location, max_results)
+                record_cache("job_store", hits=fresh, misses=not fresh)
+                if fresh:
+                    logger.info(f"Serving {source} jobs from job store for: {query}")
+                    return await self._stored_jobs(source, query, location), SOURCE_OK
+            
+            breaker = get_circuit_breaker(source)
+            if not breaker.allow():
+                logger.warning(f"Skipping {source}: circuit breaker open after repeated failures")
+                return await self._stored_jobs(source, query, location), SOURCE_SKIPPED
+            
+            try:
+                jobs = await asyncio.wait_for(self.scrape_source(source, scraper, query, location, max_results), timeout)
+                breaker.record_success()
+                return list(jobs), SOURCE_OK
+            except asyncio.TimeoutError:
+                breaker.record_failure()
+                logger.warning(f"{source} did not finish within {timeout:.1f}s")
+                status = SOURCE_TIMEOUT
+            except Exception as e:
+                breaker.record_failure()
+                logger.error(f"Error fetching {source} jobs: {str(e)}")
+                status = SOURCE_ERROR
+            
+            return await self._stored_jobs(source, query, location), status
     
-    async def _fetch_indeed_jobs(self, query: str, location: str) -> List[Dict]:
+    @staticmethod
+    async def _in_thread(func: Callable, *args, **kwargs):
         """
-        Fetch jobs from Indeed
+        Run a blocking job store call (SQLite reads, writes and commits) on a worker thread
         """
-        try:
-            return self.indeed_scraper.fetch_jobs(query, location)
-        except Exception as e:
-            logger.error(f"Error fetching Indeed jobs: {str(e)}")
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
+    
+    async def _stored_jobs(self, source: str, query: str, location: str) -> List[Dict]:
+        """
+        Whatever the job store still holds for this query, as a fallback for a live scrape
+        """
+        if not self.job_store:
             return []
+        return await self._in_thread(self.job_store.search, query, location, sources=[source])
     
-    async def _fetch_glassdoor_jobs(self, query: str, location: str) -> List[Dict]:
+    async def scrape_source(
+        self, source: str, scraper: BaseScraper, query: str, location: str, max_results: Optional[int] = None
+    ) -> List[Dict]:
         """
-        Fetch jobs from Glassdoor
+        Scrape one source live and upsert the results into the job store
+        
+        Concurrent calls with the same (source, query, location, max_results)
+        share a single scrape.
+        
+        Args:
+            source: Source name
+            scraper: Scraper for the source
+            query: Position to search for
+            location: Location to search in
+            max_results: Jobs wanted (defaults to SCRAPER_MAX_RESULTS)
+            
+        Returns:
+            The scraped jobs
         """
-        try:
-            return self.glassdoor_scraper.fetch_jobs(query, location)
-        except Exception as e:
-            logger.error(f"Error fetching Glassdoor jobs: {str(e)}")
-            return []
\ No newline at end of file
+        max_results = max_results or settings.SCRAPER_MAX_RESULTS
+        key = (source, normalize_text(query), canonical_location(location), max_results)
+        return await self.source_flight.do(
+            key, lambda: self._scrape_and_store(source, scraper, query, location, max_results)
+        )
+    
+    @staticmethod
+    def _title_match_counter(query: str) -> Callable[[List[Dict]], int]:
+        """
+        Count jobs whose title shares a word with the query, for early stopping of pagination
+        """
+        terms = set(tokenize(query))
+        
+        def count_relevant(jobs: List[Dict]) -> int:
+            if not terms:
+                return len(jobs)
+            return sum(1 for job in jobs if terms.intersection(tokenize(job.get("job_title"))))
+        
+        return count_relevant
+    
+    async def _scrape_and_store(
+        self, source: str, scraper: BaseScraper, query: str, location: str, max_results: int
+    ) -> List[Dict]:
+        with SCRAPES_IN_PROGRESS.labels(source).track_inprogress():
+            jobs = await scraper.fetch_jobs_async(
+                query, location, max_results=max_results, count_relevant=self._title_match_counter(query)
+            )
+        # Only reached when the scrape succeeded: a failing scraper raises, so nothing
+        # is stored and the query is not marked as crawled
+        if self.job_store:
+            try:
+                await self._in_thread(self._store_crawl, source, query, location, max_results, jobs)
+            except Exception as e:
+                logger.error(f"Error storing {source} jobs: {str(e)}")
+        return jobs
+    
+    def _store_crawl(self, source: str, query: str, location: str, max_results: int, jobs: List[Dict]):
+        self.job_store.upsert_jobs(jobs)
+        self.job_store.mark_crawled(source, query, location, max_results)
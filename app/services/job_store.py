@@ -0,0 +1,258 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from app.core.config import settings
+from app.services.ranges import normalize_job
+from app.services.ranking import tokenize
+from app.services.search_cache import canonical_location, normalize_text
+
+logger = logging.getLogger(__name__)
+
+# Scraped job fields persisted in the store, in column order
+JOB_FIELDS = (
+    "job_title", "company", "experience", "jobNature", "location",
+    "salary", "apply_link", "source", "description", "date_posted",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_title TEXT NOT NULL,
+    company TEXT,
+    experience TEXT,
+    jobNature TEXT,
+    location TEXT,
+    salary TEXT,
+    apply_link TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    description TEXT,
+    date_posted TEXT,
+    scraped_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs (source);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location);
+CREATE INDEX IF NOT EXISTS idx_jobs_date_posted ON jobs (date_posted);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5 (
+    job_title, company, location, content='jobs', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, job_title, company, location)
+    VALUES (new.id, new.job_title, new.company, new.location);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company, location)
+    VALUES ('delete', old.id, old.job_title, old.company, old.location);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company, location)
+    VALUES ('delete', old.id, old.job_title, old.company, old.location);
+    INSERT INTO jobs_fts (rowid, job_title, company, location)
+    VALUES (new.id, new.job_title, new.company, new.location);
+END;
+
+CREATE TABLE IF NOT EXISTS crawls (
+    source TEXT NOT NULL,
+    query TEXT NOT NULL,
+    location TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    crawled_at REAL NOT NULL,
+    PRIMARY KEY (source, query, location)
+);
+"""
+
+
+def _match_terms(text: Optional[str]) -> str:
+    """
+    Quote each token so user input can't inject FTS5 query syntax
+    """
+    return " OR ".join(f'"{term}"' for term in dict.fromkeys(tokenize(text)))
+
+
+def crawl_key(source: str, query: str, location: Optional[str]) -> tuple:
+    return source, normalize_text(query), canonical_location(location)
+
+
+class JobStore:
+    """
+    Persistent store of scraped jobs with a full-text index
+
+    Every scrape is upserted here, deduplicated on apply_link. Titles,
+    companies and locations are indexed with FTS5, and source, location and
+    date_posted have B-tree indexes. The crawls table records when each
+    (source, query, location) was last scraped, so a search only has to
+    scrape live when the store is cold or stale for that query.
+    """
+
+    def __init__(self, path: Optional[str] = None, fresh_seconds: Optional[float] = None):
+        self.path = path or settings.JOB_STORE_PATH
+        self.fresh_seconds = settings.JOB_STORE_FRESH_SECONDS if fresh_seconds is None else fresh_seconds
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+
+        self.stats: Dict[str, int] = {"upserted": 0, "searches": 0, "fresh": 0, "stale": 0}
+
+    def upsert_jobs(self, jobs: Iterable[Dict]) -> int:
+        """
+        Insert scraped jobs, updating any already stored under the same apply_link
+
+        Jobs without a date_posted keep the date they were first seen.
+
+        Args:
+            jobs: Job dictionaries as returned by the scrapers
+
+        Returns:
+            Number of jobs written
+        """
+        now = time.time()
+        today = date.today().isoformat()
+        rows = [
+            (*(job.get(field) for field in JOB_FIELDS[:-1]), job.get("date_posted") or today, now)
+            for job in jobs
+            if job.get("apply_link") and job.get("job_title")
+        ]
+        if not rows:
+            return 0
+
+        with self._lock:
+            self._db.executemany(
+                f"INSERT INTO jobs ({', '.join(JOB_FIELDS)}, scraped_at) "
+                f"VALUES ({', '.join('?' * (len(JOB_FIELDS) + 1))}) "
+                "ON CONFLICT (apply_link) DO UPDATE SET "
+                "job_title = excluded.job_title, company = excluded.company, "
+                "experience = excluded.experience, jobNature = excluded.jobNature, "
+                "location = excluded.location, salary = excluded.salary, source = excluded.source, "
+                "description = COALESCE(excluded.description, jobs.description), "
+                "date_posted = COALESCE(jobs.date_posted, excluded.date_posted), "
+                "scraped_at = excluded.scraped_at",
+                rows,
+            )
+            self._db.commit()
+
+        self.stats["upserted"] += len(rows)
+        return len(rows)
+
+    def mark_crawled(self, source: str, query: str, location: Optional[str], depth: int = 0):
+        """
+        Record that a live scrape of (source, query, location) just finished
+
+        Args:
+            source: Source name
+            query: Position searched for
+            location: Location searched in
+            depth: Number of results the scrape asked for
+        """
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO crawls VALUES (?, ?, ?, ?, ?)",
+                (*crawl_key(source, query, location), depth, time.time()),
+            )
+            self._db.commit()
+
+    def is_fresh(self, source: str, query: str, location: Optional[str], depth: int = 0) -> bool:
+        """
+        Whether (source, query, location) was scraped, at least `depth` results deep,
+        within JOB_STORE_FRESH_SECONDS
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT depth, crawled_at FROM crawls WHERE source = ? AND query = ? AND location = ?",
+                crawl_key(source, query, location),
+            ).fetchone()
+
+        fresh = row is not None and row[0] >= depth and time.time() - row[1] < self.fresh_seconds
+        self.stats["fresh" if fresh else "stale"] += 1
+        return fresh
+
+    def search(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        sources: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Find stored jobs whose title matches any query word, best match first
+
+        Args:
+            query: Position being searched for
+            location: Only return jobs in this location (remote searches aren't filtered)
+            sources: Only return jobs from these sources
+            limit: Maximum number of jobs (defaults to JOB_STORE_SEARCH_LIMIT)
+
+        Returns:
+            Job dictionaries in scraper format, normalized like freshly scraped ones
+        """
+        title_terms = _match_terms(query)
+        if not title_terms:
+            return []
+
+        match = f"job_title : ({title_terms})"
+        city = canonical_location(location).split(",")[0]
+        if city and city != "remote":
+            match += f" AND location : ({_match_terms(city)})"
+
+        sql = (
+            f"SELECT {', '.join('jobs.' + field for field in JOB_FIELDS)} "
+            "FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid "
+            "WHERE jobs_fts MATCH ?"
+        )
+        params: list = [match]
+        if sources:
+            sql += f" AND jobs.source IN ({', '.join('?' * len(sources))})"
+            params.extend(sources)
+        sql += " ORDER BY bm25(jobs_fts) LIMIT ?"
+        params.append(limit or settings.JOB_STORE_SEARCH_LIMIT)
+
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+
+        self.stats["searches"] += 1
+        return [normalize_job({key: row[key] for key in row.keys() if row[key] is not None}) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_job_store: Optional[JobStore] = None
+_job_store_lock = threading.Lock()
+
+
+def get_job_store() -> Optional[JobStore]:
+    """
+    Return the app-wide job store, or None when the store is disabled
+    """
+    global _job_store
+    if not settings.JOB_STORE_ENABLED:
+        return None
+    with _job_store_lock:
+        if _job_store is None:
+            _job_store = JobStore()
+        return _job_store
+
+
+def close_job_store():
+    """
+    Close the app-wide job store if it was created
+    """
+    global _job_store
+    with _job_store_lock:
+        if _job_store is not None:
+            _job_store.close()
+            _job_store = None
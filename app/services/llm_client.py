@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.services.metrics import LLM_TOKENS
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = "You are a job matching AI assistant. You evaluate if jobs match search criteria."
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count (~4 characters per token for English text)
+    """
+    return len(text) // 4 + 1
+
+
+class LLMError(Exception):
+    """Raised when a chat completion fails after all retries"""
+
+
+class TokenBucket:
+    """
+    Async token bucket refilled continuously up to a per-minute capacity
+
+    A capacity of 0 or less disables the limit.
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = per_minute
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: int = 1):
+        if self.capacity <= 0:
+            return
+
+        # A single request larger than the bucket would otherwise wait forever
+        amount = min(amount, self.capacity)
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+class AsyncLLMClient:
+    """
+    Long-lived async client for an OpenAI-compatible chat completions endpoint
+
+    Calls share one pooled httpx connection, are bounded by a semaphore, pass
+    through request- and token-per-minute buckets, time out individually and
+    are retried with jittered exponential backoff on 429 and 5xx responses.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.model = model or settings.LLM_MODEL
+        self.timeout = timeout or settings.LLM_TIMEOUT
+        self.max_retries = settings.LLM_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_base = settings.LLM_BACKOFF_BASE if backoff_base is None else backoff_base
+
+        self._client = httpx.AsyncClient(
+            base_url=(base_url or settings.OPENAI_BASE_URL).rstrip("/"),
+            headers={"Authorization": f"Bearer {api_key or settings.OPENAI_API_KEY}"},
+            timeout=self.timeout,
+            transport=transport,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency or settings.LLM_MAX_CONCURRENCY)
+        self._request_bucket = TokenBucket(
+            settings.LLM_REQUESTS_PER_MINUTE if requests_per_minute is None else requests_per_minute
+        )
+        self._token_bucket = TokenBucket(
+            settings.LLM_TOKENS_PER_MINUTE if tokens_per_minute is None else tokens_per_minute
+        )
+
+        self.stats: Dict[str, int] = {
+            "calls": 0,
+            "retries": 0,
+            "failures": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+        }
+
+    async def chat(self, prompt: str, max_tokens: int, system_prompt: str = SYSTEM_PROMPT) -> str:
+        """
+        Send a single prompt and return the model's reply
+
+        Args:
+            prompt: User prompt
+            max_tokens: Completion token limit
+            system_prompt: System message
+
+        Returns:
+            Content of the model's reply
+
+        Raises:
+            LLMError: If the call still fails after all retries
+        """
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.1,
+        }
+        estimated_tokens = estimate_tokens(system_prompt + prompt) + max_tokens
+        last_error = ""
+
+        for attempt in range(self.max_retries + 1):
+            await self._request_bucket.acquire(1)
+            await self._token_bucket.acquire(estimated_tokens)
+
+            retry_after = None
+            async with self._semaphore:
+                self.stats["calls"] += 1
+                try:
+                    response = await asyncio.wait_for(
+                        self._client.post("/chat/completions", json=payload), timeout=self.timeout
+                    )
+                except (httpx.TransportError, asyncio.TimeoutError) as e:
+                    last_error = f"{type(e).__name__}: {str(e)}"
+                else:
+                    if response.status_code not in RETRYABLE_STATUS_CODES:
+                        if response.is_error:
+                            self.stats["failures"] += 1
+                            raise LLMError(f"Chat completion failed with HTTP {response.status_code}")
+                        return self._read_reply(response.json())
+
+                    last_error = f"HTTP {response.status_code}"
+                    retry_after = response.headers.get("retry-after")
+
+            if attempt == self.max_retries:
+                break
+
+            self.stats["retries"] += 1
+            delay = self._backoff_delay(attempt, retry_after)
+            logger.warning(f"LLM call failed ({last_error}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+        self.stats["failures"] += 1
+        raise LLMError(f"Chat completion failed after {self.max_retries + 1} attempts: {last_error}")
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        # Full jitter keeps concurrent retries from hitting the API in lockstep
+        return random.uniform(0, self.backoff_base * (2 ** attempt))
+
+    def _read_reply(self, data: Dict) -> str:
+        usage = data.get("usage") or {}
+        for kind in ("prompt", "completion"):
+            tokens = usage.get(f"{kind}_tokens", 0)
+            self.stats[f"{kind}_tokens"] += tokens
+            LLM_TOKENS.labels(kind).inc(tokens)
+        return data["choices"][0]["message"]["content"]
+
+    async def aclose(self):
+        await self._client.aclose()
+
+
+_llm_client: Optional[AsyncLLMClient] = None
+
+
+def get_llm_client() -> AsyncLLMClient:
+    """
+    Return the app-wide LLM client, creating it on first use
+    """
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = AsyncLLMClient()
+    return _llm_client
+
+
+async def close_llm_client():
+    """
+    Close the app-wide LLM client if it was created
+    """
+    global _llm_client
+    if _llm_client is not None:
+        await _llm_client.aclose()
+        _llm_client = None
@@ -0,0 +1,84 @@
+import time
+from contextlib import contextmanager
+from typing import Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+
+from app.services.tracing import span
+
+# Seconds; covers sub-millisecond parsing up to browser scrapes near the request budget
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+
+# Source label for stages that run over the jobs of every source at once
+ALL_SOURCES = "all"
+
+HTTP_REQUESTS = Counter(
+    "jobfinder_http_requests_total", "HTTP requests handled", ["method", "path", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "jobfinder_http_request_duration_seconds", "HTTP request latency", ["method", "path"], buckets=STAGE_BUCKETS
+)
+STAGE_LATENCY = Histogram(
+    "jobfinder_stage_duration_seconds",
+    "Time spent in each search stage (driver_acquire, page_load, parse, fetch, dedup, filter, serialize)",
+    ["stage", "source"],
+    buckets=STAGE_BUCKETS,
+)
+SOURCE_RESULTS = Counter(
+    "jobfinder_source_results_total", "Per-source outcomes of searches (ok, timeout, error, skipped)", ["source", "status"]
+)
+LLM_LATENCY = Histogram(
+    "jobfinder_llm_request_duration_seconds", "LLM relevance call latency", ["kind", "outcome"], buckets=STAGE_BUCKETS
+)
+LLM_TOKENS = Counter("jobfinder_llm_tokens_total", "Tokens reported by the LLM API", ["type"])
+CACHE_REQUESTS = Counter(
+    "jobfinder_cache_requests_total", "Cache lookups by cache and result (hit, stale, miss)", ["cache", "result"]
+)
+CASCADE_DECISIONS = Counter("jobfinder_cascade_decisions_total", "Jobs decided per filtering stage", ["stage"])
+CASCADE_LLM_FRACTION = Gauge("jobfinder_cascade_llm_fraction", "Fraction of filtered jobs that needed a live LLM call")
+SEARCHES_IN_PROGRESS = Gauge("jobfinder_searches_in_progress", "Searches currently gathering and filtering jobs")
+SCRAPES_IN_PROGRESS = Gauge("jobfinder_scrapes_in_progress", "Live scrapes currently running", ["source"])
+SEARCH_QUEUE_DEPTH = Gauge("jobfinder_search_queue_depth", "Async searches waiting for a worker")
+SINGLE_FLIGHT_CALLS = Counter(
+    "jobfinder_single_flight_calls_total",
+    "Calls per coalescing group (search, source) that ran the work (leader) or joined a run in flight (coalesced)",
+    ["flight", "result"],
+)
+
+
+@contextmanager
+def time_stage(stage: str, source: str = ALL_SOURCES):
+    """
+    Observe how long the with-block took as one sample of a stage's latency histogram
+
+    Inside a traced request the block is also recorded as a span named
+    "stage" or "stage.source".
+    """
+    started = time.perf_counter()
+    try:
+        with span(stage if source == ALL_SOURCES else f"{stage}.{source}"):
+            yield
+    finally:
+        STAGE_LATENCY.labels(stage, source).observe(time.perf_counter() - started)
+
+
+def record_cache(cache: str, hits: int = 0, misses: int = 0, stale: int = 0):
+    """
+    Count lookups in one of the caches (search, verdict, job_store)
+    """
+    if hits:
+        CACHE_REQUESTS.labels(cache, "hit").inc(hits)
+    if misses:
+        CACHE_REQUESTS.labels(cache, "miss").inc(misses)
+    if stale:
+        CACHE_REQUESTS.labels(cache, "stale").inc(stale)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Every metric in the Prometheus text exposition format
+
+    Returns:
+        (body, content type)
+    """
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
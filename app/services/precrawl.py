@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.services.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from app.services.search_cache import canonical_location, normalize_text
+
+logger = logging.getLogger(__name__)
+
+
+class QueryPopularity:
+    """
+    Decaying hit counts of (position, location) pairs seen in search traffic
+
+    Each decay() multiplies every count by a factor, so queries that stop
+    being searched drop out of the top-N over a few cycles.
+    """
+
+    def __init__(self, max_tracked: Optional[int] = None):
+        self.max_tracked = max_tracked or settings.PRECRAWL_MAX_TRACKED
+        # Canonical key -> [score, position, location] as last searched
+        self._queries: Dict[Tuple[str, str], list] = {}
+
+    def record(self, position: str, location: Optional[str]):
+        key = (normalize_text(position), canonical_location(location))
+        if not key[0]:
+            return
+
+        entry = self._queries.get(key)
+        if entry is None:
+            if len(self._queries) >= self.max_tracked:
+                # Make room by forgetting the least popular query
+                del self._queries[min(self._queries, key=lambda k: self._queries[k][0])]
+            entry = self._queries[key] = [0.0, position, location or ""]
+        entry[0] += 1
+        entry[1], entry[2] = position, location or ""
+
+    def top(self, n: int) -> List[Tuple[str, str]]:
+        """
+        The n most popular (position, location) pairs, most popular first
+        """
+        ranked = sorted(self._queries.values(), key=lambda entry: -entry[0])
+        return [(position, location) for _, position, location in ranked[:n]]
+
+    def decay(self, factor: float):
+        for key in list(self._queries):
+            self._queries[key][0] *= factor
+            if self._queries[key][0] < 0.01:
+                del self._queries[key]
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+
+class PrecrawlScheduler:
+    """
+    Periodically re-scrapes the most popular searches into the job store
+
+    Every PRECRAWL_INTERVAL seconds the top PRECRAWL_TOP_N (position, location)
+    pairs from /jobs/search traffic are crawled for each source whose store
+    entry is stale and whose circuit breaker is not open. Each source allows
+    PRECRAWL_SOURCE_CONCURRENCY crawls at a time, spaced at least
+    PRECRAWL_POLITENESS_SECONDS apart, and crawls wait while any foreground
+    search is scraping.
+    """
+
+    def __init__(
+        self,
+        job_service=None,
+        interval: Optional[float] = None,
+        top_n: Optional[int] = None,
+        source_concurrency: Optional[int] = None,
+        politeness: Optional[float] = None,
+    ):
+        self._job_service = job_service
+        self.interval = interval or settings.PRECRAWL_INTERVAL
+        self.top_n = top_n or settings.PRECRAWL_TOP_N
+        self.source_concurrency = source_concurrency or settings.PRECRAWL_SOURCE_CONCURRENCY
+        self.politeness = settings.PRECRAWL_POLITENESS_SECONDS if politeness is None else politeness
+
+        self.popularity = QueryPopularity()
+        self._source_slots: Dict[str, asyncio.Semaphore] = {}
+        self._source_next_at: Dict[str, float] = {}
+        self._foreground = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats: Dict[str, int] = {"cycles": 0, "crawled": 0, "skipped_fresh": 0, "skipped_open": 0, "errors": 0}
+
+    @property
+    def job_service(self):
+        if self._job_service is None:
+            # Imported here because the job service reports foreground searches to this module
+            from app.services.container import get_service_container
+            self._job_service = get_service_container().job_service
+        return self._job_service
+
+    def record(self, request: JobSearchRequest):
+        """
+        Count a search towards its query's popularity
+        """
+        self.popularity.record(request.position, request.location)
+
+    @contextmanager
+    def foreground(self):
+        """
+        Mark a user-facing search as running; background crawls wait until none are
+        """
+        self._foreground += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._foreground -= 1
+            if self._foreground == 0:
+                self._idle.set()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Pre-crawl scheduler started (every {self.interval}s, top {self.top_n} queries)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Error in pre-crawl cycle: {str(e)}")
+
+    async def run_once(self) -> int:
+        """
+        Crawl the current top queries once
+
+        Returns:
+            Number of (source, query) crawls performed
+        """
+        queries = self.popularity.top(self.top_n)
+        self.popularity.decay(settings.PRECRAWL_DECAY)
+        self.stats["cycles"] += 1
+
+        service = self.job_service
+        store = service.job_store
+        if not queries or store is None:
+            return 0
+
+        pairs = [
+            (source, scraper, position, location)
+            for position, location in queries
+            for source, scraper in service.scrapers.items()
+        ]
+        # One trip to a worker thread for all the crawls table lookups, off the event loop
+        fresh = await asyncio.get_running_loop().run_in_executor(
+            None,
+            lambda: [
+                store.is_fresh(source, position, location, settings.SCRAPER_MAX_RESULTS)
+                for source, _, position, location in pairs
+            ],
+        )
+
+        crawls = []
+        for (source, scraper, position, location), is_fresh in zip(pairs, fresh):
+            if is_fresh:
+                self.stats["skipped_fresh"] += 1
+            elif get_circuit_breaker(source).state == CircuitBreaker.OPEN:
+                self.stats["skipped_open"] += 1
+            else:
+                crawls.append(self._crawl(source, scraper, position, location))
+
+        results = await asyncio.gather(*crawls)
+        crawled = sum(results)
+        logger.info(f"Pre-crawled {crawled} of {len(crawls)} stale (source, query) pairs")
+        return crawled
+
+    async def _crawl(self, source: str, scraper, position: str, location: str) -> bool:
+        slots = self._source_slots.setdefault(source, asyncio.Semaphore(self.source_concurrency))
+        async with slots:
+            await self._idle.wait()
+
+            # Space requests to the same source at least `politeness` seconds apart
+            delay = self._source_next_at.get(source, 0.0) - time.monotonic()
+            self._source_next_at[source] = time.monotonic() + max(delay, 0.0) + self.politeness
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._idle.wait()
+
+            try:
+                await self.job_service.scrape_source(source, scraper, position, location)
+                self.stats["crawled"] += 1
+                return True
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"Error pre-crawling {source} for {position}: {str(e)}")
+                return False
+
+
+_scheduler: Optional[PrecrawlScheduler] = None
+
+
+def get_precrawl_scheduler() -> PrecrawlScheduler:
+    """
+    Return the app-wide pre-crawl scheduler, creating it on first use
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = PrecrawlScheduler()
+    return _scheduler
+
+
+async def shutdown_precrawl_scheduler():
+    """
+    Stop the background crawl loop and drop the app-wide scheduler
+    """
+    global _scheduler
+    if _scheduler is not None:
+        await _scheduler.stop()
+        _scheduler = None
@@ -0,0 +1,224 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Numeric fields normalize_job adds to a job, derived from its free-text field
+SALARY_FIELDS = ("salary_min", "salary_max", "salary_currency", "salary_period")
+EXPERIENCE_FIELDS = ("experience_min", "experience_max")
+DERIVED_FIELDS = {"salary": SALARY_FIELDS, "experience": EXPERIENCE_FIELDS}
+
+AMOUNT_PATTERN = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(k|m|mn|million|lakhs?|lacs?)?\b", re.IGNORECASE)
+AMOUNT_MULTIPLIERS = {
+    "k": 1e3, "m": 1e6, "mn": 1e6, "million": 1e6, "lakh": 1e5, "lakhs": 1e5, "lac": 1e5, "lacs": 1e5,
+}
+
+# Checked in order; bare "Rs" and "rupees" are taken as PKR
+CURRENCY_PATTERNS = [
+    ("INR", re.compile(r"\binr\b|₹", re.IGNORECASE)),
+    ("PKR", re.compile(r"\bpkr\b|\brs\b|\brupees?\b", re.IGNORECASE)),
+    ("USD", re.compile(r"\busd\b|\$", re.IGNORECASE)),
+    ("EUR", re.compile(r"\beur\b|€", re.IGNORECASE)),
+    ("GBP", re.compile(r"\bgbp\b|£", re.IGNORECASE)),
+    ("AED", re.compile(r"\baed\b", re.IGNORECASE)),
+    ("SAR", re.compile(r"\bsar\b", re.IGNORECASE)),
+]
+
+PERIOD_PATTERNS = [
+    ("hour", re.compile(r"hour|\bhr\b|\bph\b", re.IGNORECASE)),
+    ("day", re.compile(r"\bday\b|daily", re.IGNORECASE)),
+    ("week", re.compile(r"week", re.IGNORECASE)),
+    ("month", re.compile(r"month|\bmo\b|\bpm\b|\bp\.m\b", re.IGNORECASE)),
+    ("year", re.compile(r"year|annum|annual|\byr\b|\bpa\b|\bp\.a\b", re.IGNORECASE)),
+]
+
+# Paid periods per year, for comparing salaries quoted per different periods
+PERIODS_PER_YEAR = {"hour": 2080.0, "day": 260.0, "week": 52.0, "month": 12.0, "year": 1.0}
+
+NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+UPPER_BOUND_PATTERN = re.compile(r"up\s*to|less than|under|below|\bmax", re.IGNORECASE)
+LOWER_BOUND_PATTERN = re.compile(r"\+|at least|more than|over|above|from|\bmin", re.IGNORECASE)
+ENTRY_LEVEL_PATTERN = re.compile(r"fresh|entry|graduate|intern|no experience|junior", re.IGNORECASE)
+
+
+class SalaryRange(NamedTuple):
+    low: float
+    high: Optional[float]  # None when open-ended ("80,000+")
+    currency: Optional[str]
+    period: Optional[str]
+
+
+class ExperienceRange(NamedTuple):
+    low: float
+    high: Optional[float]  # None when open-ended ("2+ years")
+
+
+def _bounds(values: Sequence[float], text: str) -> Tuple[float, Optional[float]]:
+    if len(values) > 1:
+        return min(values), max(values)
+    if UPPER_BOUND_PATTERN.search(text):
+        return 0.0, values[0]
+    if LOWER_BOUND_PATTERN.search(text):
+        return values[0], None
+    return values[0], values[0]
+
+
+@lru_cache(maxsize=4096)
+def parse_salary(text: Optional[str]) -> Optional[SalaryRange]:
+    """
+    Parse a salary string like "80,000 - 110,000 PKR", "$45/hr" or "1.5 lakh per month"
+
+    Args:
+        text: Salary text from a posting or a search request
+
+    Returns:
+        The salary range, or None if the text holds no amount ("Not specified")
+    """
+    if not text:
+        return None
+
+    period = next((name for name, pattern in PERIOD_PATTERNS if pattern.search(text)), None)
+    # Small numbers in yearly or monthly salaries are noise ("2 years", "5 days a week")
+    floor = 1.0 if period in ("hour", "day") else 1000.0
+
+    amounts = []
+    for number, unit in AMOUNT_PATTERN.findall(text):
+        value = float(number.replace(",", "")) * AMOUNT_MULTIPLIERS.get(unit.lower(), 1.0)
+        if value >= floor:
+            amounts.append(value)
+    if not amounts:
+        return None
+
+    currency = next((name for name, pattern in CURRENCY_PATTERNS if pattern.search(text)), None)
+    return SalaryRange(*_bounds(amounts, text), currency, period)
+
+
+@lru_cache(maxsize=4096)
+def parse_experience(text: Optional[str]) -> Optional[ExperienceRange]:
+    """
+    Parse an experience string like "2-3 years", "2+ years", "6 months" or "Entry level" into years
+
+    Args:
+        text: Experience text from a posting or a search request
+
+    Returns:
+        The experience range in years, or None if the text says nothing usable ("Not specified")
+    """
+    if not text:
+        return None
+
+    years = [float(number) for number in NUMBER_PATTERN.findall(text)]
+    years = [value for value in years if value <= 50][:2]
+    if not years:
+        return ExperienceRange(0.0, 1.0) if ENTRY_LEVEL_PATTERN.search(text) else None
+
+    if "month" in text.lower() and "year" not in text.lower():
+        years = [value / 12 for value in years]
+    return ExperienceRange(*_bounds(years, text))
+
+
+def normalize_job(job: Dict) -> Dict:
+    """
+    Add numeric salary and experience fields parsed from a job's free text
+
+    Sets salary_min, salary_max, salary_currency and salary_period, and
+    experience_min and experience_max (years). Fields that could not be parsed
+    are None; a None maximum with a minimum set means open-ended.
+
+    Args:
+        job: Job dictionary, updated in place
+
+    Returns:
+        The same job dictionary
+    """
+    salary = parse_salary(job.get("salary"))
+    job.update(zip(SALARY_FIELDS, salary if salary else (None,) * len(SALARY_FIELDS)))
+
+    experience = parse_experience(job.get("experience"))
+    job.update(zip(EXPERIENCE_FIELDS, experience if experience else (None,) * len(EXPERIENCE_FIELDS)))
+    return job
+
+
+def _normalized(jobs: Sequence[Dict], field: str) -> List[Dict]:
+    # Jobs that skipped the scrapers' normalization (e.g. cached before it existed) are parsed on the fly
+    return [job if field in job else normalize_job(dict(job)) for job in jobs]
+
+
+def _range_arrays(jobs: Sequence[Dict], low_field: str, high_field: str) -> Tuple["np.ndarray", "np.ndarray"]:
+    # Unparsed bounds become NaN, which never compares as a mismatch; open maxima become inf
+    lows = np.array([job[low_field] for job in jobs], dtype=np.float64)
+    highs = np.array([job[high_field] for job in jobs], dtype=np.float64)
+    highs[np.isnan(highs) & ~np.isnan(lows)] = np.inf
+    return lows, highs
+
+
+def ranges_overlap(
+    lows: "np.ndarray", highs: "np.ndarray", low: float, high: Optional[float]
+) -> "np.ndarray":
+    """
+    Whether each [lows[i], highs[i]] overlaps [low, high]; NaN bounds count as overlapping
+
+    Returns:
+        Boolean array, one entry per range
+    """
+    high = np.inf if high is None else high
+    return ~((highs < low) | (lows > high))
+
+
+def salary_overlap(jobs: Sequence[Dict], wanted: Optional[SalaryRange]) -> "np.ndarray":
+    """
+    Whether each job's salary range could meet the wanted one
+
+    Salaries quoted per different periods are compared per the wanted period.
+    Jobs without a salary, or paying in another currency, are not treated as
+    a mismatch.
+
+    Args:
+        jobs: Job dictionaries
+        wanted: Salary range from the search request
+
+    Returns:
+        Boolean array, False where the ranges do not overlap
+    """
+    if wanted is None or not jobs:
+        return np.ones(len(jobs), dtype=bool)
+
+    jobs = _normalized(jobs, "salary_min")
+    lows, highs = _range_arrays(jobs, "salary_min", "salary_max")
+
+    if wanted.period:
+        per_year = np.array(
+            [PERIODS_PER_YEAR.get(job["salary_period"], np.nan) for job in jobs], dtype=np.float64
+        )
+        scale = np.where(np.isnan(per_year), 1.0, per_year / PERIODS_PER_YEAR[wanted.period])
+        lows, highs = lows * scale, highs * scale
+
+    overlap = ranges_overlap(lows, highs, wanted.low, wanted.high)
+    if wanted.currency:
+        currencies = np.array([job["salary_currency"] or wanted.currency for job in jobs], dtype=object)
+        overlap |= currencies != wanted.currency
+    return overlap
+
+
+def experience_overlap(jobs: Sequence[Dict], wanted: Optional[ExperienceRange]) -> "np.ndarray":
+    """
+    Whether the searcher's experience meets each job's requirement
+
+    Only the job's minimum counts: a posting asking for "1 year" or "1-3 years"
+    doesn't rule out someone with more.
+
+    Args:
+        jobs: Job dictionaries
+        wanted: Experience range from the search request
+
+    Returns:
+        Boolean array, False where the job asks for more experience than the searcher has
+    """
+    if wanted is None or not jobs:
+        return np.ones(len(jobs), dtype=bool)
+
+    lows, _ = _range_arrays(_normalized(jobs, "experience_min"), "experience_min", "experience_max")
+    return ranges_overlap(lows, np.full_like(lows, np.inf), wanted.low, wanted.high)
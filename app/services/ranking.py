@@ -0,0 +1,215 @@
+import logging
+import re
+import string
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.utils.lazy import lazy_import
+
+# numpy is imported on first use, so workers that only serve cached results never load it
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9]+)*")
+
+# Marks document boundaries in the joined batch; survives translation and split
+_DOC_BREAK = "\x01"
+
+# Maps ASCII punctuation to spaces so a whole batch can be tokenized with str.split
+_TOKEN_CHARS = set(string.ascii_lowercase + string.digits + "+#." + _DOC_BREAK)
+_SEPARATOR_TABLE = str.maketrans({chr(c): " " for c in range(128) if chr(c) not in _TOKEN_CHARS})
+
+# Byte id of tokens outside the query vocabulary; the one below it marks a document break
+_NO_TERM = 255
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Lowercase word tokens; keeps names like "node.js", "c++" and "c#" intact
+    """
+    return TOKEN_PATTERN.findall((text or "").lower())
+
+
+def query_terms(request: JobSearchRequest) -> Dict[str, float]:
+    """
+    Weighted query terms for a search: position words plus skill words
+
+    Args:
+        request: Job search request
+
+    Returns:
+        Mapping of term to weight
+    """
+    terms: Dict[str, float] = {}
+    for term in tokenize(request.skills.replace(",", " ")):
+        terms[term] = settings.RANKING_SKILL_WEIGHT
+    for term in tokenize(request.position):
+        terms[term] = 1.0
+    return terms
+
+
+def job_texts(jobs: Sequence[Dict]) -> List[str]:
+    """
+    Text each job is ranked on: its title, plus the description when scraped
+    """
+    return [
+        f"{job['job_title']} {job['description']}" if job.get("description") else job["job_title"]
+        for job in jobs
+    ]
+
+
+class BM25Ranker:
+    """
+    Vectorized BM25 scoring of a batch of jobs against one or more queries
+
+    The whole batch is joined and tokenized in one pass; term frequencies for
+    the query vocabulary land in a (jobs x terms) matrix and every query is
+    scored with one matrix product.
+    """
+
+    def __init__(self, k1: Optional[float] = None, b: Optional[float] = None):
+        self.k1 = settings.RANKING_BM25_K1 if k1 is None else k1
+        self.b = settings.RANKING_BM25_B if b is None else b
+
+    def term_frequencies(self, texts: Sequence[str], vocabulary: List[str]) -> "np.ndarray":
+        """
+        Count occurrences of each vocabulary term in each text
+
+        Args:
+            texts: Documents
+            vocabulary: Lowercase terms
+
+        Returns:
+            Array of shape (len(texts), len(vocabulary))
+        """
+        if not texts or not vocabulary:
+            return np.zeros((len(texts), len(vocabulary)), dtype=np.float32)
+
+        # Results pages repeat the same titles many times over; count each distinct text once
+        distinct = dict.fromkeys(texts)
+        if len(distinct) < len(texts):
+            row_of = {text: row for row, text in enumerate(distinct)}
+            rows = np.fromiter(map(row_of.__getitem__, texts), dtype=np.intp, count=len(texts))
+            return self.term_frequencies(list(distinct), vocabulary)[rows]
+
+        tf = np.zeros((len(texts), len(vocabulary)), dtype=np.float32)
+        # Plurals and sentence-final periods count as the bare term; ids are packed
+        # one byte per token when the vocabulary fits, which maps tokens fastest
+        small = len(vocabulary) < _NO_TERM - 1
+        doc_break, no_term = (_NO_TERM - 1, _NO_TERM) if small else (-2, -1)
+        term_ids = {_DOC_BREAK: doc_break}
+        for i, term in enumerate(vocabulary):
+            for variant in (term, term + "s", term + "es"):
+                term_ids.setdefault(variant, i)
+                term_ids.setdefault(variant + ".", i)
+
+        # Tokenize the whole batch in a few C-level passes instead of per job
+        corpus = f" {_DOC_BREAK} ".join(texts).lower().translate(_SEPARATOR_TABLE)
+        tokens = corpus.split()
+        if small:
+            token_ids = np.frombuffer(bytes(map(term_ids.get, tokens, repeat(no_term))), dtype=np.uint8)
+        else:
+            token_ids = np.fromiter(map(term_ids.get, tokens, repeat(no_term)), dtype=np.int64, count=len(tokens))
+
+        doc_ids = np.cumsum(token_ids == doc_break)
+        matched = token_ids < len(vocabulary) if small else token_ids >= 0
+        cells = doc_ids[matched] * len(vocabulary) + token_ids[matched]
+        tf += np.bincount(cells, minlength=tf.size).reshape(tf.shape)
+
+        return tf
+
+    def score_many(self, texts: Sequence[str], queries: Sequence[Dict[str, float]]) -> "np.ndarray":
+        """
+        Score every text against every query
+
+        Args:
+            texts: Documents to score
+            queries: Weighted query terms, one mapping per query
+
+        Returns:
+            Array of shape (len(texts), len(queries))
+        """
+        vocabulary = sorted({term for query in queries for term in query})
+        tf = self.term_frequencies(texts, vocabulary)
+        if not len(texts) or not vocabulary:
+            return np.zeros((len(texts), len(queries)), dtype=np.float32)
+
+        # Character length is proportional to token count, which is all BM25 needs
+        lengths = np.fromiter(map(len, texts), dtype=np.float32, count=len(texts))
+        norm = self.k1 * (1 - self.b + self.b * lengths / max(lengths.mean(), 1.0))
+
+        doc_freq = (tf > 0).sum(axis=0)
+        idf = np.log1p((len(texts) - doc_freq + 0.5) / (doc_freq + 0.5))
+
+        saturated = tf * (self.k1 + 1) / (tf + norm[:, None])
+
+        weights = np.zeros((len(vocabulary), len(queries)), dtype=np.float32)
+        term_ids = {term: i for i, term in enumerate(vocabulary)}
+        for column, query in enumerate(queries):
+            for term, weight in query.items():
+                weights[term_ids[term], column] = weight
+
+        return saturated @ (weights * idf[:, None])
+
+    def score(self, texts: Sequence[str], query: Dict[str, float]) -> "np.ndarray":
+        """
+        Score every text against one query
+        """
+        return self.score_many(texts, [query])[:, 0]
+
+    def rank(self, jobs: List[Dict], request: JobSearchRequest, min_score: Optional[float] = None) -> List[Dict]:
+        """
+        Rank jobs for a search request, best first
+
+        Args:
+            jobs: List of job dictionaries
+            request: Job search request
+            min_score: Jobs scoring at or below this are dropped (defaults to RANKING_MIN_SCORE)
+
+        Returns:
+            The kept jobs, best match first
+        """
+        return self.rank_many([jobs], [request], min_score)[0]
+
+    def rank_many(
+        self, job_lists: Sequence[List[Dict]], requests: Sequence[JobSearchRequest], min_score: Optional[float] = None
+    ) -> List[List[Dict]]:
+        """
+        Rank several job lists, each for its own search request, in one scoring pass
+
+        Every job is scored against every request's query in a single matrix
+        product, so IDF is computed over all the lists together. A list passed
+        for several requests (the same object) is tokenized once.
+
+        Args:
+            job_lists: One list of job dictionaries per request
+            requests: Job search requests
+            min_score: Jobs scoring at or below this are dropped (defaults to RANKING_MIN_SCORE)
+
+        Returns:
+            The kept jobs of each list, best match first
+        """
+        min_score = settings.RANKING_MIN_SCORE if min_score is None else min_score
+
+        offsets: Dict[int, int] = {}
+        texts: List[str] = []
+        for jobs in job_lists:
+            if id(jobs) not in offsets:
+                offsets[id(jobs)] = len(texts)
+                texts.extend(job_texts(jobs))
+        if not texts:
+            return [[] for _ in job_lists]
+
+        scores = self.score_many(texts, [query_terms(request) for request in requests])
+
+        ranked = []
+        for column, jobs in enumerate(job_lists):
+            start = offsets[id(jobs)]
+            job_scores = scores[start:start + len(jobs), column]
+            order = np.argsort(-job_scores, kind="stable")
+            order = order[job_scores[order] > min_score]
+            ranked.append([jobs[i] for i in order.tolist()])
+        return ranked
@@ -1,10 +1,21 @@
 import os
+import json
+import asyncio
 import logging
-from typing import List, Dict
-import openai
+import time
+from typing import List, Dict, Optional, Tuple
 
 from app.core.config import settings
 from app.schemas.job import JobSearchRequest
+from app.services.llm_client import AsyncLLMClient, SYSTEM_PROMPT, estimate_tokens, get_llm_client
+from app.services.verdict_cache import VerdictCache, criteria_hash, get_verdict_cache, job_fingerprint
+from app.services.ranking import BM25Ranker
+from app.services.metrics import CASCADE_DECISIONS, CASCADE_LLM_FRACTION, LLM_LATENCY, record_cache
+from app.services.tracing import span
+from app.services.cascade import (
+    LocalScorer, cascade_stats, STAGE_LEXICAL, STAGE_LEXICAL_ACCEPT, STAGE_LEXICAL_REJECT,
+    STAGE_LLM, STAGE_LLM_CACHE, STAGE_LLM_ERROR, STAGE_LLM_TIMEOUT
+)
 
 logger = logging.getLogger(__name__)
 
@@ -13,15 +24,22 @@ class RelevanceFilter:
     Filter jobs for relevance based on user search criteria using LLM
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        llm_client: Optional[AsyncLLMClient] = None,
+        verdict_cache: Optional[VerdictCache] = None,
+    ):
         self.openai_api_key = settings.OPENAI_API_KEY
+        self._llm_client = llm_client
+        self._verdict_cache = verdict_cache
+        self.ranker = BM25Ranker()
+        self.local_scorer = LocalScorer(self.ranker)
         
         if not self.openai_api_key:
             logger.warning("OpenAI API key not found. Relevance filtering will be limited.")
             self.use_openai = False
         else:
             self.use_openai = True
-            openai.api_key = self.openai_api_key
     
     def filter_jobs(self, jobs: List[Dict], request: JobSearchRequest) -> List[Dict]:
         """
@@ -45,11 +63,10 @@ class RelevanceFilter:
                 return self._basic_filtering(jobs, request)
             
             # Use LLM for relevance filtering
-            relevant_jobs = []
-            
-            for job in jobs:
-                if self._is_job_relevant_llm(job, request):
-                    relevant_jobs.append(job)
+            if settings.LLM_BATCH_ENABLED:
+                relevant_jobs = self._filter_jobs_batched(jobs, request)
+            else:
+                relevant_jobs = [job for job in jobs if self._is_job_relevant_llm(job, request)]
             
             logger.info(f"Found {len(relevant_jobs)} relevant jobs out of {len(jobs)}")
             return relevant_jobs
@@ -59,6 +76,280 @@ class RelevanceFilter:
             # Return all jobs if filtering fails
             return jobs
     
+    async def filter_jobs_async(
+        self, jobs: List[Dict], request: JobSearchRequest, timeout: Optional[float] = None
+    ) -> List[Dict]:
+        """
+        Filter jobs based on relevance without blocking the event loop
+        
+        Runs a cheap-first cascade: a local score (lexical match plus location,
+        job nature and salary rules) accepts jobs at or above
+        CASCADE_ACCEPT_THRESHOLD and rejects jobs below CASCADE_REJECT_THRESHOLD.
+        Only the band in between goes to the LLM, via the verdict cache and then
+        concurrent batches through the shared async LLM client.
+        
+        Each returned job is a copy carrying "decided_by" (the stage that kept
+        it) and "relevance_score" (its local score).
+        
+        Args:
+            jobs: List of job dictionaries
+            request: Job search request
+            timeout: Seconds to wait for the LLM stage; jobs still undecided
+                after that are kept as "llm_timeout"
+            
+        Returns:
+            List of relevant job dictionaries, best local score first
+        """
+        return (await self.filter_jobs_many([(jobs, request)], timeout))[0]
+    
+    async def filter_jobs_many(
+        self, searches: List[Tuple[List[Dict], JobSearchRequest]], timeout: Optional[float] = None
+    ) -> List[List[Dict]]:
+        """
+        Filter the candidate jobs of several searches in one pass
+        
+        Each search goes through the same cascade as filter_jobs_async, but the
+        jobs all of them leave ambiguous share one LLM stage: every batch of
+        every search is sent concurrently, and a posting is evaluated once per
+        distinct set of criteria however many searches hold it. Without an LLM,
+        all searches are ranked with a single BM25 scoring pass.
+        
+        Args:
+            searches: (jobs, request) pairs; searches may share the same jobs list
+            timeout: Seconds to wait for the shared LLM stage
+            
+        Returns:
+            The relevant jobs of each search, in the order of searches
+        """
+        results: List[List[Dict]] = [[] for _ in searches]
+        active = [i for i, (jobs, _) in enumerate(searches) if jobs]
+        if not active:
+            return results
+        
+        logger.info(f"Filtering {sum(len(searches[i][0]) for i in active)} jobs for relevance")
+        
+        try:
+            # If OpenAI API key is not available, use basic filtering
+            if not self.use_openai:
+                ranked = self.ranker.rank_many([searches[i][0] for i in active], [searches[i][1] for i in active])
+                for i, relevant_jobs in zip(active, ranked):
+                    self._record_stages([STAGE_LEXICAL] * len(searches[i][0]))
+                    results[i] = [dict(job, decided_by=STAGE_LEXICAL) for job in relevant_jobs]
+                return results
+            
+            scored = []
+            for i in active:
+                jobs, request = searches[i]
+                scores = self.local_scorer.score(jobs, request)
+                stages = [None] * len(jobs)
+                
+                if settings.CASCADE_ENABLED:
+                    for j, score in enumerate(scores.tolist()):
+                        if score >= settings.CASCADE_ACCEPT_THRESHOLD:
+                            stages[j] = STAGE_LEXICAL_ACCEPT
+                        elif score < settings.CASCADE_REJECT_THRESHOLD:
+                            stages[j] = STAGE_LEXICAL_REJECT
+                
+                scored.append((i, scores, stages, [j for j, stage in enumerate(stages) if stage is None]))
+            
+            ambiguous_total = sum(len(ambiguous) for _, _, _, ambiguous in scored)
+            try:
+                verdict_lists = await asyncio.wait_for(
+                    self._llm_verdicts_many([
+                        ([searches[i][0][j] for j in ambiguous], searches[i][1]) for i, _, _, ambiguous in scored
+                    ]),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"LLM stage exceeded its {timeout:.1f}s budget, keeping {ambiguous_total} undecided jobs")
+                verdict_lists = []
+                for _, _, stages, ambiguous in scored:
+                    verdict_lists.append(([None] * len(ambiguous), [False] * len(ambiguous)))
+                    for j in ambiguous:
+                        stages[j] = STAGE_LLM_TIMEOUT
+            
+            for (i, scores, stages, ambiguous), (verdicts, from_cache) in zip(scored, verdict_lists):
+                jobs = searches[i][0]
+                kept = set(j for j, stage in enumerate(stages) if stage == STAGE_LEXICAL_ACCEPT)
+                for j, is_relevant, cached in zip(ambiguous, verdicts, from_cache):
+                    if is_relevant is None:
+                        # Jobs the LLM couldn't evaluate (or didn't in time) are kept, as in the sync path
+                        stages[j] = stages[j] or STAGE_LLM_ERROR
+                    else:
+                        stages[j] = STAGE_LLM_CACHE if cached else STAGE_LLM
+                    if is_relevant is not False:
+                        kept.add(j)
+                
+                self._record_stages(stages)
+                order = sorted(kept, key=lambda j: -scores[j])
+                results[i] = [
+                    dict(jobs[j], decided_by=stages[j], relevance_score=round(float(scores[j]), 3))
+                    for j in order
+                ]
+            
+            total = sum(len(searches[i][0]) for i in active)
+            logger.info(
+                f"Cascade decided {total - ambiguous_total} jobs locally, sent {ambiguous_total} "
+                f"to LLM stage ({cascade_stats.llm_fraction():.0%} of all jobs reached the LLM so far)"
+            )
+            logger.info(f"Found {sum(map(len, results))} relevant jobs out of {total}")
+            return results
+        
+        except Exception as e:
+            logger.error(f"Error filtering jobs for relevance: {str(e)}")
+            # Return all jobs if filtering fails
+            return [jobs for jobs, _ in searches]
+    
+    @staticmethod
+    def _record_stages(stages: List[str]):
+        cascade_stats.record(stages)
+        for stage in set(stages):
+            CASCADE_DECISIONS.labels(stage).inc(stages.count(stage))
+        CASCADE_LLM_FRACTION.set(cascade_stats.llm_fraction())
+    
+    @property
+    def llm_client(self) -> AsyncLLMClient:
+        return self._llm_client or get_llm_client()
+    
+    @property
+    def verdict_cache(self) -> Optional[VerdictCache]:
+        return self._verdict_cache or get_verdict_cache()
+    
+    async def _llm_verdicts_async(
+        self, jobs: List[Dict], request: JobSearchRequest
+    ) -> Tuple[List[Optional[bool]], List[bool]]:
+        """
+        Get an LLM verdict for every job, consulting the verdict cache first
+        
+        Args:
+            jobs: List of job dictionaries
+            request: Job search request
+            
+        Returns:
+            (verdicts, from_cache): one verdict per job in input order (None where
+            the LLM call failed) and whether each verdict came from the cache
+        """
+        return (await self._llm_verdicts_many([(jobs, request)]))[0]
+    
+    async def _llm_verdicts_many(
+        self, searches: List[Tuple[List[Dict], JobSearchRequest]]
+    ) -> List[Tuple[List[Optional[bool]], List[bool]]]:
+        """
+        _llm_verdicts_async for several searches, with all their LLM batches sent concurrently
+        
+        Returns:
+            (verdicts, from_cache) per search
+        """
+        cache = self.verdict_cache
+        lookups = []
+        # Identical postings (same fingerprint) are only sent once per criteria
+        pending: Dict[Tuple[str, str], Tuple[Dict, JobSearchRequest]] = {}
+        for jobs, request in searches:
+            criteria_key = criteria_hash(request)
+            job_keys = [job_fingerprint(job) for job in jobs]
+            cached = await cache.get_many_async(criteria_key, job_keys) if cache and jobs else {}
+            if cache and jobs:
+                record_cache("verdict", hits=len(cached), misses=len(set(job_keys)) - len(cached))
+            for job, job_key in zip(jobs, job_keys):
+                if job_key not in cached:
+                    pending.setdefault((criteria_key, job_key), (job, request))
+            lookups.append((criteria_key, job_keys, cached))
+        
+        fresh: Dict[Tuple[str, str], Optional[bool]] = {}
+        if pending:
+            # A batch prompt states one set of criteria, so batches are formed per criteria
+            by_criteria: Dict[str, List[Tuple[str, Dict, JobSearchRequest]]] = {}
+            for (criteria_key, job_key), (job, request) in pending.items():
+                by_criteria.setdefault(criteria_key, []).append((job_key, job, request))
+            
+            plans = []
+            for criteria_key, items in by_criteria.items():
+                pending_jobs = [job for _, job, _ in items]
+                if settings.LLM_BATCH_ENABLED:
+                    chunks = self._chunk_jobs(pending_jobs)
+                else:
+                    chunks = [[job] for job in pending_jobs]
+                plans.append((criteria_key, items, chunks))
+            
+            chunk_verdicts = iter(await asyncio.gather(*[
+                self._evaluate_chunk_async(chunk, items[0][2]) for _, items, chunks in plans for chunk in chunks
+            ]))
+            for criteria_key, items, chunks in plans:
+                verdicts = [v for _ in chunks for v in next(chunk_verdicts)]
+                criteria_fresh = {job_key: v for (job_key, _, _), v in zip(items, verdicts)}
+                fresh.update({(criteria_key, job_key): v for job_key, v in criteria_fresh.items()})
+                if cache:
+                    await cache.set_many_async(
+                        criteria_key, {key: v for key, v in criteria_fresh.items() if v is not None}
+                    )
+            
+            cached_count = sum(len(cached) for _, _, cached in lookups)
+            logger.info(f"Verdict cache: {cached_count} cached, {len(pending)} sent to LLM")
+        
+        return [
+            (
+                [cached[key] if key in cached else fresh[(criteria_key, key)] for key in job_keys],
+                [key in cached for key in job_keys],
+            )
+            for criteria_key, job_keys, cached in lookups
+        ]
+    
+    async def _evaluate_chunk_async(self, jobs: List[Dict], request: JobSearchRequest) -> List[Optional[bool]]:
+        """
+        Evaluate a batch with one LLM call, falling back to concurrent per-job calls
+        """
+        if len(jobs) > 1:
+            verdicts = await self._evaluate_batch_llm_async(jobs, request)
+            if verdicts is not None:
+                return verdicts
+            logger.warning(f"Falling back to per-job evaluation for a batch of {len(jobs)} jobs")
+        
+        return list(await asyncio.gather(*[self._is_job_relevant_llm_async(job, request) for job in jobs]))
+    
+    async def _evaluate_batch_llm_async(self, jobs: List[Dict], request: JobSearchRequest) -> Optional[List[bool]]:
+        """
+        Async counterpart of _evaluate_batch_llm
+        """
+        try:
+            prompt = self._build_batch_prompt(jobs, request)
+            reply = await self._chat_async(prompt, 12 * len(jobs) + 20, kind="batch")
+            return self._parse_batch_verdicts(reply, len(jobs))
+        except Exception as e:
+            logger.error(f"Error evaluating job batch with LLM: {str(e)}")
+            return None
+    
+    async def _chat_async(self, prompt: str, max_tokens: int, kind: str) -> str:
+        """
+        Send a prompt through the shared LLM client, recording the call's latency and outcome
+        """
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            with span(f"llm_{kind}", max_tokens=max_tokens):
+                reply = await self.llm_client.chat(prompt, max_tokens=max_tokens)
+            outcome = "ok"
+            return reply
+        finally:
+            LLM_LATENCY.labels(kind, outcome).observe(time.perf_counter() - started)
+    
+    async def _is_job_relevant_llm_async(self, job: Dict, request: JobSearchRequest) -> Optional[bool]:
+        """
+        Async counterpart of _is_job_relevant_llm
+        
+        Returns None instead of True when the LLM call fails, so callers can keep
+        the job without caching the guess.
+        """
+        try:
+            answer = await self._chat_async(self._build_job_prompt(job, request), 10, kind="single")
+            is_relevant = answer.strip().upper() == "YES"
+            
+            logger.debug(f"Job relevance for '{job['job_title']}': {is_relevant}")
+            return is_relevant
+        
+        except Exception as e:
+            logger.error(f"Error determining job relevance with LLM: {str(e)}")
+            return None
+    
     def _is_job_relevant_llm(self, job: Dict, request: JobSearchRequest) -> bool:
         """
         Use OpenAI to determine if a job is relevant to the search criteria
@@ -71,8 +362,24 @@ class RelevanceFilter:
             True if job is relevant, False otherwise
         """
         try:
-            # Create the prompt directly without using LangChain's PromptTemplate
-            prompt = f"""
+            # Get response from OpenAI
+            answer = self._chat_completion(self._build_job_prompt(job, request), max_tokens=10).strip().upper()
+            is_relevant = answer == "YES"
+            
+            logger.debug(f"Job relevance for '{job['job_title']}': {is_relevant}")
+            return is_relevant
+            
+        except Exception as e:
+            logger.error(f"Error determining job relevance with LLM: {str(e)}")
+            # Default to including the job if there's an error
+            return True
+    
+    def _build_job_prompt(self, job: Dict, request: JobSearchRequest) -> str:
+        """
+        Build the single-job relevance prompt
+        """
+        # Create the prompt directly without using LangChain's PromptTemplate
+        return f"""
             Evaluate if the following job posting is relevant to the user's search criteria.
             
             Search Criteria:
@@ -100,32 +407,38 @@ class RelevanceFilter:
             
             Answer only with 'YES' or 'NO'.
             """
+    
+    def _chat_completion(self, prompt: str, max_tokens: int) -> str:
+        """
+        Send a single prompt to the chat completions API
+        
+        Args:
+            prompt: User prompt
+            max_tokens: Completion token limit
             
-            # Get response from OpenAI
-            response = openai.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a job matching AI assistant. You evaluate if jobs match search criteria."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=10,
-                temperature=0.1,
-            )
-            
-            answer = response.choices[0].message.content.strip().upper()
-            is_relevant = answer == "YES"
-            
-            logger.debug(f"Job relevance for '{job['job_title']}': {is_relevant}")
-            return is_relevant
-            
-        except Exception as e:
-            logger.error(f"Error determining job relevance with LLM: {str(e)}")
-            # Default to including the job if there's an error
-            return True
+        Returns:
+            Content of the model's reply
+        """
+        # The OpenAI SDK only backs this synchronous path, so it is loaded on first use
+        import openai
+        openai.api_key = self.openai_api_key
+        response = openai.chat.completions.create(
+            model=settings.LLM_MODEL,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=max_tokens,
+            temperature=0.1,
+        )
+        return response.choices[0].message.content
     
-    def _basic_filtering(self, jobs: List[Dict], request: JobSearchRequest) -> List[Dict]:
+    def _filter_jobs_batched(self, jobs: List[Dict], request: JobSearchRequest) -> List[Dict]:
         """
-        Basic filtering without using LLM
+        Evaluate jobs in token-budgeted batches, one LLM call per batch
+        
+        A batch whose reply can't be parsed falls back to per-job calls; the
+        other batches are unaffected.
         
         Args:
             jobs: List of job dictionaries
@@ -134,23 +447,148 @@ class RelevanceFilter:
         Returns:
             List of relevant job dictionaries
         """
-        logger.info("Using basic filtering (no LLM)")
         relevant_jobs = []
         
-        position_keywords = set(request.position.lower().split())
-        skills_keywords = set(skill.strip().lower() for skill in request.skills.split(','))
+        for chunk in self._chunk_jobs(jobs):
+            verdicts = self._evaluate_batch_llm(chunk, request)
+            
+            if verdicts is None:
+                logger.warning(f"Falling back to per-job evaluation for a batch of {len(chunk)} jobs")
+                verdicts = [self._is_job_relevant_llm(job, request) for job in chunk]
+            
+            relevant_jobs.extend(job for job, is_relevant in zip(chunk, verdicts) if is_relevant)
+        
+        return relevant_jobs
+    
+    def _chunk_jobs(self, jobs: List[Dict]) -> List[List[Dict]]:
+        """
+        Split jobs into batches that fit LLM_BATCH_TOKEN_BUDGET and LLM_BATCH_MAX_JOBS
+        
+        Args:
+            jobs: List of job dictionaries
+            
+        Returns:
+            List of job batches
+        """
+        chunks = []
+        current = []
+        used_tokens = 0
         
         for job in jobs:
-            title = job["job_title"].lower()
+            cost = estimate_tokens(self._format_job_record(len(current) + 1, job))
             
-            # Check if title matches position
-            title_match = any(keyword in title for keyword in position_keywords)
+            if current and (
+                used_tokens + cost > settings.LLM_BATCH_TOKEN_BUDGET
+                or len(current) >= settings.LLM_BATCH_MAX_JOBS
+            ):
+                chunks.append(current)
+                current = []
+                used_tokens = 0
             
-            # Check if title matches any skills
-            skills_match = any(skill in title for skill in skills_keywords)
+            current.append(job)
+            used_tokens += cost
+        
+        if current:
+            chunks.append(current)
+        
+        return chunks
+    
+    def _format_criteria(self, request: JobSearchRequest) -> str:
+        """
+        Format the search criteria once per batch prompt
+        """
+        return (
+            f"Position: {request.position}\n"
+            f"Experience: {request.experience}\n"
+            f"Salary Range: {request.salary if request.salary else 'Not specified'}\n"
+            f"Job Nature: {request.jobNature if request.jobNature else 'Not specified'}\n"
+            f"Location: {request.location if request.location else 'Not specified'}\n"
+            f"Required Skills: {request.skills}"
+        )
+    
+    def _format_job_record(self, job_id: int, job: Dict) -> str:
+        """
+        Format a job as one compact, numbered line
+        """
+        return (
+            f"{job_id}. {job['job_title']} | {job['company']} | {job['location']} | "
+            f"exp: {job['experience']} | {job['jobNature']} | salary: {job['salary']}"
+        )
+    
+    def _build_batch_prompt(self, jobs: List[Dict], request: JobSearchRequest) -> str:
+        records = "\n".join(self._format_job_record(i, job) for i, job in enumerate(jobs, start=1))
+        
+        return (
+            "Evaluate whether each numbered job posting is relevant to the user's search criteria. "
+            "Consider title, experience level, location, job nature (remote/onsite/hybrid) and salary.\n\n"
+            f"Search Criteria:\n{self._format_criteria(request)}\n\n"
+            "Jobs (id. title | company | location | experience | job nature | salary):\n"
+            f"{records}\n\n"
+            'Reply with JSON only, in the form {"verdicts": [{"id": 1, "relevant": true}, ...]}, '
+            "with exactly one verdict per job id."
+        )
+    
+    def _evaluate_batch_llm(self, jobs: List[Dict], request: JobSearchRequest) -> Optional[List[bool]]:
+        """
+        Ask the LLM for verdicts on a batch of jobs in a single call
+        
+        Args:
+            jobs: Batch of job dictionaries
+            request: Job search request
+            
+        Returns:
+            One verdict per job in input order, or None if the reply can't be used
+        """
+        try:
+            prompt = self._build_batch_prompt(jobs, request)
+            reply = self._chat_completion(prompt, max_tokens=12 * len(jobs) + 20)
+            return self._parse_batch_verdicts(reply, len(jobs))
+        except Exception as e:
+            logger.error(f"Error evaluating job batch with LLM: {str(e)}")
+            return None
+    
+    def _parse_batch_verdicts(self, reply: str, count: int) -> Optional[List[bool]]:
+        """
+        Map a JSON verdict reply back onto job positions
+        
+        Args:
+            reply: Raw model reply
+            count: Number of jobs in the batch
             
-            # Simple relevance: title matches position or skills
-            if title_match or skills_match:
-                relevant_jobs.append(job)
+        Returns:
+            List of verdicts, or None if the reply is malformed or incomplete
+        """
+        start, end = reply.find("{"), reply.rfind("}")
+        if start == -1 or end == -1:
+            return None
+        
+        try:
+            data = json.loads(reply[start:end + 1])
+            verdicts = {
+                int(item["id"]): str(item["relevant"]).strip().lower() in ("true", "yes")
+                for item in data["verdicts"]
+            }
+        except (ValueError, KeyError, TypeError):
+            return None
         
-        return relevant_jobs
\ No newline at end of file
+        if set(verdicts) != set(range(1, count + 1)):
+            return None
+        
+        return [verdicts[i] for i in range(1, count + 1)]
+    
+    def _basic_filtering(self, jobs: List[Dict], request: JobSearchRequest) -> List[Dict]:
+        """
+        Basic filtering without using LLM
+        
+        Jobs are ranked with BM25 against the position and skills; those
+        scoring above RANKING_MIN_SCORE are returned, best match first.
+        
+        Args:
+            jobs: List of job dictionaries
+            request: Job search request
+            
+        Returns:
+            List of relevant job dictionaries
+        """
+        logger.info("Using basic filtering (no LLM)")
+        return self.ranker.rank(jobs, request)
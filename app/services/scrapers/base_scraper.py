@@ -1,29 +1,223 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from contextlib import contextmanager
+from typing import Callable, List, Dict, Any, Optional
+import asyncio
 import logging
+import math
+import random
+import time
+
+from app.core.config import settings
+from app.services.metrics import STAGE_LATENCY, time_stage
+from app.services.ranges import normalize_job
+from app.services.tracing import add_span
+from .driver_pool import get_driver_pool
+from .executor import get_scrape_executor
+from .http_client import get_http_client
+from .parsing import get_parse_pool
 
 logger = logging.getLogger(__name__)
 
+
+class ScrapeError(Exception):
+    """Raised when a source could not be scraped (blocked, captcha, timeout, unparseable page)"""
+
+
 class BaseScraper(ABC):
     """Base class for all job source scrapers"""
     
+    # Markup that only appears when a page contains job cards. Scrapers that set
+    # it (and implement build_search_url) get the HTTP fast path.
+    job_card_marker: Optional[str] = None
+    
+    # Jobs per results page. Scrapers that set it (and handle the page argument
+    # in build_search_url and fetch_jobs) get multi-page fetching.
+    page_size: Optional[int] = None
+    
+    # XPath selecting job cards on a results page, and XPaths (relative to a
+    # card) for the fields build_job needs. Parsed with lxml, large pages in a
+    # separate process.
+    card_xpath: Optional[str] = None
+    field_xpaths: Dict[str, str] = {}
+    
+    # Disabled scrapers are left out of searches and pre-crawls entirely, e.g.
+    # while a source has no working implementation.
+    enabled: bool = True
+    
     def __init__(self, source_name=None):
         self.source_name = source_name or "Unknown"
+        self.user_agents: List[str] = []
 
     @abstractmethod
-    def fetch_jobs(self, query: str, location: str) -> List[Dict]:
+    def fetch_jobs(self, query: str, location: str, page: int = 0) -> List[Dict]:
         """
         Fetch job listings from source
         
         Args:
             query: Job title or keywords
             location: Job location
+            page: Zero-based results page
             
         Returns:
             List of job dictionaries
+            
+        Raises:
+            ScrapeError: If the page could not be fetched or parsed
         """
         pass
     
+    async def fetch_jobs_async(
+        self,
+        query: str,
+        location: str,
+        max_results: Optional[int] = None,
+        count_relevant: Optional[Callable[[List[Dict]], int]] = None,
+    ) -> List[Dict]:
+        """
+        Fetch job listings without blocking the event loop
+        
+        Enough results pages for max_results are fetched in parallel waves of
+        SCRAPER_PAGE_CONCURRENCY, stopping early once enough relevant jobs are
+        collected or a page comes back short (no more results). Pages that have to
+        fall back to the browser take turns for DRIVER_POOL_SIZE slots, so a
+        wave never asks the pool for more browsers than it holds. A failing first
+        page fails the fetch; a failing later page ends pagination with the jobs
+        collected so far.
+        
+        Args:
+            query: Job title or keywords
+            location: Job location
+            max_results: Jobs wanted from this source (defaults to SCRAPER_MAX_RESULTS)
+            count_relevant: Counts the relevant jobs in a list, for early stopping;
+                every job counts when omitted
+            
+        Returns:
+            List of job dictionaries, deduplicated on apply_link and normalized
+            
+        Raises:
+            ScrapeError: If the first results page could not be scraped
+        """
+        max_results = max_results or settings.SCRAPER_MAX_RESULTS
+        pages = min(math.ceil(max_results / self.page_size), settings.SCRAPER_PAGE_LIMIT) if self.page_size else 1
+        
+        browser_slots = asyncio.Semaphore(max(1, settings.DRIVER_POOL_SIZE))
+        
+        jobs: List[Dict] = []
+        seen_links = set()
+        page = 0
+        while page < pages:
+            wave = range(page, min(page + settings.SCRAPER_PAGE_CONCURRENCY, pages))
+            results = await asyncio.gather(
+                *[self.fetch_page_async(query, location, p, browser_slots) for p in wave], return_exceptions=True
+            )
+            
+            exhausted = False
+            for p, page_jobs in zip(wave, results):
+                if isinstance(page_jobs, BaseException):
+                    if p == 0 or not isinstance(page_jobs, Exception):
+                        raise page_jobs
+                    logger.warning(f"{self.source_name} page {p + 1} failed, keeping earlier pages: {str(page_jobs)}")
+                    exhausted = True
+                    break
+                for job in page_jobs:
+                    link = job.get("apply_link")
+                    if link and link != "#":
+                        if link in seen_links:
+                            continue
+                        seen_links.add(link)
+                    jobs.append(job)
+                exhausted = exhausted or not self.page_size or len(page_jobs) < self.page_size
+            page = wave.stop
+            
+            if exhausted:
+                break
+            relevant = count_relevant(jobs) if count_relevant else len(jobs)
+            if relevant >= max_results:
+                logger.info(f"Collected {relevant} relevant {self.source_name} jobs after {page} pages, stopping")
+                break
+        
+        return self.normalize_jobs(jobs)
+    
+    async def fetch_page_async(
+        self,
+        query: str,
+        location: str,
+        page: int = 0,
+        browser_slots: Optional[asyncio.Semaphore] = None,
+    ) -> List[Dict]:
+        """
+        Fetch one results page without blocking the event loop
+        
+        Tries a plain HTTP fetch first when the scraper supports it, and only
+        falls back to fetch_jobs (run on the shared scrape executor) when the
+        response doesn't contain job cards.
+        
+        Args:
+            query: Job title or keywords
+            location: Job location
+            page: Zero-based results page
+            browser_slots: Held while falling back to fetch_jobs, to limit how many
+                pages of one fetch use a browser at once
+            
+        Returns:
+            List of job dictionaries
+        """
+        if settings.HTTP_FETCH_ENABLED and self.job_card_marker:
+            jobs = await self.fetch_jobs_http(query, location, page)
+            if jobs is not None:
+                return jobs
+        
+        if browser_slots is None:
+            return await get_scrape_executor().run(self.fetch_jobs, query, location, page)
+        async with browser_slots:
+            return await get_scrape_executor().run(self.fetch_jobs, query, location, page)
+    
+    async def fetch_jobs_http(self, query: str, location: str, page: int = 0) -> Optional[List[Dict]]:
+        """
+        Fetch job listings over pooled HTTP without a browser
+        
+        Args:
+            query: Job title or keywords
+            location: Job location
+            page: Zero-based results page
+            
+        Returns:
+            List of job dictionaries, or None if the page has to be rendered by a browser
+        """
+        url = self.build_search_url(query, location, page)
+        headers = {"User-Agent": random.choice(self.user_agents)} if self.user_agents else None
+        
+        try:
+            with self.timed("page_load"):
+                html = await get_http_client().get_text(url, headers=headers)
+        except Exception as e:
+            logger.info(f"HTTP fetch failed for {self.source_name}, using browser: {str(e)}")
+            return None
+        
+        if self.job_card_marker not in html:
+            logger.info(f"HTTP response from {self.source_name} has no job cards, using browser")
+            return None
+        
+        try:
+            return await self.parse_jobs_async(html)
+        except Exception as e:
+            logger.info(f"Parsing HTTP response from {self.source_name} failed, using browser: {str(e)}")
+            return None
+    
+    def build_search_url(self, query: str, location: str, page: int = 0) -> str:
+        """
+        Build the search results URL for a query
+        
+        Args:
+            query: Job title or keywords
+            location: Job location
+            page: Zero-based results page
+            
+        Returns:
+            Search results URL
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support URL building")
+    
     @abstractmethod
     def parse_jobs(self, content: Any) -> List[Dict]:
         """
@@ -37,6 +231,70 @@ class BaseScraper(ABC):
         """
         pass
     
+    def extract_cards(self, html: str) -> List[Dict[str, str]]:
+        """
+        Extract the raw field strings of every job card on a page
+        
+        Args:
+            html: Page source
+            
+        Returns:
+            One dict of field_xpaths values per card
+        """
+        with self.timed("parse"):
+            return get_parse_pool().parse(html, self.card_xpath, self.field_xpaths)
+    
+    async def parse_jobs_async(self, html: str) -> List[Dict]:
+        """
+        Parse a results page from the event loop without blocking it
+        
+        Args:
+            html: Page source
+            
+        Returns:
+            List of job dictionaries
+        """
+        if not self.card_xpath:
+            return self.parse_jobs(html)
+        
+        with self.timed("parse"):
+            cards = await get_parse_pool().parse_async(html, self.card_xpath, self.field_xpaths)
+        return [self.build_job(card) for card in cards]
+    
+    def timed(self, stage: str):
+        """
+        Time a with-block as a sample of this source's latency for a stage (page_load, parse, ...)
+        """
+        return time_stage(stage, self.source_name)
+    
+    @contextmanager
+    def browser(self):
+        """
+        Borrow a pooled browser for a with-block, timing how long the checkout waited
+        
+        Yields:
+            A Selenium WebDriver with one of this scraper's user agents applied
+        """
+        started = time.perf_counter()
+        user_agent = random.choice(self.user_agents) if self.user_agents else None
+        with get_driver_pool().driver(user_agent=user_agent) as driver:
+            acquired = time.perf_counter()
+            STAGE_LATENCY.labels("driver_acquire", self.source_name).observe(acquired - started)
+            add_span(f"driver_acquire.{self.source_name}", started, acquired)
+            yield driver
+    
+    def build_job(self, card: Dict[str, str]) -> Dict:
+        """
+        Build a job dictionary from the fields extracted from one card
+        
+        Args:
+            card: Field name to text, as extracted with field_xpaths
+            
+        Returns:
+            Job dictionary
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support card extraction")
+    
     def clean_text(self, text: str) -> str:
         """
         Clean and normalize text
@@ -55,6 +313,25 @@ class BaseScraper(ABC):
         
         return text
     
+    def normalize_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Add numeric salary and experience ranges to scraped jobs
+        
+        Parses each job's salary into salary_min, salary_max, salary_currency
+        and salary_period, and its experience into experience_min and
+        experience_max (years), so range matching needs no LLM call.
+        
+        Args:
+            jobs: List of job dictionaries, updated in place
+            
+        Returns:
+            The same jobs
+        """
+        with self.timed("normalize"):
+            for job in jobs:
+                normalize_job(job)
+        return jobs
+    
     def format_salary(self, salary: str) -> str:
         """
         Format salary string
@@ -0,0 +1,265 @@
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPoolTimeout(Exception):
+    """Raised when no browser becomes available within the acquire timeout"""
+
+
+class _PooledDriver:
+    """A driver plus the bookkeeping needed to decide when to recycle it"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.monotonic()
+
+
+class DriverPool:
+    """
+    Bounded pool of warm headless Chrome drivers shared by the Selenium scrapers
+
+    Drivers are launched lazily (or up front via warm_up), handed out with the
+    driver() context manager and returned afterwards. A driver is recycled once
+    it has served DRIVER_MAX_PAGES pages, is older than DRIVER_MAX_AGE seconds,
+    or fails a health check.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        acquire_timeout: Optional[float] = None,
+        max_pages: Optional[int] = None,
+        max_age: Optional[float] = None,
+        driver_factory: Optional[Callable] = None,
+    ):
+        self.size = size or settings.DRIVER_POOL_SIZE
+        self.acquire_timeout = acquire_timeout or settings.DRIVER_POOL_ACQUIRE_TIMEOUT
+        self.max_pages = max_pages or settings.DRIVER_MAX_PAGES
+        self.max_age = max_age or settings.DRIVER_MAX_AGE
+        self._driver_factory = driver_factory or self._launch_chrome
+
+        # LIFO so the most recently used (hottest) driver is handed out first
+        self._idle: "queue.LifoQueue[_PooledDriver]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._driver_path: Optional[str] = None
+        self._closed = False
+
+        self.stats: Dict[str, int] = {
+            "launched": 0,
+            "acquired": 0,
+            "recycled": 0,
+            "timeouts": 0,
+        }
+
+    def resolve_driver_path(self) -> str:
+        """
+        Resolve the chromedriver binary once and reuse it for every launch
+        """
+        with self._lock:
+            if self._driver_path is None:
+                from webdriver_manager.chrome import ChromeDriverManager
+                self._driver_path = ChromeDriverManager().install()
+                logger.info(f"Resolved chromedriver at {self._driver_path}")
+            return self._driver_path
+
+    def _launch_chrome(self):
+        # Selenium is imported on the first browser launch, not when the app starts
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
+        chrome_options = Options()
+        if settings.HEADLESS_BROWSER:
+            chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+
+        return webdriver.Chrome(service=Service(self.resolve_driver_path()), options=chrome_options)
+
+    def _new_driver(self) -> _PooledDriver:
+        driver = self._driver_factory()
+        self._bump("launched")
+        return _PooledDriver(driver)
+
+    def _bump(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def warm_up(self, count: Optional[int] = None) -> int:
+        """
+        Pre-launch drivers so the first requests don't pay for browser startup
+
+        Args:
+            count: Number of drivers to launch (defaults to DRIVER_POOL_WARM_SIZE)
+
+        Returns:
+            Number of drivers launched
+        """
+        count = min(settings.DRIVER_POOL_WARM_SIZE if count is None else count, self.size)
+        launched = []
+
+        for _ in range(count):
+            if not self._slots.acquire(timeout=self.acquire_timeout):
+                break
+            try:
+                launched.append(self._new_driver())
+            except Exception as e:
+                logger.error(f"Error warming up browser pool: {str(e)}")
+                self._slots.release()
+                break
+
+        for pooled in launched:
+            self._idle.put(pooled)
+            self._slots.release()
+
+        logger.info(f"Browser pool warmed with {len(launched)} driver(s)")
+        return len(launched)
+
+    def _is_expired(self, pooled: _PooledDriver) -> bool:
+        return (
+            pooled.pages >= self.max_pages
+            or time.monotonic() - pooled.created_at >= self.max_age
+        )
+
+    def _is_healthy(self, pooled: _PooledDriver) -> bool:
+        try:
+            # Any round-trip to the browser fails fast if the session is dead
+            pooled.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, pooled: _PooledDriver):
+        self._bump("recycled")
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting browser: {str(e)}")
+
+    def _acquire(self) -> _PooledDriver:
+        if self._closed:
+            raise RuntimeError("Browser pool is shut down")
+
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            self._bump("timeouts")
+            raise DriverPoolTimeout(f"No browser available after {self.acquire_timeout}s")
+
+        try:
+            while True:
+                try:
+                    pooled = self._idle.get_nowait()
+                except queue.Empty:
+                    pooled = self._new_driver()
+                    break
+
+                if not self._is_expired(pooled) and self._is_healthy(pooled):
+                    break
+                self._quit(pooled)
+        except Exception:
+            self._slots.release()
+            raise
+
+        self._bump("acquired")
+        return pooled
+
+    def _release(self, pooled: _PooledDriver, check_health: bool = False):
+        try:
+            pooled.pages += 1
+
+            if self._closed or self._is_expired(pooled):
+                self._quit(pooled)
+                return
+
+            try:
+                # Drop the previous page so idle drivers don't keep running scripts
+                pooled.driver.get("about:blank")
+            except Exception:
+                self._quit(pooled)
+                return
+
+            if check_health and not self._is_healthy(pooled):
+                self._quit(pooled)
+                return
+
+            self._idle.put(pooled)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, user_agent: Optional[str] = None):
+        """
+        Check out a driver for the duration of a with-block
+
+        Args:
+            user_agent: Optional user agent to apply for this checkout
+
+        Yields:
+            A Selenium WebDriver
+        """
+        pooled = self._acquire()
+        failed = False
+        try:
+            if user_agent:
+                self._set_user_agent(pooled.driver, user_agent)
+            yield pooled.driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._release(pooled, check_health=failed)
+
+    def _set_user_agent(self, driver, user_agent: str):
+        try:
+            driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": user_agent})
+        except Exception as e:
+            logger.debug(f"Could not override user agent: {str(e)}")
+
+    def shutdown(self):
+        """
+        Quit every idle driver; drivers still checked out are quit on return
+        """
+        self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(pooled)
+        logger.info("Browser pool shut down")
+
+
+_pool: Optional[DriverPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """
+    Return the app-wide browser pool, creating it on first use
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool()
+        return _pool
+
+
+def shutdown_driver_pool():
+    """
+    Shut down the app-wide browser pool if it was created
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
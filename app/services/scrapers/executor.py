@@ -0,0 +1,103 @@
+import asyncio
+import contextvars
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeExecutor:
+    """
+    Bounded thread pool that runs blocking (Selenium) scrapes off the event loop
+
+    Keeps counts of running and queued scrapes so saturation shows up in logs
+    instead of as unexplained latency.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or settings.SCRAPER_MAX_WORKERS
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scraper")
+        self._lock = threading.Lock()
+        self.active = 0
+        self.queued = 0
+        self.stats: Dict[str, int] = {"submitted": 0, "saturated": 0}
+
+    async def run(self, func: Callable, *args):
+        """
+        Run a blocking callable on the pool and await its result
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        with self._lock:
+            self.stats["submitted"] += 1
+            self.queued += 1
+            if self.active + self.queued > self.max_workers:
+                self.stats["saturated"] += 1
+                logger.warning(
+                    f"Scrape executor saturated: {self.active} running, "
+                    f"{self.queued} waiting for {self.max_workers} workers"
+                )
+
+        def call():
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.active -= 1
+
+        # Run in a copy of the caller's context so request-scoped state (the trace) follows the call
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(self._executor, context.run, call)
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Current load of the executor
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "active": self.active,
+                "queued": self.queued,
+                **self.stats,
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_executor: Optional[ScrapeExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_scrape_executor() -> ScrapeExecutor:
+    """
+    Return the app-wide scrape executor, creating it on first use
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ScrapeExecutor()
+        return _executor
+
+
+def shutdown_scrape_executor():
+    """
+    Shut down the app-wide scrape executor if it was created
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class ScraperHttpClient:
+    """
+    Shared pooled httpx client for the HTTP fast path of the scrapers
+
+    One AsyncClient keeps connections alive across requests (HTTP/2 when the
+    h2 package is installed), and a semaphore per host caps how many requests
+    are in flight against a single job board.
+    """
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            http2 = settings.HTTP2_ENABLED and HTTP2_AVAILABLE
+            if settings.HTTP2_ENABLED and not HTTP2_AVAILABLE:
+                logger.warning("h2 package not installed. Falling back to HTTP/1.1.")
+
+            self._client = httpx.AsyncClient(
+                http2=http2,
+                timeout=settings.HTTP_TIMEOUT,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    def warm_up(self):
+        """
+        Create the pooled client ahead of the first request; loading the TLS trust store is the slow part
+        """
+        self._get_client()
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(settings.HTTP_MAX_CONNECTIONS_PER_HOST)
+        return self._host_limits[host]
+
+    async def get_text(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """
+        GET a URL and return the response body
+
+        Args:
+            url: URL to fetch
+            headers: Optional request headers
+
+        Returns:
+            Response body as text
+
+        Raises:
+            httpx.HTTPError: On transport errors and non-2xx responses
+        """
+        async with self._host_limit(url):
+            response = await self._get_client().get(url, headers=headers)
+        response.raise_for_status()
+        return response.text
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_http_client: Optional[ScraperHttpClient] = None
+
+
+def get_http_client() -> ScraperHttpClient:
+    """
+    Return the app-wide scraper HTTP client, creating it on first use
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = ScraperHttpClient()
+    return _http_client
+
+
+async def close_http_client():
+    """
+    Close the app-wide scraper HTTP client if it was created
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -0,0 +1,179 @@
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import lxml.etree
+import lxml.html
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Workers are started from a clean process rather than forked: the app already runs
+# scrape, driver and HTTP threads, and a fork copies any lock they hold in its held state
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def has_class(name: str) -> str:
+    """
+    XPath predicate matching elements whose class list contains name, like the CSS selector .name
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+@functools.lru_cache(maxsize=256)
+def compile_xpath(xpath: str) -> lxml.etree.XPath:
+    """
+    Compile an XPath once per process instead of on every evaluation
+    """
+    return lxml.etree.XPath(xpath)
+
+
+def compile_xpaths(xpaths: Iterable[str]) -> int:
+    """
+    Compile XPaths ahead of the first parse
+
+    Returns:
+        Number of XPaths compiled
+    """
+    return len([compile_xpath(xpath) for xpath in xpaths])
+
+
+def parse_cards(html: str, card_xpath: str, field_xpaths: Dict[str, str]) -> List[Dict[str, str]]:
+    """
+    Extract fields from every job card on a results page
+
+    Only the card containers matched by card_xpath are visited, and each field
+    is read with one XPath relative to its card.
+
+    Args:
+        html: Page source
+        card_xpath: XPath selecting the job card elements
+        field_xpaths: Field name to XPath relative to a card; an XPath may select
+            an element (its whitespace-normalized text is used) or an attribute
+
+    Returns:
+        One dict of field strings per card; missing fields are empty strings
+    """
+    if not html or not html.strip():
+        return []
+
+    root = lxml.html.fromstring(html)
+    cards = []
+    for card in compile_xpath(card_xpath)(root):
+        fields = {}
+        for name, xpath in field_xpaths.items():
+            found = compile_xpath(xpath)(card)
+            value = found[0] if found else ""
+            if isinstance(value, lxml.html.HtmlElement):
+                value = value.text_content()
+            fields[name] = " ".join(str(value).split())
+        cards.append(fields)
+    return cards
+
+
+class ParsePool:
+    """
+    Process pool for parsing large pages without holding the GIL
+
+    Pages shorter than PARSE_PROCESS_MIN_BYTES are parsed inline, since
+    pickling them to a worker would cost more than parsing them. Workers are
+    started with forkserver (spawn where that is unavailable), never fork.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, min_bytes: Optional[int] = None):
+        self.max_workers = settings.PARSE_PROCESS_WORKERS if max_workers is None else max_workers
+        self.min_bytes = settings.PARSE_PROCESS_MIN_BYTES if min_bytes is None else min_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"inline": 0, "offloaded": 0}
+
+    def _pool_for(self, html: str) -> Optional[ProcessPoolExecutor]:
+        if self.max_workers <= 0 or len(html) < self.min_bytes:
+            self.stats["inline"] += 1
+            return None
+
+        self.stats["offloaded"] += 1
+        return self._get_executor()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context(START_METHOD)
+                )
+            return self._executor
+
+    def parse(self, html: str, card_xpath: str, field_xpaths: Dict[str, str]) -> List[Dict[str, str]]:
+        """
+        Parse a page from a worker thread, in a child process when it is large
+        """
+        pool = self._pool_for(html)
+        if pool is None:
+            return parse_cards(html, card_xpath, field_xpaths)
+        return pool.submit(parse_cards, html, card_xpath, field_xpaths).result()
+
+    async def parse_async(self, html: str, card_xpath: str, field_xpaths: Dict[str, str]) -> List[Dict[str, str]]:
+        """
+        Parse a page from the event loop, in a child process when it is large
+        """
+        pool = self._pool_for(html)
+        if pool is None:
+            return parse_cards(html, card_xpath, field_xpaths)
+        return await asyncio.get_running_loop().run_in_executor(pool, parse_cards, html, card_xpath, field_xpaths)
+
+    def warm_up(self, xpaths: List[str]) -> int:
+        """
+        Start the worker processes and compile the scrapers' XPaths in this process and in the workers
+
+        Args:
+            xpaths: Card and field XPaths of every scraper
+
+        Returns:
+            Number of worker processes started
+        """
+        compile_xpaths(xpaths)
+        if self.max_workers <= 0:
+            return 0
+
+        executor = self._get_executor()
+        # One task per worker; idle workers pick them up, so most workers compile their own copy
+        for future in [executor.submit(compile_xpaths, xpaths) for _ in range(self.max_workers)]:
+            future.result()
+        return self.max_workers
+
+    def shutdown(self, wait: bool = False):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+
+
+_parse_pool: Optional[ParsePool] = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> ParsePool:
+    """
+    Return the app-wide parse pool, creating it on first use
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ParsePool()
+        return _parse_pool
+
+
+def shutdown_parse_pool(wait: bool = False):
+    """
+    Shut down the app-wide parse pool's worker processes if they were started
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait)
+            _parse_pool = None
@@ -0,0 +1,204 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+
+logger = logging.getLogger(__name__)
+
+# Common abbreviations and spellings mapped to one canonical city name
+LOCATION_ALIASES = {
+    "lhr": "lahore",
+    "isb": "islamabad",
+    "isl": "islamabad",
+    "khi": "karachi",
+    "pew": "peshawar",
+    "rwp": "rawalpindi",
+    "pindi": "rawalpindi",
+    "nyc": "new york",
+    "new york city": "new york",
+    "sf": "san francisco",
+    "anywhere": "remote",
+    "work from home": "remote",
+    "wfh": "remote",
+}
+
+# Trailing country names dropped from "City, Country" locations
+COUNTRY_NAMES = {"pakistan", "pk", "usa", "us", "united states", "uk", "united kingdom"}
+
+
+def normalize_text(value: Optional[str]) -> str:
+    return " ".join((value or "").lower().split())
+
+
+def canonical_location(location: Optional[str]) -> str:
+    """
+    Canonicalize a location so "Lahore, Pakistan", "lahore" and "LHR" match
+    """
+    parts = [normalize_text(part) for part in (location or "").split(",")]
+    parts = [part for part in parts if part]
+
+    if len(parts) > 1 and parts[-1] in COUNTRY_NAMES:
+        parts = parts[:-1]
+
+    return ", ".join(LOCATION_ALIASES.get(part, part) for part in parts)
+
+
+def canonical_skills(skills: Optional[str]) -> list:
+    return sorted({normalize_text(skill) for skill in (skills or "").split(",") if skill.strip()})
+
+
+def canonical_search_key(request: JobSearchRequest) -> str:
+    """
+    Build a cache key that is stable across case, whitespace, skill order and location aliases
+    """
+    payload = {
+        "position": normalize_text(request.position),
+        "experience": normalize_text(request.experience),
+        "salary": normalize_text(request.salary),
+        "jobNature": normalize_text(request.jobNature),
+        "location": canonical_location(request.location),
+        "skills": canonical_skills(request.skills),
+        "max_results": request.max_results,
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class SearchCache:
+    """
+    In-process search result cache with stale-while-revalidate semantics
+
+    Entries younger than SEARCH_CACHE_FRESH_SECONDS (or the fresh window they
+    were stored with) are fresh. For a further SEARCH_CACHE_STALE_SECONDS they
+    are stale: still served, but refreshed in a background task. Older entries
+    are misses.
+    """
+
+    FRESH = "fresh"
+    STALE = "stale"
+
+    def __init__(
+        self,
+        fresh_seconds: Optional[float] = None,
+        stale_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.fresh_seconds = settings.SEARCH_CACHE_FRESH_SECONDS if fresh_seconds is None else fresh_seconds
+        self.stale_seconds = settings.SEARCH_CACHE_STALE_SECONDS if stale_seconds is None else stale_seconds
+        self.max_entries = max_entries or settings.SEARCH_CACHE_MAX_ENTRIES
+
+        self._entries: "OrderedDict[str, Tuple[Any, float, float]]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.stats: Dict[str, int] = {"fresh_hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0}
+
+    def get(self, key: str) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Look up a cached result
+
+        Args:
+            key: Result of canonical_search_key
+
+        Returns:
+            (value, state) where state is FRESH, STALE or None for a miss
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at, fresh_seconds = entry
+            age = time.monotonic() - stored_at
+
+            if age < fresh_seconds:
+                self._entries.move_to_end(key)
+                self.stats["fresh_hits"] += 1
+                return value, self.FRESH
+
+            if age < fresh_seconds + self.stale_seconds:
+                self._entries.move_to_end(key)
+                self.stats["stale_hits"] += 1
+                return value, self.STALE
+
+            del self._entries[key]
+
+        self.stats["misses"] += 1
+        return None, None
+
+    def set(self, key: str, value: Any, fresh_seconds: Optional[float] = None):
+        """
+        Store a result
+
+        Args:
+            key: Result of canonical_search_key
+            value: Result to cache
+            fresh_seconds: How long this entry stays fresh (defaults to the cache's fresh window)
+        """
+        fresh_seconds = self.fresh_seconds if fresh_seconds is None else min(fresh_seconds, self.fresh_seconds)
+        self._entries[key] = (value, time.monotonic(), fresh_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh_in_background(self, key: str, load: Callable[[], Awaitable[Any]]):
+        """
+        Recompute a stale entry in a background task, at most once per key at a time
+
+        Args:
+            key: Cache key to refresh
+            load: Coroutine function producing the new value, or None to keep the current entry
+        """
+        if key in self._refreshing:
+            return
+
+        self._refreshing.add(key)
+        self.stats["refreshes"] += 1
+
+        async def refresh():
+            try:
+                value = await load()
+                if value is not None:
+                    self.set(key, value)
+            except Exception as e:
+                logger.error(f"Error refreshing cached search: {str(e)}")
+            finally:
+                self._refreshing.discard(key)
+
+        # Keep a reference so the task isn't garbage collected mid-flight
+        task = asyncio.create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def wait_for_refreshes(self):
+        """
+        Wait until all background refreshes have finished
+        """
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def clear(self):
+        self._entries.clear()
+
+
+_search_cache: Optional[SearchCache] = None
+
+
+def get_search_cache() -> SearchCache:
+    """
+    Return the app-wide search result cache, creating it on first use
+    """
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = SearchCache()
+    return _search_cache
+
+
+def reset_search_cache():
+    """
+    Drop the app-wide search result cache
+    """
+    global _search_cache
+    _search_cache = None
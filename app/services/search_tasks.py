@@ -0,0 +1,183 @@
+import asyncio
+import contextvars
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.services.metrics import SEARCH_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+# Source progress before a source reports back
+SOURCE_PENDING = "pending"
+
+
+class SearchQueueFull(Exception):
+    """Raised when SEARCH_TASK_QUEUE_SIZE searches are already waiting"""
+
+
+class SearchTask:
+    """
+    One submitted search: its lifecycle, per-source progress and, once done, its results
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, request: JobSearchRequest, sources: List[str]):
+        self.id = uuid.uuid4().hex
+        self.request = request
+        self.status = self.QUEUED
+        self.sources: Dict[str, str] = {source: SOURCE_PENDING for source in sources}
+        self.relevant_jobs: List[Dict] = []
+        self.error: Optional[str] = None
+        self.created_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (self.DONE, self.FAILED)
+
+    def to_dict(self) -> Dict:
+        now = time.monotonic()
+        return {
+            "task_id": self.id,
+            "status": self.status,
+            "sources": dict(self.sources),
+            "queued_ms": round(((self.started_at or now) - self.created_at) * 1000, 1),
+            "elapsed_ms": round(((self.finished_at or now) - self.started_at) * 1000, 1) if self.started_at else None,
+            "result": (
+                {"relevant_jobs": list(self.relevant_jobs), "source_status": dict(self.sources)}
+                if self.status == self.DONE else None
+            ),
+            "error": self.error,
+        }
+
+
+class SearchTaskQueue:
+    """
+    Bounded queue of searches run by a fixed pool of worker tasks
+
+    submit() returns at once with a task, so API latency no longer depends on
+    how long scraping takes. SEARCH_TASK_WORKERS workers take tasks off a
+    queue of at most SEARCH_TASK_QUEUE_SIZE waiting searches and run them
+    through JobService.stream_jobs, updating each source's progress as it
+    finishes. Finished tasks are kept for SEARCH_TASK_TTL seconds.
+    """
+
+    def __init__(
+        self,
+        job_service,
+        max_queued: Optional[int] = None,
+        workers: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.job_service = job_service
+        self.max_queued = max_queued or settings.SEARCH_TASK_QUEUE_SIZE
+        self.worker_count = workers or settings.SEARCH_TASK_WORKERS
+        self.ttl = settings.SEARCH_TASK_TTL if ttl is None else ttl
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._tasks: "OrderedDict[str, SearchTask]" = OrderedDict()
+
+        self.stats: Dict[str, int] = {"submitted": 0, "rejected": 0, "done": 0, "failed": 0, "expired": 0}
+
+    def _start(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queued)
+        if not self._workers:
+            # Workers run in an empty context so they don't inherit the submitting request's trace
+            self._workers = [
+                contextvars.Context().run(asyncio.create_task, self._work())
+                for _ in range(self.worker_count)
+            ]
+
+    def submit(self, request: JobSearchRequest) -> SearchTask:
+        """
+        Queue a search
+
+        Raises:
+            SearchQueueFull: If max_queued searches are already waiting
+        """
+        self._start()
+        self._expire()
+        task = SearchTask(request, list(self.job_service.scrapers))
+        try:
+            self._queue.put_nowait(task)
+        except asyncio.QueueFull:
+            self.stats["rejected"] += 1
+            raise SearchQueueFull(f"{self.max_queued} searches are already queued")
+
+        self._tasks[task.id] = task
+        self.stats["submitted"] += 1
+        SEARCH_QUEUE_DEPTH.set(self._queue.qsize())
+        return task
+
+    def get(self, task_id: str) -> Optional[SearchTask]:
+        """
+        A task by id, or None if it is unknown or its results have expired
+        """
+        self._expire()
+        return self._tasks.get(task_id)
+
+    def _expire(self):
+        now = time.monotonic()
+        for task_id, task in list(self._tasks.items()):
+            if task.finished and now - task.finished_at >= self.ttl:
+                del self._tasks[task_id]
+                self.stats["expired"] += 1
+
+    async def _work(self):
+        while True:
+            task = await self._queue.get()
+            SEARCH_QUEUE_DEPTH.set(self._queue.qsize())
+            try:
+                await self._run(task)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, task: SearchTask):
+        task.status = SearchTask.RUNNING
+        task.started_at = time.monotonic()
+        try:
+            async for event in self.job_service.stream_jobs(task.request):
+                if event["event"] != "jobs":
+                    continue
+                if event["source"] == "cache":
+                    task.sources = {source: event["status"] for source in task.sources}
+                else:
+                    task.sources[event["source"]] = event["status"]
+                task.relevant_jobs.extend(event["jobs"])
+            task.status = SearchTask.DONE
+            self.stats["done"] += 1
+        except Exception as e:
+            logger.error(f"Error running queued search {task.id}: {str(e)}")
+            task.status = SearchTask.FAILED
+            task.error = str(e)
+            self.stats["failed"] += 1
+        finally:
+            task.finished_at = time.monotonic()
+
+    async def join(self):
+        """
+        Wait until every queued search has finished
+        """
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def shutdown(self):
+        """
+        Stop the workers; searches still queued or running are abandoned
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from app.services.metrics import SINGLE_FLIGHT_CALLS
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one in-flight task
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same result instead of repeating it. The shared
+    task is shielded, so one caller disconnecting doesn't cancel it for the
+    others.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.stats: Dict[str, int] = {"calls": 0, "executions": 0, "coalesced": 0}
+
+    async def do(self, key: Hashable, work: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run work for key, or join the run already in flight
+
+        Args:
+            key: Identity of the work
+            work: Coroutine function to run if nothing is in flight for key
+
+        Returns:
+            The result of work
+        """
+        self.stats["calls"] += 1
+        task = self._in_flight.get(key)
+
+        if task is None:
+            self.stats["executions"] += 1
+            SINGLE_FLIGHT_CALLS.labels(self.name, "leader").inc()
+            task = asyncio.ensure_future(work())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.stats["coalesced"] += 1
+            SINGLE_FLIGHT_CALLS.labels(self.name, "coalesced").inc()
+            logger.info(f"Coalesced {self.name} request onto in-flight work")
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+
+_flights: Dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    Return the app-wide coalescing group with the given name
+    """
+    if name not in _flights:
+        _flights[name] = SingleFlight(name)
+    return _flights[name]
@@ -0,0 +1,253 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Characters allowed in a Server-Timing metric name (an HTTP token)
+_NON_TOKEN = re.compile(r"[^A-Za-z0-9!#$%&'*+\-.^_`|~]")
+
+
+class Span:
+    """
+    One timed step of a request: a scrape, a parse, an LLM batch, ...
+    """
+
+    __slots__ = ("name", "parent", "start", "end", "lane", "attrs")
+
+    def __init__(self, name: str, parent: Optional["Span"], start: float, lane: str, attrs: Dict):
+        self.name = name
+        self.parent = parent
+        self.start = start
+        self.end: Optional[float] = None
+        self.lane = lane
+        self.attrs = attrs
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end or time.perf_counter()) - self.start) * 1000
+
+
+class Trace:
+    """
+    Nested span timings for one request
+
+    Spans are collected from the request's task, the tasks it gathers and
+    the worker threads it runs scrapes on. Each of those is a separate lane
+    in the Chrome trace, so concurrent spans don't overlap on one row.
+    """
+
+    def __init__(self, name: str):
+        self.id = uuid.uuid4().hex[:16]
+        self.name = name
+        self.started_at = time.time()
+        self.root = Span(name, None, time.perf_counter(), _lane(), {})
+        self.spans: List[Span] = [self.root]
+
+    def finish(self):
+        self.root.end = time.perf_counter()
+
+    def server_timing(self, limit: int = 20) -> str:
+        """
+        Server-Timing header value: total time, then the time summed per span name, slowest first
+        """
+        totals: Dict[str, List[float]] = {}
+        for span in self.spans[1:]:
+            entry = totals.setdefault(span.name, [0.0, 0])
+            entry[0] += span.duration_ms
+            entry[1] += 1
+
+        ranked = sorted(totals.items(), key=lambda item: -item[1][0])[:limit]
+        entries = [f"total;dur={self.root.duration_ms:.1f}"]
+        for name, (duration, count) in ranked:
+            entries.append(f'{_NON_TOKEN.sub("_", name)};dur={duration:.1f};desc="{count} span{"s" * (count > 1)}"')
+        return ", ".join(entries)
+
+    def to_dict(self) -> Dict:
+        """
+        The span tree as nested JSON, for the opt-in debug trace
+        """
+        children: Dict[int, List[Span]] = {}
+        for span in self.spans[1:]:
+            children.setdefault(id(span.parent), []).append(span)
+
+        def node(span: Span) -> Dict:
+            return {
+                "name": span.name,
+                "start_ms": round((span.start - self.root.start) * 1000, 2),
+                "duration_ms": round(span.duration_ms, 2),
+                **({"attrs": span.attrs} if span.attrs else {}),
+                "children": [node(child) for child in sorted(children.get(id(span), []), key=lambda s: s.start)],
+            }
+
+        return {"trace_id": self.id, **node(self.root)}
+
+    def chrome_events(self) -> List[Dict]:
+        """
+        The spans as Chrome trace-event "complete" events, one thread row per lane
+        """
+        pid = os.getpid()
+        lanes: Dict[str, int] = {}
+        events = []
+        # Anchor perf_counter offsets to wall-clock time so traces from separate requests line up
+        origin_us = self.started_at * 1e6
+        for span in self.spans:
+            tid = lanes.setdefault(span.lane, len(lanes) + 1)
+            events.append({
+                "name": span.name,
+                "cat": self.name,
+                "ph": "X",
+                "ts": round(origin_us + (span.start - self.root.start) * 1e6, 1),
+                "dur": round(span.duration_ms * 1000, 1),
+                "pid": pid,
+                "tid": tid,
+                "args": dict(span.attrs, trace_id=self.id),
+            })
+        for lane, tid in lanes.items():
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                "args": {"name": f"{self.name} {self.id[:6]} {lane}"},
+            })
+        return events
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def _lane() -> str:
+    """
+    Where a span runs: its asyncio task, or its thread outside the event loop
+    """
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return task.get_name()
+    return threading.current_thread().name
+
+
+@contextmanager
+def traced(name: str):
+    """
+    Collect spans for a with-block, including the tasks and threads it spawns
+
+    Yields:
+        The Trace, finished when the block exits
+    """
+    trace = Trace(name)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(trace.root)
+    try:
+        yield trace
+    finally:
+        trace.finish()
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """
+    Time a with-block as a child of the current span; does nothing outside a traced request
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    current = Span(name, parent, time.perf_counter(), _lane(), attrs)
+    trace.spans.append(current)
+    token = _current_span.set(current)
+    try:
+        yield current
+    finally:
+        current.end = time.perf_counter()
+        _current_span.reset(token)
+
+
+def add_span(name: str, start: float, end: float, **attrs):
+    """
+    Record an already finished step (perf_counter start and end) under the current span
+    """
+    trace = _current_trace.get()
+    if trace is not None:
+        finished = Span(name, _current_span.get(), start, _lane(), attrs)
+        finished.end = end
+        trace.spans.append(finished)
+
+
+class TraceFileWriter:
+    """
+    Appends sampled traces to a local Chrome trace-event file, rotating it by size
+
+    The file uses the JSON array format without the closing bracket, which
+    chrome://tracing and Perfetto accept, so traces can be appended without
+    rewriting the file. When it grows past TRACE_FILE_MAX_BYTES it is renamed
+    to path.1 (older files shift up to TRACE_FILE_BACKUPS) and a new file is
+    started.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None, backups: Optional[int] = None):
+        self.path = path or settings.TRACE_FILE_PATH
+        self.max_bytes = max_bytes or settings.TRACE_FILE_MAX_BYTES
+        self.backups = settings.TRACE_FILE_BACKUPS if backups is None else backups
+        self._lock = threading.Lock()
+
+    def write(self, trace: Trace):
+        lines = "".join(json.dumps(event) + ",\n" for event in trace.chrome_events())
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                if os.path.exists(self.path) and os.path.getsize(self.path) + len(lines) > self.max_bytes:
+                    self._rotate()
+                new_file = not os.path.exists(self.path)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    if new_file:
+                        f.write("[\n")
+                    f.write(lines)
+            except OSError as e:
+                logger.error(f"Error writing trace file: {str(e)}")
+
+    def _rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+
+_trace_writer: Optional[TraceFileWriter] = None
+
+
+def should_sample() -> bool:
+    return settings.TRACE_SAMPLE_RATE > 0 and random.random() < settings.TRACE_SAMPLE_RATE
+
+
+def get_trace_writer() -> TraceFileWriter:
+    """
+    Return the app-wide trace file writer, creating it on first use
+    """
+    global _trace_writer
+    if _trace_writer is None:
+        _trace_writer = TraceFileWriter()
+    return _trace_writer
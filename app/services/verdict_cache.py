@@ -0,0 +1,249 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.services.search_cache import canonical_skills, normalize_text
+
+logger = logging.getLogger(__name__)
+
+EVICTION_POLICIES = ("lru", "fifo")
+
+
+def criteria_hash(request: JobSearchRequest) -> str:
+    """
+    Hash the search fields that appear in the relevance prompt
+
+    Case, whitespace and skill order don't change the hash.
+    """
+    payload = {
+        "position": normalize_text(request.position),
+        "experience": normalize_text(request.experience),
+        "salary": normalize_text(request.salary),
+        "jobNature": normalize_text(request.jobNature),
+        "location": normalize_text(request.location),
+        "skills": canonical_skills(request.skills),
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def job_fingerprint(job: Dict) -> str:
+    """
+    Fingerprint the job fields the LLM sees
+    """
+    fields = ("job_title", "company", "location", "salary", "experience", "jobNature")
+    payload = "\x1f".join(normalize_text(job.get(field)) for field in fields)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class VerdictCache:
+    """
+    Two-tier cache of LLM relevance verdicts keyed by (criteria hash, job fingerprint)
+
+    The in-process tier is a bounded OrderedDict; the SQLite tier survives
+    restarts. Both expire entries after VERDICT_CACHE_TTL seconds and evict by
+    VERDICT_CACHE_EVICTION ("lru" drops least recently used entries first,
+    "fifo" drops the oldest entries first).
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        memory_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        max_rows: Optional[int] = None,
+        eviction: Optional[str] = None,
+    ):
+        self.path = path or settings.VERDICT_CACHE_PATH
+        self.memory_size = memory_size or settings.VERDICT_CACHE_MEMORY_SIZE
+        self.ttl = ttl or settings.VERDICT_CACHE_TTL
+        self.max_rows = max_rows or settings.VERDICT_CACHE_MAX_ROWS
+        self.eviction = (eviction or settings.VERDICT_CACHE_EVICTION).lower()
+        if self.eviction not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {self.eviction}")
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_trim = 0
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts ("
+            "key TEXT PRIMARY KEY, verdict INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_verdicts_accessed ON verdicts (accessed_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_verdicts_created ON verdicts (created_at)")
+        self._db.commit()
+
+        self.stats: Dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    @staticmethod
+    def _key(criteria_key: str, job_key: str) -> str:
+        return f"{criteria_key}:{job_key}"
+
+    def get_many(self, criteria_key: str, job_keys: Iterable[str]) -> Dict[str, bool]:
+        """
+        Look up verdicts for several jobs under one set of criteria
+
+        Args:
+            criteria_key: Result of criteria_hash
+            job_keys: Results of job_fingerprint
+
+        Returns:
+            Mapping of job key to cached verdict, for the keys that were found
+        """
+        now = time.time()
+        found: Dict[str, bool] = {}
+        missing = []
+
+        with self._lock:
+            for job_key in set(job_keys):
+                key = self._key(criteria_key, job_key)
+                entry = self._memory.get(key)
+                if entry is not None and now - entry[1] < self.ttl:
+                    if self.eviction == "lru":
+                        self._memory.move_to_end(key)
+                    found[job_key] = entry[0]
+                    self.stats["memory_hits"] += 1
+                else:
+                    if entry is not None:
+                        del self._memory[key]
+                    missing.append(job_key)
+
+            if missing:
+                keys = [self._key(criteria_key, job_key) for job_key in missing]
+                placeholders = ",".join("?" * len(keys))
+                rows = self._db.execute(
+                    f"SELECT key, verdict, created_at FROM verdicts "
+                    f"WHERE key IN ({placeholders}) AND created_at > ?",
+                    (*keys, now - self.ttl),
+                ).fetchall()
+
+                for key, verdict, created_at in rows:
+                    found[key.split(":", 1)[1]] = bool(verdict)
+                    self._remember(key, bool(verdict), created_at)
+                self.stats["disk_hits"] += len(rows)
+                self.stats["misses"] += len(missing) - len(rows)
+
+                if rows and self.eviction == "lru":
+                    self._db.executemany(
+                        "UPDATE verdicts SET accessed_at = ? WHERE key = ?",
+                        [(now, key) for key, _, _ in rows],
+                    )
+                    self._db.commit()
+
+        return found
+
+    def set_many(self, criteria_key: str, verdicts: Dict[str, bool]):
+        """
+        Store verdicts for several jobs under one set of criteria
+
+        Args:
+            criteria_key: Result of criteria_hash
+            verdicts: Mapping of job key to verdict
+        """
+        if not verdicts:
+            return
+
+        now = time.time()
+        rows = [(self._key(criteria_key, job_key), int(verdict), now, now) for job_key, verdict in verdicts.items()]
+
+        with self._lock:
+            for key, verdict, created_at, _ in rows:
+                self._remember(key, bool(verdict), created_at)
+
+            self._db.executemany("INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?)", rows)
+            self._db.commit()
+
+            self._writes_since_trim += len(rows)
+            if self._writes_since_trim >= max(1, self.max_rows // 10):
+                self._trim_disk(now)
+
+    async def get_many_async(self, criteria_key: str, job_keys: Iterable[str]) -> Dict[str, bool]:
+        """
+        get_many on a worker thread, so the SQLite read (and LRU touch) doesn't block the event loop
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_many, criteria_key, list(job_keys))
+
+    async def set_many_async(self, criteria_key: str, verdicts: Dict[str, bool]):
+        """
+        set_many on a worker thread, so the SQLite write and commit don't block the event loop
+        """
+        if verdicts:
+            await asyncio.get_running_loop().run_in_executor(None, self.set_many, criteria_key, verdicts)
+
+    def _remember(self, key: str, verdict: bool, created_at: float):
+        self._memory[key] = (verdict, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _trim_disk(self, now: float):
+        self._writes_since_trim = 0
+        expired = self._db.execute("DELETE FROM verdicts WHERE created_at <= ?", (now - self.ttl,)).rowcount
+
+        overflow = self._db.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0] - self.max_rows
+        if overflow > 0:
+            order_column = "accessed_at" if self.eviction == "lru" else "created_at"
+            self._db.execute(
+                f"DELETE FROM verdicts WHERE key IN "
+                f"(SELECT key FROM verdicts ORDER BY {order_column} LIMIT ?)",
+                (overflow,),
+            )
+
+        self._db.commit()
+        self.stats["evictions"] += expired + max(overflow, 0)
+
+    def hit_ratio(self) -> float:
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        total = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_verdict_cache: Optional[VerdictCache] = None
+_verdict_cache_lock = threading.Lock()
+
+
+def get_verdict_cache() -> Optional[VerdictCache]:
+    """
+    Return the app-wide verdict cache, or None when caching is disabled
+    """
+    global _verdict_cache
+    if not settings.VERDICT_CACHE_ENABLED:
+        return None
+    with _verdict_cache_lock:
+        if _verdict_cache is None:
+            _verdict_cache = VerdictCache()
+        return _verdict_cache
+
+
+def close_verdict_cache():
+    """
+    Close the app-wide verdict cache if it was created
+    """
+    global _verdict_cache
+    with _verdict_cache_lock:
+        if _verdict_cache is not None:
+            _verdict_cache.close()
+            _verdict_cache = None
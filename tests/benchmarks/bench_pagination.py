@@ -0,0 +1,59 @@
+"""
+Jobs per second per source for sequential vs parallel results-page fetches
+
+Pages are served over a mocked HTTP transport with a fixed per-page latency,
+so this measures the pagination strategy rather than the network.
+
+Run with: python -m tests.benchmarks.bench_pagination
+"""
+import asyncio
+import time
+
+import httpx
+
+from app.core.config import settings
+from app.services.scrapers import base_scraper
+from app.services.scrapers.http_client import ScraperHttpClient
+from app.services.scrapers.indeed_scraper import IndeedScraper
+from app.services.scrapers.linkedin_scraper import LinkedInScraper
+from tests.benchmarks.synthetic import generate_jobs, indeed_results_page, linkedin_results_page
+
+PAGE_LATENCY = 0.25
+POSTINGS = generate_jobs(1000)
+
+
+def results_client(render_page, page_size: int) -> ScraperHttpClient:
+    async def handler(request):
+        start = int(request.url.params.get("start", 0))
+        await asyncio.sleep(PAGE_LATENCY)
+        return httpx.Response(200, text=render_page(POSTINGS[start:start + page_size]))
+
+    return ScraperHttpClient(transport=httpx.MockTransport(handler))
+
+
+async def jobs_per_second(scraper, render_page, max_results: int, concurrency: int) -> float:
+    client = results_client(render_page, scraper.page_size)
+    base_scraper.get_http_client = lambda: client
+    settings.SCRAPER_PAGE_CONCURRENCY = concurrency
+
+    started = time.perf_counter()
+    jobs = await scraper.fetch_jobs_async("Engineer", "Lahore", max_results=max_results)
+    elapsed = time.perf_counter() - started
+
+    await client.aclose()
+    return len(jobs) / elapsed
+
+
+async def main(max_results: int = 100):
+    settings.SCRAPER_PAGE_LIMIT = 20
+    print(f"{max_results} results per source, {PAGE_LATENCY * 1000:.0f} ms per page")
+    for scraper, render_page in ((LinkedInScraper(), linkedin_results_page), (IndeedScraper(), indeed_results_page)):
+        pages = -(-max_results // scraper.page_size)
+        sequential = await jobs_per_second(scraper, render_page, max_results, concurrency=1)
+        parallel = await jobs_per_second(scraper, render_page, max_results, concurrency=pages)
+        print(f"  {scraper.source_name:<9} {pages:2d} pages  sequential {sequential:8.1f} jobs/s  "
+              f"parallel {parallel:8.1f} jobs/s  ({parallel / sequential:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+"""
+Compare the legacy BeautifulSoup html.parser card extraction with the lxml XPath parser
+
+Uses the saved results pages in tests/fixtures. The app no longer depends on
+BeautifulSoup; install it for this benchmark only (pip install beautifulsoup4).
+
+Run with: python -m tests.benchmarks.bench_parsing
+"""
+import os
+import time
+from typing import Dict, List
+
+from bs4 import BeautifulSoup
+
+from app.services.scrapers.indeed_scraper import IndeedScraper
+from app.services.scrapers.linkedin_scraper import LinkedInScraper
+from app.services.scrapers.parsing import ParsePool
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures")
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def legacy_linkedin_parse(html: str) -> List[Dict]:
+    """What LinkedInScraper.parse_jobs did before the lxml parser (without the 10-job cap)"""
+    jobs = []
+    for job in BeautifulSoup(html, "html.parser").find_all("div", class_="job-search-card"):
+        title = job.find("h3", class_="base-search-card__title")
+        company = job.find("h4", class_="base-search-card__subtitle")
+        location = job.find("span", class_="job-search-card__location")
+        link = job.find("a", class_="base-card__full-link")
+        jobs.append({
+            "job_title": title.text.strip() if title else "Unknown Title",
+            "company": company.text.strip() if company else "Unknown Company",
+            "location": location.text.strip() if location else "Unknown Location",
+            "apply_link": link["href"] if link else "#",
+        })
+    return jobs
+
+
+def legacy_indeed_parse(html: str) -> List[Dict]:
+    """What IndeedScraper.parse_jobs did before the lxml parser (without the 10-job cap)"""
+    jobs = []
+    for job in BeautifulSoup(html, "html.parser").find_all("div", class_="job_seen_beacon"):
+        title = job.find("h2", class_="jobTitle")
+        company = job.find("span", class_="companyName")
+        location = job.find("div", class_="companyLocation")
+        salary = job.find("div", class_="salary-snippet-container")
+        job_id = job.get("data-jk", "")
+        jobs.append({
+            "job_title": title.text.strip() if title else "Unknown Title",
+            "company": company.text.strip() if company else "Unknown Company",
+            "location": location.text.strip() if location else "Unknown Location",
+            "apply_link": f"https://www.indeed.com/viewjob?jk={job_id}" if job_id else "#",
+            "salary": salary.text.strip() if salary else "Not specified",
+        })
+    return jobs
+
+
+def best_of(func, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    inline = ParsePool(max_workers=0)
+    offloaded = ParsePool(max_workers=2, min_bytes=0)
+
+    for name, scraper, legacy in (
+        ("linkedin_search.html", LinkedInScraper(), legacy_linkedin_parse),
+        ("indeed_search.html", IndeedScraper(), legacy_indeed_parse),
+    ):
+        html = load_fixture(name)
+        legacy_time, legacy_jobs = best_of(lambda: legacy(html))
+        lxml_time, cards = best_of(lambda: inline.parse(html, scraper.card_xpath, scraper.field_xpaths))
+        offloaded.parse(html, scraper.card_xpath, scraper.field_xpaths)  # start the worker processes
+        process_time, _ = best_of(lambda: offloaded.parse(html, scraper.card_xpath, scraper.field_xpaths))
+
+        print(f"{name} ({len(html) / 1024:.0f} KB, {len(cards)} cards)")
+        print(f"  BeautifulSoup html.parser: {legacy_time * 1000:8.2f} ms  {len(legacy_jobs)} jobs")
+        print(f"  lxml XPath:                {lxml_time * 1000:8.2f} ms  ({legacy_time / lxml_time:.1f}x)")
+        print(f"  lxml XPath, process pool:  {process_time * 1000:8.2f} ms  (off the GIL)")
+
+    offloaded.shutdown()
+
+
+if __name__ == "__main__":
+    main()
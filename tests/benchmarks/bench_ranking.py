@@ -0,0 +1,66 @@
+"""
+Compare the legacy substring filter with the BM25 ranker
+
+Run with: python -m tests.benchmarks.bench_ranking
+"""
+import statistics
+import time
+from typing import Dict, List
+
+from app.schemas.job import JobSearchRequest
+from app.services.ranking import BM25Ranker
+from tests.benchmarks.synthetic import generate_jobs
+
+
+def legacy_basic_filtering(jobs: List[Dict], request: JobSearchRequest) -> List[Dict]:
+    """The nested substring loop RelevanceFilter._basic_filtering used before BM25"""
+    relevant_jobs = []
+    position_keywords = set(request.position.lower().split())
+    skills_keywords = set(skill.strip().lower() for skill in request.skills.split(','))
+
+    for job in jobs:
+        title = job["job_title"].lower()
+        title_match = any(keyword in title for keyword in position_keywords)
+        skills_match = any(skill in title for skill in skills_keywords)
+        if title_match or skills_match:
+            relevant_jobs.append(job)
+
+    return relevant_jobs
+
+
+def median_of(func, repeat=21):
+    func()  # warm up (lazy imports, first allocations)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), result
+
+
+def distinct_titles(jobs: List[Dict]) -> List[Dict]:
+    """Give every job its own title, so nothing can be shared between repeated titles"""
+    return [dict(job, job_title=f"{job['job_title']} at {job['company']} #{i}") for i, job in enumerate(jobs)]
+
+
+def main(count: int = 10_000):
+    request = JobSearchRequest(
+        position="Full Stack Engineer",
+        experience="2 years",
+        skills="full stack, MERN, Node.js, Express.js, React.js, Next.js, Firebase, TailwindCSS, CSS Frameworks",
+    )
+    ranker = BM25Ranker()
+    jobs = generate_jobs(count)
+
+    for label, dataset in (("repeated titles", jobs), ("distinct titles", distinct_titles(jobs))):
+        legacy_time, legacy = median_of(lambda: legacy_basic_filtering(dataset, request))
+        bm25_time, ranked = median_of(lambda: ranker.rank(dataset, request))
+
+        print(f"{count} jobs, {label} (median of 21 runs)")
+        print(f"  legacy substring filter: {legacy_time * 1000:8.2f} ms  kept {len(legacy)} (unranked)")
+        print(f"  BM25 ranker:             {bm25_time * 1000:8.2f} ms  kept {len(ranked)} (ranked)")
+        print(f"  speedup:                 {legacy_time / bm25_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
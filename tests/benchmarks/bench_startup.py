@@ -0,0 +1,121 @@
+"""
+Measure how long importing the app takes and how much memory a fresh worker holds
+
+Each run imports app.main in a new interpreter and records the import time,
+the peak resident set size and which heavy optional backends got loaded
+(they should load on first use, not at startup). One extra run with
+python -X importtime lists the slowest imports. p50 import time and RSS are
+compared against the "startup" entry of tests/benchmarks/baseline.json.
+
+Run with:
+    python -m tests.benchmarks.bench_startup            # run and compare with the baseline
+    python -m tests.benchmarks.bench_startup --save     # store the results as the new baseline
+    python -m tests.benchmarks.bench_startup --check    # exit 1 if import time or RSS regressed beyond --tolerance
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from tests.benchmarks.suite import BASELINE_PATH, load_baseline
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Backends that only some fetch or filter modes need
+HEAVY_MODULES = ["numpy", "openai", "selenium", "webdriver_manager", "bs4", "requests"]
+
+PROBE = f"""
+import json, resource, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "import_ms": elapsed * 1000,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "loaded": [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+def probe() -> Dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def slowest_imports(limit: int = 10) -> List[tuple]:
+    """
+    Third-party and stdlib packages by cumulative import time, from python -X importtime
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"], cwd=ROOT, capture_output=True, text=True
+    ).stderr
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if cumulative.strip().isdigit() and "." not in name and name != "app":
+            totals[name] = max(totals.get(name, 0), int(cumulative) / 1000)
+    return sorted(totals.items(), key=lambda item: -item[1])[:limit]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters to measure (default 10)")
+    parser.add_argument("--save", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="exit 1 if import time or RSS regressed")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown (default 0.5 = 50%%)")
+    args = parser.parse_args(argv)
+
+    probe()  # compile .pyc files so every measured run starts the same way
+    runs = [probe() for _ in range(args.runs)]
+    result = {
+        "runs": args.runs,
+        "import_p50_ms": round(float(np.percentile([run["import_ms"] for run in runs], 50)), 1),
+        "import_p95_ms": round(float(np.percentile([run["import_ms"] for run in runs], 95)), 1),
+        "rss_mb": round(float(np.median([run["rss_mb"] for run in runs])), 1),
+        "heavy_modules_loaded": runs[-1]["loaded"],
+    }
+
+    print("Slowest imports (cumulative ms):")
+    for name, ms in slowest_imports():
+        print(f"  {name:40} {ms:8.1f}")
+    print()
+
+    baseline = load_baseline()
+    stored = baseline.get("startup", {})
+    regressions = []
+    for key in ("import_p50_ms", "import_p95_ms", "rss_mb"):
+        change = ""
+        if stored.get(key):
+            ratio = result[key] / stored[key]
+            change = f"{(ratio - 1) * 100:+.0f}% vs baseline"
+            if key != "import_p95_ms" and ratio > 1 + args.tolerance:
+                change += "  REGRESSION"
+                regressions.append(key)
+        print(f"{key:20} {result[key]:10.1f}  {change}")
+    print(f"{'heavy modules':20} {', '.join(result['heavy_modules_loaded']) or 'none'}")
+
+    if args.save:
+        baseline = dict(baseline, startup=dict(result, python=platform.python_version()))
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Saved startup baseline to {BASELINE_PATH}")
+
+    if args.check and regressions:
+        print(f"Startup regressed by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
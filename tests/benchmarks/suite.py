@@ -0,0 +1,234 @@
+"""
+Offline benchmark suite for the scrape-parse-filter hot paths
+
+Every stage runs without network access: results pages come from the saved
+fixtures in tests/fixtures, jobs from the synthetic generator, and LLM calls
+from a stub that answers instantly. For each stage the suite reports p50, p95
+and p99 latency per run plus throughput in jobs per second, and compares p50
+against the stored baseline (tests/benchmarks/baseline.json).
+
+Run with:
+    python -m tests.benchmarks.suite                  # run and compare with the baseline
+    python -m tests.benchmarks.suite --save           # run and store the results as the new baseline
+    python -m tests.benchmarks.suite --check          # exit 1 if any stage regressed beyond --tolerance
+    python -m tests.benchmarks.suite --stage parse    # only stages whose name contains "parse"
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.services.dedup import deduplicate_jobs
+from app.services.relevance_filter import RelevanceFilter
+from app.services.scrapers.indeed_scraper import IndeedScraper
+from app.services.scrapers.linkedin_scraper import LinkedInScraper
+from app.services.scrapers.parsing import shutdown_parse_pool
+from tests.benchmarks.bench_parsing import load_fixture
+from tests.benchmarks.synthetic import generate_jobs
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+REQUEST = JobSearchRequest(
+    position="Full Stack Engineer",
+    experience="2 years",
+    salary="70,000 PKR to 120,000 PKR",
+    jobNature="onsite",
+    location="Lahore, Pakistan",
+    skills="full stack, MERN, Node.js, Express.js, React.js, Next.js, Firebase, TailwindCSS, CSS Frameworks",
+)
+
+
+class StubLLM:
+    """
+    Answers every prompt instantly, so only the filter's own overhead is measured
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def reply(self, prompt: str) -> str:
+        self.calls += 1
+        ids = [int(line.split(".")[0]) for line in prompt.splitlines() if line[:1].isdigit() and "." in line]
+        if not ids:
+            return "YES"
+        return json.dumps({"verdicts": [{"id": i, "relevant": i % 2 == 1} for i in ids]})
+
+    def chat_completion(self, prompt: str, max_tokens: int) -> str:
+        return self.reply(prompt)
+
+    async def chat(self, prompt: str, max_tokens: int, system_prompt: Optional[str] = None) -> str:
+        return self.reply(prompt)
+
+
+class Stage:
+    def __init__(self, name: str, items: int, run: Callable[[], object], runs: int):
+        self.name = name
+        self.items = items
+        self.run = run
+        self.runs = runs
+
+
+def parse_stage(name: str, scraper, fixture: str, runs: int) -> Stage:
+    html = load_fixture(fixture)
+    items = len(scraper.parse_jobs(html))
+    return Stage(name, items, lambda: scraper.parse_jobs(html), runs)
+
+
+def basic_filtering_stage(count: int, runs: int) -> Stage:
+    jobs = generate_jobs(count)
+    relevance_filter = RelevanceFilter()
+    return Stage(f"basic_filtering_{count}", count, lambda: relevance_filter._basic_filtering(jobs, REQUEST), runs)
+
+
+def llm_filter_stage(count: int, runs: int) -> Stage:
+    jobs = generate_jobs(count)
+    stub = StubLLM()
+    relevance_filter = RelevanceFilter()
+    relevance_filter.use_openai = True
+    relevance_filter._chat_completion = stub.chat_completion
+    return Stage(f"filter_jobs_stub_llm_{count}", count, lambda: relevance_filter.filter_jobs(jobs, REQUEST), runs)
+
+
+def cascade_stage(count: int, runs: int) -> Stage:
+    jobs = generate_jobs(count)
+    relevance_filter = RelevanceFilter(llm_client=StubLLM())
+    relevance_filter.use_openai = True
+    loop = asyncio.new_event_loop()
+    run = lambda: loop.run_until_complete(relevance_filter.filter_jobs_async(jobs, REQUEST))
+    return Stage(f"filter_jobs_async_stub_llm_{count}", count, run, runs)
+
+
+def batch_cascade_stage(searches: int, count: int, runs: int) -> Stage:
+    """
+    Several saved searches over the same candidates, filtered in one pass
+    """
+    jobs = generate_jobs(count)
+    skills = REQUEST.skills.split(", ")
+    requests = [REQUEST.copy(update={"skills": ", ".join(skills[i:] + skills[:i])}) for i in range(searches)]
+    relevance_filter = RelevanceFilter(llm_client=StubLLM())
+    relevance_filter.use_openai = True
+    loop = asyncio.new_event_loop()
+    run = lambda: loop.run_until_complete(relevance_filter.filter_jobs_many([(jobs, r) for r in requests]))
+    return Stage(f"filter_jobs_many_stub_llm_{searches}x{count}", searches * count, run, runs)
+
+
+def dedup_stage(count: int, runs: int) -> Stage:
+    jobs = generate_jobs(count)
+    return Stage(f"dedup_{count}", count, lambda: deduplicate_jobs(jobs), runs)
+
+
+def build_stages() -> List[Stage]:
+    return [
+        parse_stage("parse_linkedin", LinkedInScraper(), "linkedin_search.html", runs=30),
+        parse_stage("parse_indeed", IndeedScraper(), "indeed_search.html", runs=30),
+        basic_filtering_stage(100, runs=200),
+        basic_filtering_stage(10_000, runs=20),
+        basic_filtering_stage(100_000, runs=5),
+        llm_filter_stage(1_000, runs=10),
+        cascade_stage(1_000, runs=10),
+        batch_cascade_stage(10, 1_000, runs=5),
+        dedup_stage(10_000, runs=5),
+    ]
+
+
+def measure(stage: Stage) -> Dict[str, float]:
+    stage.run()  # warm up caches and worker processes
+    timings = []
+    for _ in range(stage.runs):
+        started = time.perf_counter()
+        stage.run()
+        timings.append(time.perf_counter() - started)
+
+    ms = np.array(timings) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {
+        "items": stage.items,
+        "runs": stage.runs,
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "jobs_per_second": round(stage.items / (p50 / 1000), 1) if p50 else 0.0,
+    }
+
+
+def load_baseline() -> Dict:
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def report(results: Dict[str, Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Print a results table and return the stages whose p50 regressed beyond tolerance
+    """
+    stored = baseline.get("stages", {})
+    regressions = []
+    print(f"{'stage':34} {'jobs':>7} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'jobs/s':>12}  vs baseline")
+    for name, result in results.items():
+        change = ""
+        if name in stored and stored[name]["p50_ms"]:
+            ratio = result["p50_ms"] / stored[name]["p50_ms"]
+            change = f"{(ratio - 1) * 100:+.0f}%"
+            if ratio > 1 + tolerance:
+                change += "  REGRESSION"
+                regressions.append(name)
+        print(
+            f"{name:34} {result['items']:>7} {result['p50_ms']:>10.2f} {result['p95_ms']:>10.2f} "
+            f"{result['p99_ms']:>10.2f} {result['jobs_per_second']:>12,.0f}  {change}"
+        )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="exit 1 if any stage regressed")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed p50 slowdown (default 0.5 = 50%%)")
+    parser.add_argument("--stage", default="", help="only run stages whose name contains this")
+    args = parser.parse_args(argv)
+
+    # Keep LLM verdicts out of the on-disk cache so every run does the same work
+    settings.VERDICT_CACHE_ENABLED = False
+    logging.disable(logging.WARNING)
+
+    results = {}
+    try:
+        for stage in build_stages():
+            if args.stage in stage.name:
+                results[stage.name] = measure(stage)
+    finally:
+        shutdown_parse_pool(wait=True)
+
+    baseline = load_baseline()
+    if baseline:
+        print(f"Baseline: {baseline.get('python', '?')} on {baseline.get('machine', '?')}")
+    regressions = report(results, baseline, args.tolerance)
+
+    if args.save:
+        stages = dict(baseline.get("stages", {}), **results)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(
+                dict(baseline, python=platform.python_version(), machine=platform.machine(), stages=stages),
+                f, indent=2, sort_keys=True,
+            )
+            f.write("\n")
+        print(f"Saved baseline to {BASELINE_PATH}")
+
+    if args.check and regressions:
+        print(f"{len(regressions)} stage(s) regressed by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
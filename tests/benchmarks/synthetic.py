@@ -0,0 +1,67 @@
+import random
+from typing import Dict, List
+
+TITLES = [
+    "Full Stack Developer", "MERN Stack Engineer", "Senior JavaScript Developer", "React.js Developer",
+    "Node.js Backend Developer", "Frontend Engineer", "Data Scientist", "Product Manager",
+    "DevOps Engineer", "QA Automation Engineer", "Python Developer", "Mobile App Developer (Flutter)",
+    "UI/UX Designer", "Machine Learning Engineer", "Technical Support Specialist", "Sales Executive",
+]
+SENIORITY = ["", "Junior ", "Senior ", "Lead ", "Associate "]
+COMPANIES = ["TechCorp", "InnovateTech", "Digital Solutions", "WebApps Inc", "CodeMasters", "Future Technologies"]
+CITIES = ["Lahore", "Islamabad", "Karachi", "Peshawar", "Rawalpindi", "Remote"]
+NATURES = ["Onsite", "Remote", "Hybrid"]
+SOURCES = ["LinkedIn", "Indeed", "Glassdoor"]
+
+
+def generate_jobs(count: int, seed: int = 42) -> List[Dict]:
+    """
+    Deterministic synthetic job postings shaped like scraper output
+    """
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        low = rng.randrange(50, 200) * 1000
+        jobs.append({
+            "job_title": rng.choice(SENIORITY) + rng.choice(TITLES),
+            "company": rng.choice(COMPANIES),
+            "experience": f"{rng.randint(0, 4)}-{rng.randint(5, 8)} years",
+            "jobNature": rng.choice(NATURES),
+            "location": f"{rng.choice(CITIES)}, Pakistan",
+            "salary": f"{low:,} - {low + 30000:,} PKR",
+            "apply_link": f"https://example.com/jobs/{i}",
+            "source": rng.choice(SOURCES),
+        })
+    return jobs
+
+
+def linkedin_results_page(jobs: List[Dict]) -> str:
+    """
+    A LinkedIn guest search results page listing the given jobs
+    """
+    cards = "".join(
+        '<li><div class="base-card job-search-card">'
+        f'<a class="base-card__full-link" href="{job["apply_link"]}"></a>'
+        f'<h3 class="base-search-card__title">{job["job_title"]}</h3>'
+        f'<h4 class="base-search-card__subtitle">{job["company"]}</h4>'
+        f'<span class="job-search-card__location">{job["location"]}</span>'
+        '</div></li>'
+        for job in jobs
+    )
+    return f'<html><body><ul class="jobs-search__results-list">{cards}</ul></body></html>'
+
+
+def indeed_results_page(jobs: List[Dict]) -> str:
+    """
+    An Indeed search results page listing the given jobs
+    """
+    cards = "".join(
+        f'<div class="job_seen_beacon" data-jk="{job["apply_link"].rsplit("/", 1)[-1]}">'
+        f'<h2 class="jobTitle">{job["job_title"]}</h2>'
+        f'<span class="companyName">{job["company"]}</span>'
+        f'<div class="companyLocation">{job["location"]}</div>'
+        f'<div class="salary-snippet-container">{job["salary"]}</div>'
+        '</div>'
+        for job in jobs
+    )
+    return f'<html><body><div id="mosaic-provider-jobcards">{cards}</div></body></html>'
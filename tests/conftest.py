@@ -1,5 +1,11 @@
 import pytest
 
+from app.core.config import settings
+from app.services.search_cache import reset_search_cache
+from app.services.verdict_cache import close_verdict_cache
+from app.services.job_store import close_job_store
+from app.services.circuit_breaker import reset_circuit_breakers
+
 @pytest.fixture
 def sample_job_data():
     return {
@@ -8,4 +14,20 @@ def sample_job_data():
         "location": "Remote",
         "description": "Develop and maintain software applications.",
         "url": "https://example.com/job/software-engineer"
-    }
\ No newline at end of file
+    }
+
+@pytest.fixture(autouse=True)
+def isolated_caches(monkeypatch):
+    """Keep app-wide caches in memory and fresh for every test"""
+    monkeypatch.setattr(settings, "VERDICT_CACHE_PATH", ":memory:")
+    monkeypatch.setattr(settings, "JOB_STORE_PATH", ":memory:")
+    monkeypatch.setattr(settings, "TRACE_SAMPLE_RATE", 0.0)
+    # App lifespans in the API tests must not download chromedriver or launch browsers
+    monkeypatch.setattr(settings, "BROWSER_WARM_UP_ENABLED", False)
+    reset_search_cache()
+    reset_circuit_breakers()
+    yield
+    close_verdict_cache()
+    close_job_store()
+    reset_search_cache()
+    reset_circuit_breakers()
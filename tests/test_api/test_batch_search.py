@@ -0,0 +1,33 @@
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_job_service
+from app.core.config import settings
+from app.main import app
+from tests.test_services.test_job_service import make_service, scrape_calls
+
+client = TestClient(app)
+
+
+def search(position, location):
+    return {"position": position, "experience": "2 years", "location": location, "skills": "Python"}
+
+
+def test_batch_returns_one_result_per_search(monkeypatch):
+    service = make_service()
+    monkeypatch.setitem(app.dependency_overrides, get_job_service, lambda: service)
+    searches = [search("Engineer", "Lahore"), search("Engineer", "Lahore, Pakistan"), search("Analyst", "Karachi")]
+
+    response = client.post("/api/v1/jobs/search/batch", json={"searches": searches})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 3
+    assert all(result["source_status"]["LinkedIn"] == "ok" for result in results)
+    assert scrape_calls(service) == 2 * 3
+
+
+def test_batch_size_is_limited():
+    searches = [search(f"Engineer {i}", "Lahore") for i in range(settings.BATCH_SEARCH_MAX_REQUESTS + 1)]
+
+    assert client.post("/api/v1/jobs/search/batch", json={"searches": searches}).status_code == 422
+    assert client.post("/api/v1/jobs/search/batch", json={"searches": []}).status_code == 422
@@ -0,0 +1,50 @@
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.api.dependencies import get_job_service
+from app.main import app
+from tests.test_services.test_job_service import make_service
+
+client = TestClient(app)
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_search_is_instrumented_per_stage_and_source(monkeypatch):
+    monkeypatch.setitem(app.dependency_overrides, get_job_service, make_service)
+    payload = {"position": "Metrics Engineer", "experience": "2 years", "location": "Lahore", "skills": "Python"}
+    before = {
+        "requests": sample("jobfinder_http_requests_total", method="POST", path="/api/v1/jobs/search", status="200"),
+        "fetch": sample("jobfinder_stage_duration_seconds_count", stage="fetch", source="LinkedIn"),
+        "filter": sample("jobfinder_stage_duration_seconds_count", stage="filter", source="all"),
+        "miss": sample("jobfinder_cache_requests_total", cache="search", result="miss"),
+        "hit": sample("jobfinder_cache_requests_total", cache="search", result="hit"),
+    }
+
+    assert client.post("/api/v1/jobs/search", json=payload).status_code == 200
+    assert client.post("/api/v1/jobs/search", json=payload).status_code == 200
+
+    assert sample("jobfinder_http_requests_total", method="POST", path="/api/v1/jobs/search", status="200") == before["requests"] + 2
+    assert sample("jobfinder_stage_duration_seconds_count", stage="fetch", source="LinkedIn") == before["fetch"] + 1
+    assert sample("jobfinder_stage_duration_seconds_count", stage="filter", source="all") == before["filter"] + 1
+    assert sample("jobfinder_cache_requests_total", cache="search", result="miss") == before["miss"] + 1
+    assert sample("jobfinder_cache_requests_total", cache="search", result="hit") == before["hit"] + 1
+    assert sample("jobfinder_searches_in_progress") == 0
+
+
+def test_metrics_endpoint_exposes_prometheus_text():
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    for name in (
+        "jobfinder_http_requests_total",
+        "jobfinder_stage_duration_seconds",
+        "jobfinder_llm_request_duration_seconds",
+        "jobfinder_cache_requests_total",
+        "jobfinder_cascade_llm_fraction",
+        "jobfinder_searches_in_progress",
+    ):
+        assert name in response.text
@@ -0,0 +1,22 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_job_service
+from app.main import app
+from tests.test_services.test_job_service import make_service
+
+client = TestClient(app)
+
+
+def test_search_stream_returns_ndjson_events(monkeypatch):
+    monkeypatch.setitem(app.dependency_overrides, get_job_service, make_service)
+    payload = {"position": "Engineer", "experience": "2 years", "location": "Lahore", "skills": "Python"}
+
+    response = client.post("/api/v1/jobs/search/stream", json=payload)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["event"] for event in events] == ["jobs", "jobs", "jobs", "summary"]
+    assert all(set(job) >= {"job_title", "apply_link", "source"} for event in events[:-1] for job in event["jobs"])
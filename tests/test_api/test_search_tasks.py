@@ -0,0 +1,37 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_search_tasks
+from app.main import app
+from app.services.search_tasks import SearchTaskQueue
+from tests.test_services.test_job_service import make_service
+
+client = TestClient(app)
+
+SEARCH = {"position": "Engineer", "experience": "2 years", "location": "Lahore", "skills": "Python"}
+
+
+def test_async_search_returns_task_then_results(monkeypatch):
+    queue = SearchTaskQueue(make_service(), workers=1)
+    monkeypatch.setitem(app.dependency_overrides, get_search_tasks, lambda: queue)
+
+    with TestClient(app) as live_client:
+        submitted = live_client.post("/api/v1/jobs/search/async", json=SEARCH)
+        assert submitted.status_code == 202
+        status_url = submitted.json()["status_url"]
+        assert status_url == f"/api/v1/jobs/search/{submitted.json()['task_id']}"
+
+        for _ in range(50):
+            status = live_client.get(status_url).json()
+            if status["status"] == "done":
+                break
+            time.sleep(0.02)
+
+    assert status["status"] == "done"
+    assert status["sources"] == {"LinkedIn": "ok", "Indeed": "ok", "Glassdoor": "ok"}
+    assert len(status["result"]["relevant_jobs"]) == 3
+
+
+def test_unknown_task_is_not_found():
+    assert client.get("/api/v1/jobs/search/missing").status_code == 404
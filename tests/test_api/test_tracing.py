@@ -0,0 +1,38 @@
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_job_service
+from app.core.config import settings
+from app.main import app
+from tests.test_services.test_job_service import make_service
+
+client = TestClient(app)
+
+PAYLOAD = {"position": "Tracing Engineer", "experience": "2 years", "location": "Lahore", "skills": "Python"}
+
+
+def test_search_reports_stage_timings_in_server_timing(monkeypatch):
+    monkeypatch.setitem(app.dependency_overrides, get_job_service, make_service)
+
+    response = client.post("/api/v1/jobs/search", json=PAYLOAD)
+
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    for name in ("total", "fetch.LinkedIn", "fetch.Indeed", "filter", "serialize"):
+        assert f"{name};dur=" in timing
+    assert "debug_trace" not in response.json()
+
+
+def test_debug_trace_is_opt_in(monkeypatch):
+    monkeypatch.setitem(app.dependency_overrides, get_job_service, make_service)
+    monkeypatch.setattr(settings, "TRACE_DEBUG_ENABLED", True)
+
+    response = client.post("/api/v1/jobs/search", json=PAYLOAD, headers={"X-Debug-Trace": "1"})
+
+    trace = response.json()["debug_trace"]
+    assert trace["name"] == "POST /api/v1/jobs/search"
+    assert "fetch.Glassdoor" in [child["name"] for child in trace["children"]]
+    assert "relevant_jobs" in response.json()
+
+    monkeypatch.setattr(settings, "TRACE_DEBUG_ENABLED", False)
+    response = client.post("/api/v1/jobs/search", json=PAYLOAD, headers={"X-Debug-Trace": "1"})
+    assert "debug_trace" not in response.json()
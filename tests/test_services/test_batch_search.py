@@ -0,0 +1,62 @@
+import pytest
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.services.relevance_filter import RelevanceFilter
+from tests.test_services.test_job_service import make_service, scrape_calls
+from tests.test_services.test_relevance_filter import RecordingLLM, titled
+
+
+def search(position, location, skills):
+    return JobSearchRequest(position=position, experience="2 years", location=location, skills=skills)
+
+
+@pytest.mark.asyncio
+async def test_batch_scrapes_each_distinct_query_once():
+    service = make_service()
+    requests = [
+        search("Python Engineer", "Lahore, Pakistan", "Django"),
+        search("python  engineer", "LHR", "FastAPI"),
+        search("Data Analyst", "Karachi", "SQL"),
+        search("Python Engineer", "Lahore", "Flask"),
+    ]
+
+    results = await service.search_many(requests)
+
+    assert scrape_calls(service) == 2 * 3
+    assert len(results) == 4
+    assert all(status == {"LinkedIn": "ok", "Indeed": "ok", "Glassdoor": "ok"} for _, status in results)
+    assert "Python Engineer" in results[0][0][0]["job_title"]
+    assert "Data Analyst" in results[2][0][0]["job_title"]
+
+
+@pytest.mark.asyncio
+async def test_batch_serves_cached_searches_without_scraping():
+    service = make_service()
+    cached = search("Python Engineer", "Lahore", "Django")
+    await service.search(cached)
+    calls = scrape_calls(service)
+
+    results = await service.search_many([cached, search("Data Analyst", "Karachi", "SQL")])
+
+    assert scrape_calls(service) == calls + 3
+    assert set(results[0][1].values()) == {"cached"}
+
+
+@pytest.mark.asyncio
+async def test_shared_candidates_are_judged_once_per_criteria(monkeypatch):
+    monkeypatch.setattr(settings, "CASCADE_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_BATCH_ENABLED", False)
+    monkeypatch.setattr(settings, "VERDICT_CACHE_ENABLED", False)
+    llm = RecordingLLM()
+    relevance_filter = RelevanceFilter(llm_client=llm)
+    relevance_filter.use_openai = True
+    jobs = titled("Senior Python Engineer (Django)", "Accountant", "Python Developer")
+    django = search("Python Engineer", "Lahore", "Django")
+    flask = search("Python Engineer", "Lahore", "Flask")
+
+    results = await relevance_filter.filter_jobs_many([(jobs, django), (jobs, django), (jobs, flask)])
+
+    assert [len(kept) for kept in results] == [2, 2, 2]
+    # "Python Developer" is ambiguous for both criteria; "Senior Python Engineer (Django)" only for Flask
+    assert len(llm.prompts) == 3
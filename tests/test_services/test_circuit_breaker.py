@@ -0,0 +1,128 @@
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.services.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from app.services.scrapers.base_scraper import ScrapeError
+from app.services.scrapers.indeed_scraper import IndeedScraper
+from app.services.single_flight import SingleFlight
+from tests.test_services.test_job_service import FakeScraper, make_service
+
+
+class FailingScraper(FakeScraper):
+    async def fetch_jobs_async(self, query, location, max_results=None, count_relevant=None):
+        self.calls += 1
+        raise RuntimeError("blocked")
+
+
+def make_request(**fields):
+    return JobSearchRequest(position="Engineer", experience="2 years", location="Lahore", skills="Python", **fields)
+
+
+def test_breaker_opens_after_repeated_failures_and_recovers():
+    breaker = CircuitBreaker("LinkedIn", failure_threshold=2, cooldown=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_source_is_reported_as_timed_out():
+    service = make_service()
+    # The abandoned scrape keeps running, so keep it out of the app-wide flight group
+    service.source_flight = SingleFlight("source")
+    service.glassdoor_scraper = FakeScraper("Glassdoor", delay=1)
+
+    started = time.perf_counter()
+    jobs, source_status = await service.search(make_request(time_budget=0.2))
+
+    assert time.perf_counter() - started < 1
+    assert source_status == {"LinkedIn": "ok", "Indeed": "ok", "Glassdoor": "timeout"}
+    assert {job["source"] for job in jobs} == {"LinkedIn", "Indeed"}
+
+
+@pytest.mark.asyncio
+async def test_partial_results_are_cached_for_a_shorter_time(monkeypatch):
+    service = make_service()
+    service.indeed_scraper = FailingScraper("Indeed")
+
+    _, first_status = await service.search(make_request())
+    _, second_status = await service.search(make_request())
+
+    assert first_status["Indeed"] == "error"
+    assert set(second_status.values()) == {"cached"}
+    assert service.indeed_scraper.calls == 1
+    assert service.search_cache.stats["fresh_hits"] == 1
+
+    # Past SEARCH_CACHE_PARTIAL_FRESH_SECONDS the partial result is served stale and refreshed
+    monkeypatch.setattr(settings, "SEARCH_CACHE_PARTIAL_FRESH_SECONDS", 0)
+    developer = make_request().copy(update={"position": "Developer"})
+    await service.search(developer)
+    _, stale_status = await service.search(developer)
+    await service.search_cache.wait_for_refreshes()
+
+    assert set(stale_status.values()) == {"cached"}
+    assert service.search_cache.stats["stale_hits"] == 1
+    assert service.search_cache.stats["refreshes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_skips_source():
+    service = make_service()
+    service.indeed_scraper = FailingScraper("Indeed")
+    breaker = get_circuit_breaker("Indeed")
+    breaker.failure_threshold = 2
+
+    for position in ("Engineer", "Developer", "Analyst"):
+        _, source_status = await service.search(make_request().copy(update={"position": position}))
+
+    assert source_status["Indeed"] == "skipped"
+    assert service.indeed_scraper.calls == 2
+    assert source_status["LinkedIn"] == "ok"
+
+
+@contextmanager
+def captcha_browser():
+    raise RuntimeError("Message: timeout waiting for mosaic-provider-jobcards")
+    yield
+
+
+@pytest.mark.asyncio
+async def test_real_scraper_failure_is_an_error_not_mock_data(monkeypatch):
+    monkeypatch.setattr(settings, "HTTP_FETCH_ENABLED", False)
+    scraper = IndeedScraper()
+    monkeypatch.setattr(scraper, "browser", captcha_browser)
+
+    with pytest.raises(ScrapeError):
+        await scraper.fetch_jobs_async("Engineer", "Lahore")
+
+    service = make_service()
+    service.indeed_scraper = scraper
+    breaker = get_circuit_breaker("Indeed")
+    breaker.failure_threshold = 2
+
+    statuses = []
+    for position in ("Engineer", "Developer", "Analyst"):
+        jobs, source_status = await service.search(make_request().copy(update={"position": position}))
+        statuses.append(source_status["Indeed"])
+        assert all(job["source"] != "Indeed" for job in jobs)
+
+    assert statuses == ["error", "error", "skipped"]
+    assert breaker.state == CircuitBreaker.OPEN
@@ -0,0 +1,69 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_job_service
+from app.core.config import settings
+from app.main import app
+from app.services import container as container_module
+from app.services.container import ServiceContainer, get_service_container
+from tests.test_services.test_job_service import make_service
+
+
+class QuickContainer(ServiceContainer):
+    """Container whose warm-up skips browsers and worker processes"""
+
+    def __init__(self, steps):
+        super().__init__(job_service=make_service())
+        self.steps = steps
+
+    def warm_up_steps(self):
+        return self.steps
+
+
+def broken():
+    raise RuntimeError("no chromedriver")
+
+
+@pytest.mark.asyncio
+async def test_warm_up_reports_each_step_and_marks_ready():
+    calls = []
+    container = QuickContainer([
+        ("http_client", lambda: calls.append("http_client"), False),
+        ("parsers", lambda: calls.append("parsers"), True),
+        ("browser_pool", broken, True),
+    ])
+    assert not container.ready
+
+    await container.warm_up()
+
+    assert container.ready
+    assert calls == ["http_client", "parsers"]
+    assert {name: step["status"] for name, step in container.warm_up_status.items()} == {
+        "http_client": "ok", "parsers": "ok", "browser_pool": "error",
+    }
+
+
+def test_browser_warm_up_can_be_skipped(monkeypatch):
+    container = ServiceContainer(job_service=make_service())
+
+    monkeypatch.setattr(settings, "BROWSER_WARM_UP_ENABLED", True)
+    assert "browser_pool" in [name for name, _, _ in container.warm_up_steps()]
+
+    monkeypatch.setattr(settings, "BROWSER_WARM_UP_ENABLED", False)
+    assert "browser_pool" not in [name for name, _, _ in container.warm_up_steps()]
+
+
+def test_ready_endpoint_waits_for_warm_up(monkeypatch):
+    container = QuickContainer([])
+    monkeypatch.setattr(container_module, "_container", container)
+    client = TestClient(app)
+
+    assert client.get("/ready").status_code == 503
+    container.ready = True
+    assert client.get("/ready").json()["ready"] is True
+
+
+def test_requests_share_one_job_service(monkeypatch):
+    monkeypatch.setattr(container_module, "_container", QuickContainer([]))
+
+    assert get_job_service(get_service_container()) is get_job_service(get_service_container())
@@ -0,0 +1,128 @@
+import time
+
+import pytest
+
+from app.schemas.job import JobSearchRequest
+from app.services.dedup import JobDeduplicator, dedup_key, deduplicate_jobs
+from tests.test_services.test_job_service import make_service
+
+
+def make_job(title, company="TechCorp", location="Lahore, Pakistan", source="LinkedIn", **fields):
+    return dict({
+        "job_title": title,
+        "company": company,
+        "experience": "2 years",
+        "jobNature": "Onsite",
+        "location": location,
+        "salary": "Not specified",
+        "apply_link": f"https://{source.lower()}.example.com/{title}/{company}".replace(" ", "-"),
+        "source": source,
+    }, **fields)
+
+
+def test_normalized_key_ignores_abbreviations_word_order_and_legal_suffixes():
+    assert dedup_key(make_job("Sr. Python Dev", "Tech Corp Pvt Ltd", "LHR")) == dedup_key(
+        make_job("Python Developer (Senior)", "TechCorp", "Lahore, Pakistan")
+    )
+    assert dedup_key(make_job("Full-Stack Engineer")) == dedup_key(make_job("Fullstack Engineer"))
+
+
+def test_copies_across_sources_are_merged():
+    jobs = deduplicate_jobs([
+        make_job("Full Stack Engineer"),
+        make_job("Full Stack Enginer", source="Indeed", salary="100,000 PKR"),
+        make_job("Full Stack Engineer", "TechCorp Pvt Ltd", source="Glassdoor"),
+    ])
+
+    assert len(jobs) == 1
+    [job] = jobs
+    assert job["source"] == "LinkedIn"
+    assert job["sources"] == ["LinkedIn", "Indeed", "Glassdoor"]
+    assert len(job["apply_links"]) == 3
+    assert job["salary"] == "100,000 PKR"
+
+
+def test_different_postings_are_kept():
+    jobs = deduplicate_jobs([
+        make_job("Full Stack Engineer"),
+        make_job("Senior Full Stack Engineer", source="Indeed"),
+        make_job("Backend Engineer", source="Indeed"),
+        make_job("Full Stack Engineer", location="Karachi, Pakistan", source="Indeed"),
+        make_job("Full Stack Engineer", "Arbisoft", source="Indeed"),
+    ])
+
+    assert len(jobs) == 5
+    assert all(job["sources"] == [job["source"]] for job in jobs)
+
+
+def test_same_source_postings_with_different_links_are_kept():
+    first = make_job("Python Developer", apply_link="https://linkedin.example.com/jobs/1")
+    second = make_job("Python Developer", apply_link="https://linkedin.example.com/jobs/2")
+    near = make_job("Python Developers", apply_link="https://linkedin.example.com/jobs/3")
+
+    jobs = deduplicate_jobs([first, second, near, dict(second), make_job("Python Developer", source="Indeed")])
+
+    assert [job["apply_link"] for job in jobs] == [first["apply_link"], second["apply_link"], near["apply_link"]]
+    assert jobs[0]["sources"] == ["LinkedIn", "Indeed"]
+    assert jobs[1]["sources"] == ["LinkedIn"]
+
+
+def test_same_source_links_differing_only_in_tracking_parameters_merge():
+    first = make_job("Python Developer", apply_link="https://www.linkedin.com/jobs/view/42?refId=abc&trackingId=x1")
+    repost = make_job("Python Developer", apply_link="https://www.linkedin.com/jobs/view/42/?refId=def&position=3")
+
+    jobs = deduplicate_jobs([first, repost])
+
+    assert len(jobs) == 1
+    assert jobs[0]["apply_links"] == [first["apply_link"]]
+
+
+def test_incremental_add_returns_only_new_postings():
+    deduplicator = JobDeduplicator()
+    assert len(deduplicator.add([make_job("Python Developer"), make_job("Data Analyst")])) == 2
+
+    new = deduplicator.add([make_job("Python Developer", source="Indeed"), make_job("QA Engineer", source="Indeed")])
+
+    assert [job["job_title"] for job in new] == ["QA Engineer"]
+    assert deduplicator.stats["exact_duplicates"] == 1
+
+
+def test_large_batches_scale_roughly_linearly():
+    roles = ["Engineer", "Developer", "Analyst", "Designer", "Manager"]
+    stacks = ["Python", "Java", "React", "Data", "Cloud", "Mobile", "QA", "Security"]
+    jobs = [
+        make_job(f"{stacks[i % 8]} {roles[i // 8 % 5]}", f"Company {i // 40}", ["Lahore", "Karachi"][i % 2])
+        for i in range(10000)
+    ]
+
+    def run(n):
+        started = time.perf_counter()
+        deduplicate_jobs(jobs[:n])
+        return time.perf_counter() - started
+
+    run(1000)
+    assert run(10000) < run(1000) * 25
+
+
+class PostingScraper:
+    enabled = True
+
+    def __init__(self, source):
+        self.source = source
+
+    async def fetch_jobs_async(self, query, location, max_results=None, count_relevant=None):
+        return [make_job("Python Engineer", source=self.source)]
+
+
+@pytest.mark.asyncio
+async def test_search_filters_each_posting_once():
+    service = make_service()
+    service.linkedin_scraper = PostingScraper("LinkedIn")
+    service.indeed_scraper = PostingScraper("Indeed")
+    service.glassdoor_scraper = PostingScraper("Glassdoor")
+    request = JobSearchRequest(position="Engineer", experience="2 years", location="Lahore", skills="Python")
+
+    jobs = await service.find_jobs(request)
+
+    assert len(jobs) == 1
+    assert sorted(jobs[0]["sources"]) == ["Glassdoor", "Indeed", "LinkedIn"]
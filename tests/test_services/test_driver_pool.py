@@ -0,0 +1,77 @@
+import pytest
+
+from app.services.scrapers.driver_pool import DriverPool, DriverPoolTimeout
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+        self.crashed = False
+
+    @property
+    def current_url(self):
+        if self.crashed:
+            raise RuntimeError("session deleted")
+        return "about:blank"
+
+    def get(self, url):
+        if self.crashed:
+            raise RuntimeError("session deleted")
+
+    def execute_cdp_cmd(self, cmd, params):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def pool():
+    pool = DriverPool(size=2, acquire_timeout=0.1, max_pages=3, max_age=3600, driver_factory=FakeDriver)
+    yield pool
+    pool.shutdown()
+
+
+def test_driver_is_reused_between_checkouts(pool):
+    with pool.driver() as first:
+        pass
+    with pool.driver() as second:
+        pass
+    assert first is second
+    assert pool.stats["launched"] == 1
+
+
+def test_driver_is_recycled_after_max_pages(pool):
+    seen = set()
+    for _ in range(4):
+        with pool.driver() as driver:
+            seen.add(id(driver))
+    assert len(seen) == 2
+    assert pool.stats["recycled"] == 1
+
+
+def test_crashed_driver_is_replaced(pool):
+    with pytest.raises(RuntimeError):
+        with pool.driver() as driver:
+            driver.crashed = True
+            raise RuntimeError("boom")
+    assert driver.quit_called
+
+    with pool.driver() as replacement:
+        assert replacement is not driver
+
+
+def test_acquire_times_out_when_pool_is_exhausted(pool):
+    with pool.driver(), pool.driver():
+        with pytest.raises(DriverPoolTimeout):
+            with pool.driver():
+                pass
+
+
+def test_warm_up_and_shutdown(pool):
+    assert pool.warm_up(2) == 2
+    assert pool.stats["launched"] == 2
+    with pool.driver() as driver:
+        pass
+    pool.shutdown()
+    assert driver.quit_called
@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.schemas.job import JobSearchRequest
+from app.services.job_service import JobService
+from app.services.scrapers.glassdoor_scraper import GlassdoorScraper
+from app.services.search_cache import SearchCache, canonical_location, canonical_search_key
+from app.services.single_flight import SingleFlight
+
+
+class FakeScraper:
+    enabled = True
+
+    def __init__(self, source, delay=0.0):
+        self.source = source
+        self.delay = delay
+        self.calls = 0
+
+    async def fetch_jobs_async(self, query, location, max_results=None, count_relevant=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return [{
+            "job_title": f"{query} ({self.calls})",
+            "company": f"{self.source} Co",
+            "experience": "2 years",
+            "jobNature": "Onsite",
+            "location": location,
+            "salary": "Not specified",
+            "apply_link": f"https://{self.source.lower()}.example.com/{query}/{self.calls}",
+            "source": self.source,
+        }]
+
+
+def make_service(search_cache=None, delay=0.0):
+    service = JobService(search_cache=search_cache)
+    service.linkedin_scraper = FakeScraper("LinkedIn", delay)
+    service.indeed_scraper = FakeScraper("Indeed", delay)
+    service.glassdoor_scraper = FakeScraper("Glassdoor", delay)
+    service.relevance_filter.use_openai = False
+    return service
+
+
+def scrape_calls(service):
+    return service.linkedin_scraper.calls + service.indeed_scraper.calls + service.glassdoor_scraper.calls
+
+
+def test_canonical_search_key_normalizes_request():
+    first = JobSearchRequest(position="Full Stack Engineer", experience="2 years",
+                             location="Lahore, Pakistan", skills="React, Node.js")
+    second = JobSearchRequest(position="  full stack   ENGINEER", experience="2 Years",
+                              location="LHR", skills="node.js , react")
+    assert canonical_location("Lahore, Pakistan") == "lahore"
+    assert canonical_search_key(first) == canonical_search_key(second)
+
+
+@pytest.mark.asyncio
+async def test_fresh_results_are_served_from_cache():
+    service = make_service()
+    request = JobSearchRequest(position="Engineer", experience="2 years", location="Lahore", skills="Python")
+
+    first = await service.find_jobs(request)
+    second = await service.find_jobs(request)
+
+    assert first == second
+    assert scrape_calls(service) == 3
+
+
+@pytest.mark.asyncio
+async def test_stale_results_are_served_and_refreshed_in_background():
+    service = make_service(search_cache=SearchCache(fresh_seconds=0, stale_seconds=60))
+    request = JobSearchRequest(position="Engineer", experience="2 years", location="Lahore", skills="Python")
+
+    first = await service.find_jobs(request)
+    stale = await service.find_jobs(request)
+    assert stale == first
+
+    await service.search_cache.wait_for_refreshes()
+    refreshed = await service.find_jobs(request)
+    await service.search_cache.wait_for_refreshes()
+
+    assert refreshed != first
+    assert service.search_cache.stats["stale_hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_searches_share_one_scrape():
+    service = make_service(search_cache=SearchCache(), delay=0.05)
+    service.search_flight = SingleFlight("search")
+    service.source_flight = SingleFlight("source")
+    request = JobSearchRequest(position="Engineer", experience="2 years", location="Lahore", skills="Python")
+
+    coalesced = REGISTRY.get_sample_value(
+        "jobfinder_single_flight_calls_total", {"flight": "search", "result": "coalesced"}
+    ) or 0.0
+
+    results = await asyncio.gather(*[service.find_jobs(request) for _ in range(5)])
+
+    assert all(result == results[0] for result in results)
+    assert scrape_calls(service) == 3
+    assert service.search_flight.stats["coalesced"] == 4
+    assert REGISTRY.get_sample_value(
+        "jobfinder_single_flight_calls_total", {"flight": "search", "result": "coalesced"}
+    ) == coalesced + 4
+
+
+@pytest.mark.asyncio
+async def test_searches_for_same_query_share_source_scrapes():
+    service = make_service(search_cache=SearchCache(), delay=0.05)
+    service.search_flight = SingleFlight("search")
+    service.source_flight = SingleFlight("source")
+    python = JobSearchRequest(position="Engineer", experience="2 years", location="Lahore", skills="Python")
+    react = JobSearchRequest(position="engineer", experience="5 years", location="LHR", skills="React")
+
+    await asyncio.gather(service.find_jobs(python), service.find_jobs(react))
+
+    assert scrape_calls(service) == 3
+    assert service.search_flight.stats["executions"] == 2
+    assert service.source_flight.stats["coalesced"] == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_each_source_as_it_finishes():
+    service = make_service()
+    service.linkedin_scraper.delay = 0.2
+    service.indeed_scraper.delay = 0.1
+    request = JobSearchRequest(position="Engineer", experience="2 years", location="Lahore", skills="Python")
+
+    events = [event async for event in service.stream_jobs(request)]
+
+    assert [event.get("source") for event in events] == ["Glassdoor", "Indeed", "LinkedIn", None]
+    assert events[0]["elapsed_ms"] < 100
+    summary = events[-1]
+    assert summary["event"] == "summary"
+    assert summary["total_jobs"] == 3
+    assert summary["relevant_jobs"] == sum(len(event["jobs"]) for event in events[:-1])
+    assert set(summary["sources"]) == {"LinkedIn", "Indeed", "Glassdoor"}
+
+
+@pytest.mark.asyncio
+async def test_streamed_results_are_cached_for_later_searches():
+    service = make_service()
+    request = JobSearchRequest(position="Engineer", experience="2 years", location="Lahore", skills="Python")
+
+    events = [event async for event in service.stream_jobs(request)]
+    streamed = [job for event in events[:-1] for job in event["jobs"]]
+    relevant_jobs, source_status = await service.search(request)
+
+    assert scrape_calls(service) == 3
+    assert streamed and relevant_jobs == streamed
+    assert set(source_status.values()) == {"cached"}
+
+
+@pytest.mark.asyncio
+async def test_disabled_glassdoor_is_not_searched_and_results_are_cached():
+    service = make_service()
+    service.glassdoor_scraper = GlassdoorScraper()
+    request = JobSearchRequest(position="Engineer", experience="2 years", location="Lahore", skills="Python")
+
+    _, source_status = await service.search(request)
+    _, cached_status = await service.search(request)
+
+    assert source_status == {"LinkedIn": "ok", "Indeed": "ok"}
+    assert cached_status == {"LinkedIn": "cached", "Indeed": "cached"}
+    assert service.linkedin_scraper.calls + service.indeed_scraper.calls == 2
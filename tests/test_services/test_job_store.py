@@ -0,0 +1,89 @@
+import pytest
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.services.job_store import JobStore
+from tests.test_services.test_circuit_breaker import FailingScraper
+from tests.test_services.test_job_service import make_service, scrape_calls
+
+
+def make_job(title, location="Lahore, Pakistan", source="LinkedIn", link=None, **fields):
+    return dict({
+        "job_title": title,
+        "company": "Acme",
+        "experience": "2 years",
+        "jobNature": "Onsite",
+        "location": location,
+        "salary": "Not specified",
+        "apply_link": link or f"https://example.com/{title.lower().replace(' ', '-')}",
+        "source": source,
+    }, **fields)
+
+
+def test_upsert_deduplicates_on_apply_link():
+    store = JobStore(path=":memory:")
+    store.upsert_jobs([make_job("Python Engineer", link="https://example.com/1")])
+    store.upsert_jobs([make_job("Senior Python Engineer", link="https://example.com/1", description="Django")])
+
+    assert store.count() == 1
+    [job] = store.search("python")
+    assert job["job_title"] == "Senior Python Engineer"
+    assert job["description"] == "Django"
+    assert job["date_posted"]
+
+
+def test_search_matches_title_words_location_and_source():
+    store = JobStore(path=":memory:")
+    store.upsert_jobs([
+        make_job("Python Engineer"),
+        make_job("Python Developer", location="Karachi, Pakistan"),
+        make_job("Data Engineer", source="Indeed"),
+        make_job("Accountant"),
+    ])
+
+    assert {job["job_title"] for job in store.search("Python Engineer", "LHR")} == {"Python Engineer", "Data Engineer"}
+    assert [job["job_title"] for job in store.search("python", "Lahore", sources=["LinkedIn"])] == ["Python Engineer"]
+    assert len(store.search("python", "remote")) == 2
+    assert store.search('python" OR "accountant', "Lahore") != []
+    assert store.search("", "Lahore") == []
+
+
+def test_crawl_freshness_is_per_query():
+    store = JobStore(path=":memory:", fresh_seconds=60)
+    store.mark_crawled("LinkedIn", "Python Engineer", "Lahore, Pakistan")
+
+    assert store.is_fresh("LinkedIn", "python  engineer", "LHR")
+    assert not store.is_fresh("Indeed", "python engineer", "Lahore")
+    assert not store.is_fresh("LinkedIn", "data engineer", "Lahore")
+    assert not JobStore(path=":memory:", fresh_seconds=0).is_fresh("LinkedIn", "python engineer", "Lahore")
+
+
+@pytest.mark.asyncio
+async def test_fresh_store_answers_search_without_scraping(monkeypatch):
+    monkeypatch.setattr(settings, "SEARCH_CACHE_ENABLED", False)
+    service = make_service()
+    service.job_store = JobStore(path=":memory:", fresh_seconds=60)
+    request = JobSearchRequest(position="Engineer", experience="2 years", location="Lahore", skills="Python")
+
+    first = await service.find_jobs(request)
+    second = await service.find_jobs(request)
+
+    assert scrape_calls(service) == 3
+    assert service.job_store.count() == 3
+    assert sorted(job["apply_link"] for job in second) == sorted(job["apply_link"] for job in first)
+
+
+@pytest.mark.asyncio
+async def test_failed_scrape_is_not_stored_or_marked_crawled(monkeypatch):
+    monkeypatch.setattr(settings, "SEARCH_CACHE_ENABLED", False)
+    service = make_service()
+    service.indeed_scraper = FailingScraper("Indeed")
+    service.job_store = JobStore(path=":memory:", fresh_seconds=60)
+    request = JobSearchRequest(position="Engineer", experience="2 years", location="Lahore", skills="Python")
+
+    _, source_status = await service.search(request)
+
+    assert source_status["Indeed"] == "error"
+    assert not service.job_store.is_fresh("Indeed", "Engineer", "Lahore")
+    assert service.job_store.search("Engineer", "Lahore", sources=["Indeed"]) == []
+    assert service.job_store.is_fresh("LinkedIn", "Engineer", "Lahore")
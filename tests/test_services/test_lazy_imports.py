@@ -0,0 +1,27 @@
+import json
+import subprocess
+import sys
+
+from app.utils.lazy import LazyModule, lazy_import
+
+PROBE = """
+import json, sys
+import app.main
+print(json.dumps([name for name in ("numpy", "openai", "selenium", "webdriver_manager", "bs4", "requests")
+                  if name in sys.modules]))
+"""
+
+
+def test_app_starts_without_heavy_backends():
+    output = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, check=True).stdout
+
+    assert json.loads(output.strip().splitlines()[-1]) == []
+
+
+def test_lazy_module_imports_on_first_attribute_access():
+    module = LazyModule("colorsys")
+
+    assert "rgb_to_hsv" not in vars(module)
+    assert module.rgb_to_hsv(1, 0, 0) == (0, 1, 1)
+    assert "rgb_to_hsv" in vars(module)
+    assert lazy_import("json") is json
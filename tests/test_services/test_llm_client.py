@@ -0,0 +1,172 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import asyncio
+import pytest
+
+from app.schemas.job import JobSearchRequest
+from app.services.llm_client import AsyncLLMClient, LLMError, TokenBucket
+from app.services.relevance_filter import RelevanceFilter
+
+
+class StandInChatServer(ThreadingHTTPServer):
+    """Local stand-in for the chat completions endpoint"""
+
+    daemon_threads = True
+
+    def __init__(self, failures=0, delay=0.0, failure_status=429):
+        super().__init__(("127.0.0.1", 0), ChatHandler)
+        self.failures = failures
+        self.failure_status = failure_status
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class ChatHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+        with server.lock:
+            server.requests.append(body)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            fail = server.failures > 0
+            if fail:
+                server.failures -= 1
+
+        time.sleep(server.delay)
+
+        with server.lock:
+            server.in_flight -= 1
+
+        if fail:
+            self.send_response(server.failure_status)
+            self.end_headers()
+            return
+
+        prompt = body["messages"][-1]["content"]
+        if "verdicts" in prompt:
+            ids = [int(line.split(".")[0]) for line in prompt.splitlines() if line[:1].isdigit()]
+            content = json.dumps({"verdicts": [{"id": i, "relevant": i != 2} for i in ids]})
+        else:
+            content = "YES"
+
+        payload = json.dumps({
+            "choices": [{"message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 2},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def chat_server():
+    servers = []
+
+    def start(**kwargs):
+        server = StandInChatServer(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_client(server, **kwargs):
+    options = dict(api_key="test", base_url=server.base_url, timeout=5, backoff_base=0.01)
+    options.update(kwargs)
+    return AsyncLLMClient(**options)
+
+
+@pytest.mark.asyncio
+async def test_chat_retries_on_rate_limit(chat_server):
+    server = chat_server(failures=2, failure_status=429)
+    client = make_client(server, max_retries=3)
+
+    assert await client.chat("Is this relevant?", max_tokens=5) == "YES"
+    assert client.stats["retries"] == 2
+    assert client.stats["prompt_tokens"] == 10
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_chat_gives_up_after_max_retries(chat_server):
+    server = chat_server(failures=5, failure_status=503)
+    client = make_client(server, max_retries=1)
+
+    with pytest.raises(LLMError):
+        await client.chat("Is this relevant?", max_tokens=5)
+    assert len(server.requests) == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_chat_concurrency_is_bounded(chat_server):
+    server = chat_server(delay=0.05)
+    client = make_client(server, max_concurrency=2)
+
+    await asyncio.gather(*[client.chat(f"prompt {i}", max_tokens=5) for i in range(6)])
+
+    assert server.max_in_flight == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_chat_times_out(chat_server):
+    server = chat_server(delay=0.5)
+    client = make_client(server, timeout=0.1, max_retries=0)
+
+    with pytest.raises(LLMError):
+        await client.chat("slow", max_tokens=5)
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_delays_when_empty():
+    bucket = TokenBucket(per_minute=600)
+    bucket.tokens = 0
+
+    started = time.perf_counter()
+    await bucket.acquire(2)
+
+    assert time.perf_counter() - started >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_filter_jobs_async_uses_llm_client(chat_server):
+    server = chat_server()
+    client = make_client(server)
+    relevance_filter = RelevanceFilter(llm_client=client)
+    relevance_filter.use_openai = True
+    jobs = [
+        {"job_title": f"Engineer {i}", "company": "Acme", "experience": "2 years", "jobNature": "Onsite",
+         "location": "Lahore", "salary": "Not specified", "apply_link": f"https://example.com/{i}",
+         "source": "LinkedIn"}
+        for i in range(3)
+    ]
+    request = JobSearchRequest(position="Engineer", experience="2 years", skills="Python")
+
+    relevant = await relevance_filter.filter_jobs_async(jobs, request)
+
+    assert [job["job_title"] for job in relevant] == ["Engineer 0", "Engineer 2"]
+    assert len(server.requests) == 1
+    await client.aclose()
@@ -0,0 +1,59 @@
+import pytest
+
+from app.services.scrapers.indeed_scraper import IndeedScraper
+from app.services.scrapers.linkedin_scraper import LinkedInScraper
+from app.services.scrapers.parsing import ParsePool, has_class, parse_cards
+from tests.benchmarks.bench_parsing import legacy_indeed_parse, legacy_linkedin_parse, load_fixture
+
+
+def test_has_class_matches_whole_class_names_only():
+    html = '<div class="card job-search-card">a</div><div class="job-search-card-ad">b</div>'
+    cards = parse_cards(html, f"//div[{has_class('job-search-card')}]", {"text": "."})
+    assert cards == [{"text": "a"}]
+
+
+@pytest.mark.parametrize("scraper,legacy,fixture", [
+    (LinkedInScraper(), legacy_linkedin_parse, "linkedin_search.html"),
+    (IndeedScraper(), legacy_indeed_parse, "indeed_search.html"),
+])
+def test_lxml_parser_matches_legacy_beautifulsoup_output(scraper, legacy, fixture):
+    html = load_fixture(fixture)
+
+    jobs = scraper.parse_jobs(html)
+    expected = legacy(html)
+
+    assert len(jobs) == len(expected) > 10
+    for job, old in zip(jobs, expected):
+        for field, value in old.items():
+            assert job[field] == " ".join(value.split())
+
+
+def test_indeed_missing_salary_defaults_to_not_specified():
+    jobs = IndeedScraper().parse_jobs(load_fixture("indeed_search.html"))
+    assert jobs[0]["salary"] == "Not specified"
+    assert jobs[1]["salary"].startswith("Rs ")
+
+
+@pytest.mark.asyncio
+async def test_large_pages_are_parsed_in_worker_processes():
+    scraper = LinkedInScraper()
+    html = load_fixture("linkedin_search.html")
+    pool = ParsePool(max_workers=1, min_bytes=len(html))
+    try:
+        cards = await pool.parse_async(html, scraper.card_xpath, scraper.field_xpaths)
+        small = await pool.parse_async("<p>no cards</p>", scraper.card_xpath, scraper.field_xpaths)
+    finally:
+        pool.shutdown()
+
+    assert len(cards) == 25
+    assert small == []
+    assert pool.stats == {"inline": 1, "offloaded": 1}
+
+
+def test_worker_processes_are_not_forked():
+    pool = ParsePool(max_workers=1)
+    try:
+        assert pool.warm_up([LinkedInScraper.card_xpath]) == 1
+        assert pool._executor._mp_context.get_start_method() in ("forkserver", "spawn")
+    finally:
+        pool.shutdown()
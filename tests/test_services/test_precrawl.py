@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.schemas.job import JobSearchRequest
+from app.services.job_store import JobStore
+from app.services.precrawl import PrecrawlScheduler, QueryPopularity
+from tests.test_services.test_job_service import make_service, scrape_calls
+
+
+def search(position, location="Lahore"):
+    return JobSearchRequest(position=position, experience="2 years", location=location, skills="Python")
+
+
+def test_popularity_ranks_canonical_queries_and_decays():
+    popularity = QueryPopularity(max_tracked=10)
+    for _ in range(3):
+        popularity.record("Python Engineer", "Lahore, Pakistan")
+    popularity.record("python engineer", "LHR")
+    popularity.record("Data Analyst", "Karachi")
+
+    assert popularity.top(1) == [("python engineer", "LHR")]
+    assert len(popularity) == 2
+
+    popularity.decay(0.005)
+    assert popularity.top(5) == [("python engineer", "LHR")]
+
+
+@pytest.mark.asyncio
+async def test_run_once_crawls_top_queries_into_store_and_skips_fresh():
+    service = make_service()
+    service.job_store = JobStore(path=":memory:", fresh_seconds=60)
+    scheduler = PrecrawlScheduler(job_service=service, top_n=1, politeness=0)
+    scheduler.record(search("Engineer"))
+    scheduler.record(search("Engineer"))
+    scheduler.record(search("Accountant"))
+
+    assert await scheduler.run_once() == 3
+    assert scrape_calls(service) == 3
+    assert service.job_store.is_fresh("LinkedIn", "Engineer", "Lahore")
+    assert not service.job_store.is_fresh("LinkedIn", "Accountant", "Lahore")
+
+    await service.find_jobs(search("Engineer"))
+    assert scrape_calls(service) == 3
+
+    scheduler.record(search("Engineer"))
+    assert await scheduler.run_once() == 0
+    assert scheduler.stats["skipped_fresh"] == 3
+
+
+@pytest.mark.asyncio
+async def test_freshness_is_checked_off_the_event_loop(monkeypatch):
+    service = make_service()
+    service.job_store = JobStore(path=":memory:", fresh_seconds=60)
+    scheduler = PrecrawlScheduler(job_service=service, top_n=1, politeness=0)
+    scheduler.record(search("Engineer"))
+
+    threads = []
+    is_fresh = service.job_store.is_fresh
+    monkeypatch.setattr(
+        service.job_store, "is_fresh", lambda *args: threads.append(threading.get_ident()) or is_fresh(*args)
+    )
+    await scheduler.run_once()
+
+    assert len(threads) == 3
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_crawls_are_spaced_per_source_and_wait_for_foreground():
+    service = make_service()
+    service.job_store = JobStore(path=":memory:", fresh_seconds=60)
+    scheduler = PrecrawlScheduler(job_service=service, top_n=2, politeness=0.05)
+    scheduler.record(search("Engineer"))
+    scheduler.record(search("Designer"))
+
+    with scheduler.foreground():
+        crawl = asyncio.create_task(scheduler.run_once())
+        await asyncio.sleep(0.05)
+        assert scrape_calls(service) == 0
+
+    started = time.monotonic()
+    assert await crawl == 6
+    assert time.monotonic() - started >= 0.05
@@ -0,0 +1,66 @@
+import pytest
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.services.cascade import LocalScorer
+from app.services.ranges import (
+    ExperienceRange, SalaryRange, experience_overlap, normalize_job, parse_experience, parse_salary, salary_overlap
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("80,000 - 110,000 PKR", SalaryRange(80000, 110000, "PKR", None)),
+    ("100,000 PKR", SalaryRange(100000, 100000, "PKR", None)),
+    ("$90k-$120k", SalaryRange(90000, 120000, "USD", None)),
+    ("$45/hr", SalaryRange(45, 45, "USD", "hour")),
+    ("Rs. 1.5 lakh per month", SalaryRange(150000, 150000, "PKR", "month")),
+    ("80,000+", SalaryRange(80000, None, None, None)),
+    ("Not specified", None),
+])
+def test_parse_salary(text, expected):
+    assert parse_salary(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2-3 years", ExperienceRange(2, 3)),
+    ("2+ years", ExperienceRange(2, None)),
+    ("6 months", ExperienceRange(0.5, 0.5)),
+    ("Entry level", ExperienceRange(0, 1)),
+    ("Not specified", None),
+])
+def test_parse_experience(text, expected):
+    assert parse_experience(text) == expected
+
+
+def test_normalize_job_adds_numeric_fields():
+    job = normalize_job({"salary": "80,000 - 110,000 PKR", "experience": "Not specified"})
+
+    assert (job["salary_min"], job["salary_max"], job["salary_currency"]) == (80000, 110000, "PKR")
+    assert job["experience_min"] is None and job["experience_max"] is None
+
+
+def test_overlap_is_vectorized_across_periods_and_currencies():
+    jobs = [
+        normalize_job({"salary": salary, "experience": experience})
+        for salary, experience in [
+            ("80,000 - 110,000 PKR", "2-3 years"),
+            ("200,000 PKR", "5+ years"),
+            ("$45/hr", "1 year"),
+            ("Not specified", "Not specified"),
+        ]
+    ]
+
+    assert salary_overlap(jobs, parse_salary("70,000 to 120,000 PKR")).tolist() == [True, False, True, True]
+    assert salary_overlap(jobs, parse_salary("$80k per year")).tolist() == [True, True, False, True]
+    assert experience_overlap(jobs, parse_experience("2 years")).tolist() == [True, False, True, True]
+
+
+def test_local_scorer_penalizes_experience_mismatch():
+    request = JobSearchRequest(position="Python Engineer", experience="2 years", skills="Django")
+    junior = {"job_title": "Python Engineer", "experience": "1-3 years", "salary": "Not specified"}
+    senior = dict(junior, experience="8+ years")
+
+    scores = LocalScorer().score([junior, senior], request)
+
+    assert scores[1] == pytest.approx(scores[0] * settings.CASCADE_MISMATCH_PENALTY)
+    assert "experience_min" not in junior
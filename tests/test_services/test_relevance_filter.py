@@ -0,0 +1,174 @@
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.services.relevance_filter import RelevanceFilter
+from app.services.ranking import BM25Ranker
+
+
+def make_job(i):
+    return {
+        "job_title": f"Engineer {i}",
+        "company": f"Company {i}",
+        "experience": "2 years",
+        "jobNature": "Onsite",
+        "location": "Lahore, Pakistan",
+        "salary": "Not specified",
+        "apply_link": f"https://example.com/{i}",
+        "source": "LinkedIn",
+    }
+
+
+@pytest.fixture
+def request_criteria():
+    return JobSearchRequest(position="Engineer", experience="2 years", skills="Python", location="Lahore")
+
+
+@pytest.fixture
+def relevance_filter(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_BATCH_TOKEN_BUDGET", 1500)
+    monkeypatch.setattr(settings, "LLM_BATCH_MAX_JOBS", 4)
+    relevance_filter = RelevanceFilter()
+    relevance_filter.use_openai = True
+    return relevance_filter
+
+
+def test_batched_filter_sends_one_call_per_chunk(monkeypatch, relevance_filter, request_criteria):
+    prompts = []
+
+    def fake_chat(prompt, max_tokens):
+        prompts.append(prompt)
+        ids = [int(line.split(".")[0]) for line in prompt.splitlines() if line[:1].isdigit()]
+        return json.dumps({"verdicts": [{"id": i, "relevant": i % 2 == 1} for i in ids]})
+
+    monkeypatch.setattr(relevance_filter, "_chat_completion", fake_chat)
+    jobs = [make_job(i) for i in range(10)]
+
+    relevant = relevance_filter.filter_jobs(jobs, request_criteria)
+
+    assert len(prompts) == 3
+    assert all(prompt.count("Required Skills") == 1 for prompt in prompts)
+    assert [job["job_title"] for job in relevant] == [
+        "Engineer 0", "Engineer 2", "Engineer 4", "Engineer 6", "Engineer 8"
+    ]
+
+
+def test_unparseable_chunk_falls_back_to_per_job_calls(monkeypatch, relevance_filter, request_criteria):
+    calls = {"batch": 0, "single": 0}
+
+    def fake_chat(prompt, max_tokens):
+        if "verdicts" in prompt:
+            calls["batch"] += 1
+            if calls["batch"] == 1:
+                return "Sorry, I cannot help with that."
+            return json.dumps({"verdicts": [{"id": i, "relevant": True} for i in range(1, 3)]})
+        calls["single"] += 1
+        return "NO"
+
+    monkeypatch.setattr(relevance_filter, "_chat_completion", fake_chat)
+    jobs = [make_job(i) for i in range(6)]
+
+    relevant = relevance_filter.filter_jobs(jobs, request_criteria)
+
+    assert calls == {"batch": 2, "single": 4}
+    assert [job["job_title"] for job in relevant] == ["Engineer 4", "Engineer 5"]
+
+
+def test_chunks_respect_token_budget(monkeypatch, relevance_filter):
+    monkeypatch.setattr(settings, "LLM_BATCH_TOKEN_BUDGET", 40)
+    monkeypatch.setattr(settings, "LLM_BATCH_MAX_JOBS", 100)
+
+    chunks = relevance_filter._chunk_jobs([make_job(i) for i in range(5)])
+
+    assert sum(len(chunk) for chunk in chunks) == 5
+    assert all(len(chunk) == 1 for chunk in chunks)
+
+
+def titled(*titles):
+    return [dict(make_job(i), job_title=title) for i, title in enumerate(titles)]
+
+
+def test_basic_filtering_ranks_by_bm25_score():
+    relevance_filter = RelevanceFilter()
+    relevance_filter.use_openai = False
+    request = JobSearchRequest(position="Full Stack Engineer", experience="2 years", skills="React.js, Node.js")
+    jobs = titled("Sales Executive", "React.js Developer", "Full Stack Engineer (React.js, Node.js)", "Engineers Wanted")
+
+    ranked = relevance_filter.filter_jobs(jobs, request)
+
+    assert [job["job_title"] for job in ranked] == [
+        "Full Stack Engineer (React.js, Node.js)", "Engineers Wanted", "React.js Developer"
+    ]
+
+
+def test_ranker_cutoff_and_batch_scoring():
+    ranker = BM25Ranker()
+    texts = ["Python Developer", "Senior Python Engineer", "Accountant"]
+
+    scores = ranker.score_many(texts, [{"python": 1.0}, {"engineer": 1.0}])
+
+    assert scores.shape == (3, 2)
+    assert scores[0, 0] > 0 and scores[1, 0] > 0 and scores[2, 0] == 0
+    assert scores[1, 1] > 0 and scores[0, 1] == 0
+
+    request = JobSearchRequest(position="Python", experience="", skills="Django")
+    assert ranker.rank(titled(*texts), request, min_score=0.0)[0]["job_title"] == "Python Developer"
+    assert ranker.rank(titled(*texts), request, min_score=10.0) == []
+
+
+def test_term_frequencies_for_repeated_texts_and_large_vocabularies():
+    ranker = BM25Ranker()
+    texts = ["Python Developers.", "Accountant", "Python Developers.", "python python"]
+    expected = [[1, 1], [0, 0], [1, 1], [0, 2]]
+
+    assert ranker.term_frequencies(texts, ["developer", "python"]).tolist() == expected
+
+    # Past 253 terms the ids no longer fit a byte
+    vocabulary = ["developer", "python"] + [f"term{i}" for i in range(300)]
+    assert ranker.term_frequencies(texts, vocabulary)[:, :2].tolist() == expected
+
+
+class RecordingLLM:
+    def __init__(self):
+        self.prompts = []
+
+    async def chat(self, prompt, max_tokens):
+        self.prompts.append(prompt)
+        return "YES"
+
+
+@pytest.mark.asyncio
+async def test_cascade_sends_only_ambiguous_jobs_to_llm(monkeypatch):
+    monkeypatch.setattr(settings, "CASCADE_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_BATCH_ENABLED", False)
+    llm = RecordingLLM()
+    relevance_filter = RelevanceFilter(llm_client=llm)
+    relevance_filter.use_openai = True
+    request = JobSearchRequest(position="Python Engineer", experience="2 years", skills="Django", location="Lahore")
+    jobs = titled("Senior Python Engineer (Django)", "Accountant", "Python Developer")
+
+    kept = await relevance_filter.filter_jobs_async(jobs, request)
+
+    assert [job["job_title"] for job in kept] == ["Senior Python Engineer (Django)", "Python Developer"]
+    assert [job["decided_by"] for job in kept] == ["lexical_accept", "llm"]
+    assert len(llm.prompts) == 1 and "Python Developer" in llm.prompts[0]
+    assert "decided_by" not in jobs[0]
+
+
+def test_local_scorer_penalizes_rule_mismatches():
+    from app.services.cascade import LocalScorer
+
+    request = JobSearchRequest(
+        position="Python Engineer", experience="2 years", skills="Django",
+        location="Lahore", jobNature="Onsite", salary="100,000 - 150,000",
+    )
+    matching = dict(make_job(0), job_title="Python Engineer", salary="120k")
+    elsewhere = dict(matching, location="Karachi, Pakistan")
+    underpaid = dict(matching, salary="40,000 - 60,000 PKR")
+
+    scores = LocalScorer().score([matching, elsewhere, underpaid], request)
+
+    assert scores[0] > scores[1] and scores[0] > scores[2]
+    assert scores[1] == pytest.approx(scores[0] * settings.CASCADE_MISMATCH_PENALTY)
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from app.schemas.job import JobSearchRequest
+from app.services.search_tasks import SearchQueueFull, SearchTask, SearchTaskQueue
+from tests.test_services.test_job_service import make_service
+
+
+def search(position="Engineer"):
+    return JobSearchRequest(position=position, experience="2 years", location="Lahore", skills="Python")
+
+
+@pytest.mark.asyncio
+async def test_queued_search_reports_per_source_progress_and_results():
+    queue = SearchTaskQueue(make_service(), workers=1)
+
+    task = queue.submit(search())
+    assert task.status == SearchTask.QUEUED
+    assert set(task.sources.values()) == {"pending"}
+
+    await queue.join()
+    status = queue.get(task.id).to_dict()
+
+    assert status["status"] == SearchTask.DONE
+    assert status["sources"] == {"LinkedIn": "ok", "Indeed": "ok", "Glassdoor": "ok"}
+    assert len(status["result"]["relevant_jobs"]) == 3
+    await queue.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_new_searches():
+    queue = SearchTaskQueue(make_service(delay=0.2), max_queued=1, workers=1)
+
+    queue.submit(search("First"))
+    await asyncio.sleep(0)  # the worker takes the first search, freeing the slot
+    queue.submit(search("Second"))
+
+    with pytest.raises(SearchQueueFull):
+        queue.submit(search("Third"))
+    assert queue.stats["rejected"] == 1
+    await queue.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_search_is_reported():
+    service = make_service()
+
+    async def broken(request):
+        raise RuntimeError("boom")
+        yield
+
+    service.stream_jobs = broken
+    queue = SearchTaskQueue(service, workers=1)
+
+    task = queue.submit(search())
+    await queue.join()
+
+    assert task.status == SearchTask.FAILED
+    assert task.error == "boom"
+    assert task.to_dict()["result"] is None
+    await queue.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_finished_results_expire_after_ttl():
+    queue = SearchTaskQueue(make_service(), workers=1, ttl=0)
+
+    task = queue.submit(search())
+    await queue.join()
+
+    assert queue.get(task.id) is None
+    assert queue.stats["expired"] == 1
+    await queue.shutdown()
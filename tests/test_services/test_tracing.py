@@ -0,0 +1,71 @@
+import json
+import time
+
+import pytest
+
+from app.services.metrics import time_stage
+from app.services.scrapers.executor import ScrapeExecutor
+from app.services.tracing import TraceFileWriter, current_trace, span, traced
+
+
+def test_spans_nest_and_are_summed_per_name_in_server_timing():
+    with traced("GET /jobs") as trace:
+        with span("fetch"):
+            with span("parse", source="LinkedIn"):
+                time.sleep(0.01)
+            with span("parse", source="Indeed"):
+                pass
+
+    tree = trace.to_dict()
+    [fetch] = tree["children"]
+    assert fetch["name"] == "fetch"
+    assert [child["attrs"]["source"] for child in fetch["children"]] == ["LinkedIn", "Indeed"]
+
+    header = trace.server_timing()
+    assert header.startswith("total;dur=")
+    assert 'parse;dur=' in header and 'desc="2 spans"' in header
+
+
+def test_spans_are_noops_outside_a_trace():
+    with span("orphan") as orphan:
+        assert orphan is None
+    assert current_trace() is None
+
+
+@pytest.mark.asyncio
+async def test_stages_run_on_scrape_threads_join_the_request_trace():
+    executor = ScrapeExecutor(max_workers=1)
+
+    def scrape():
+        with time_stage("page_load", "LinkedIn"):
+            pass
+
+    try:
+        with traced("POST /jobs/search") as trace, span("fetch.LinkedIn") as fetch:
+            await executor.run(scrape)
+    finally:
+        executor.shutdown()
+
+    page_load = trace.spans[-1]
+    assert page_load.name == "page_load.LinkedIn"
+    assert page_load.parent is fetch
+    assert page_load.lane != fetch.lane
+
+
+def test_trace_file_holds_chrome_events_and_rotates(tmp_path):
+    path = tmp_path / "traces.json"
+    writer = TraceFileWriter(str(path), max_bytes=2000, backups=2)
+    with traced("GET /") as trace, span("fetch"):
+        pass
+
+    writer.write(trace)
+    events = json.loads(path.read_text().rstrip(",\n") + "]")
+    assert {event["ph"] for event in events} == {"X", "M"}
+    assert [event["name"] for event in events if event["ph"] == "X"] == ["GET /", "fetch"]
+
+    for _ in range(10):
+        writer.write(trace)
+    assert (tmp_path / "traces.json.1").exists()
+    assert (tmp_path / "traces.json.2").exists()
+    assert not (tmp_path / "traces.json.3").exists()
+    assert path.stat().st_size <= 2000
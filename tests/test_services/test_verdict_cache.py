@@ -0,0 +1,114 @@
+import threading
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.schemas.job import JobSearchRequest
+from app.services.relevance_filter import RelevanceFilter
+from app.services.verdict_cache import VerdictCache, criteria_hash, job_fingerprint
+
+
+def make_job(i):
+    return {
+        "job_title": f"Engineer {i}",
+        "company": "Acme",
+        "experience": "2 years",
+        "jobNature": "Onsite",
+        "location": "Lahore",
+        "salary": "Not specified",
+        "apply_link": f"https://example.com/{i}",
+        "source": "Indeed",
+    }
+
+
+def test_criteria_hash_ignores_case_whitespace_and_skill_order():
+    first = JobSearchRequest(position="Full Stack  Engineer", experience="2 years", skills="React, Node.js")
+    second = JobSearchRequest(position="full stack engineer", experience="2 Years", skills="node.js,react ")
+    assert criteria_hash(first) == criteria_hash(second)
+
+
+def test_job_fingerprint_ignores_apply_link_and_source():
+    job = make_job(1)
+    same_posting = dict(job, apply_link="https://other.example.com/1", source="LinkedIn")
+    assert job_fingerprint(job) == job_fingerprint(same_posting)
+
+
+def test_disk_tier_serves_entries_evicted_from_memory(tmp_path):
+    cache = VerdictCache(path=str(tmp_path / "verdicts.sqlite3"), memory_size=1, ttl=60, max_rows=100)
+    cache.set_many("criteria", {"a": True, "b": False})
+
+    assert cache.get_many("criteria", ["a", "b", "c"]) == {"a": True, "b": False}
+    assert cache.stats["disk_hits"] == 1
+    assert cache.stats["memory_hits"] == 1
+    assert cache.stats["misses"] == 1
+
+    reopened = VerdictCache(path=str(tmp_path / "verdicts.sqlite3"), memory_size=10, ttl=60, max_rows=100)
+    assert reopened.get_many("criteria", ["b"]) == {"b": False}
+
+
+def test_expired_entries_are_misses():
+    cache = VerdictCache(path=":memory:", ttl=0.05)
+    cache.set_many("criteria", {"a": True})
+    time.sleep(0.1)
+    assert cache.get_many("criteria", ["a"]) == {}
+
+
+@pytest.mark.parametrize("eviction,survivor", [("lru", "a"), ("fifo", "c")])
+def test_disk_tier_is_capped_by_eviction_policy(eviction, survivor):
+    cache = VerdictCache(path=":memory:", memory_size=1, ttl=60, max_rows=2, eviction=eviction)
+    cache.set_many("criteria", {"a": True})
+    time.sleep(0.01)
+    cache.set_many("criteria", {"b": True})
+    time.sleep(0.01)
+    cache.get_many("criteria", ["a"])
+    time.sleep(0.01)
+    cache.set_many("criteria", {"c": True})
+
+    remaining = cache._db.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+    assert remaining == 2
+    assert survivor in cache.get_many("criteria", ["a", "b", "c"])
+
+
+class CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def chat(self, prompt, max_tokens):
+        self.calls += 1
+        return "YES"
+
+
+@pytest.mark.asyncio
+async def test_repeat_search_is_served_from_cache(monkeypatch):
+    monkeypatch.setattr(settings, "CASCADE_ENABLED", False)
+    llm = CountingLLM()
+    relevance_filter = RelevanceFilter(llm_client=llm, verdict_cache=VerdictCache(path=":memory:"))
+    relevance_filter.use_openai = True
+    request = JobSearchRequest(position="Engineer", experience="2 years", skills="Python")
+    jobs = [make_job(1)]
+
+    first = await relevance_filter.filter_jobs_async(jobs, request)
+    second = await relevance_filter.filter_jobs_async(jobs, request)
+    assert [job["apply_link"] for job in first] == [job["apply_link"] for job in second] == [jobs[0]["apply_link"]]
+    assert first[0]["decided_by"] == "llm"
+    assert second[0]["decided_by"] == "llm_cache"
+    assert llm.calls == 1
+    assert relevance_filter.verdict_cache.hit_ratio() == 0.5
+
+
+@pytest.mark.asyncio
+async def test_async_lookups_and_writes_run_off_the_event_loop(monkeypatch):
+    cache = VerdictCache(path=":memory:")
+    threads = []
+    for name in ("get_many", "set_many"):
+        method = getattr(cache, name)
+        monkeypatch.setattr(
+            cache, name, lambda *args, _method=method: threads.append(threading.get_ident()) or _method(*args)
+        )
+
+    await cache.set_many_async("criteria", {"job": True})
+    found = await cache.get_many_async("criteria", ["job", "other"])
+
+    assert found == {"job": True}
+    assert len(threads) == 2 and threading.get_ident() not in threads